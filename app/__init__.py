@@ -8,9 +8,14 @@ from flask_bootstrap import Bootstrap
 from flask_wtf.csrf import CSRFProtect
 
 from app.config import config
+from app.jobs import JobQueue
+from app.session_store import SessionStore
+from src.simulation import configure_result_cache
 
 bootstrap = Bootstrap()
 csrf = CSRFProtect()
+job_queue = JobQueue()
+session_store = SessionStore()
 
 def create_app(config_name=None):
     """Create and configure the Flask application."""
@@ -23,12 +28,22 @@ def create_app(config_name=None):
 
     app.config['UPLOAD_FOLDER'] = os.path.join(app.root_path, 'uploads')
     app.config['OUTPUT_FOLDER'] = os.path.join(app.root_path, 'static', 'output')
+    if not app.config['SESSION_STORE_PATH']:
+        app.config['SESSION_STORE_PATH'] = os.path.join(app.root_path, 'sessions.sqlite3')
 
     os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
     os.makedirs(app.config['OUTPUT_FOLDER'], exist_ok=True)
+    
+    configure_result_cache(
+        app.config['RESULT_CACHE_ENTRIES'],
+        app.config['RESULT_CACHE_DIR'] or os.path.join(app.root_path, 'cache'),
+        app.config['RESULT_CACHE_MAX_BYTES']
+    )
 
     bootstrap.init_app(app)
     csrf.init_app(app)
+    job_queue.init_app(app)
+    session_store.init_app(app)
 
     from app.routes import main
     app.register_blueprint(main)
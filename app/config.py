@@ -12,11 +12,22 @@ class Config:
 
     UPLOAD_FOLDER = os.environ.get('UPLOAD_FOLDER', 'app/uploads')
     OUTPUT_FOLDER = os.environ.get('OUTPUT_FOLDER', 'app/static/output')
-    ALLOWED_EXTENSIONS = {'csv', 'json'}
+    ALLOWED_EXTENSIONS = {'csv', 'json', 'jsonl'}
     MAX_CONTENT_LENGTH = 16 * 1024 * 1024  
     
     PERMANENT_SESSION_LIFETIME = timedelta(days=1)
     SESSION_TYPE = 'filesystem'
+    SESSION_STORE_PATH = os.environ.get('SESSION_STORE_PATH')
+    TABLE_ROW_LIMIT = 500
+    
+    RESULT_CACHE_ENTRIES = int(os.environ.get('RESULT_CACHE_ENTRIES', 32))
+    RESULT_CACHE_DIR = os.environ.get('RESULT_CACHE_DIR')
+    RESULT_CACHE_MAX_BYTES = int(os.environ.get('RESULT_CACHE_MAX_BYTES', 256 * 1024 * 1024))
+    
+    JOB_WORKERS = int(os.environ.get('JOB_WORKERS', 2))
+    JOB_QUEUE_DEPTH = int(os.environ.get('JOB_QUEUE_DEPTH', 8))
+    JOB_RESULT_TTL = int(os.environ.get('JOB_RESULT_TTL', 3600))
+    JOB_RESULT_BYTES = int(os.environ.get('JOB_RESULT_BYTES', 512 * 1024 * 1024))
     
     DEFAULT_ALGORITHM = 'all'
     DEFAULT_PROCESS_COUNT = 5
@@ -38,6 +49,7 @@ class TestingConfig(Config):
     DEBUG = False
     TESTING = True
     WTF_CSRF_ENABLED = False
+    JOB_WORKERS = 0
     
 class ProductionConfig(Config):
     """Production configuration."""
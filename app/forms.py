@@ -25,7 +25,7 @@ class SimulationForm(FlaskForm):
 
     process_count = IntegerField(
         'Number of Processes',
-        validators=[NumberRange(min=1, max=50)],
+        validators=[NumberRange(min=1, max=200000)],
         default=5
     )
     
@@ -72,10 +72,10 @@ class SimulationForm(FlaskForm):
     )
 
     process_file = FileField(
-        'Upload Process Data (CSV or JSON)',
+        'Upload Process Data (CSV, JSON or JSONL)',
         validators=[
             Optional(),
-            FileAllowed(['csv', 'json'], 'CSV or JSON files only!')
+            FileAllowed(['csv', 'json', 'jsonl'], 'CSV, JSON or JSONL files only!')
         ]
     )
 
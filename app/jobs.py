@@ -0,0 +1,287 @@
+"""
+Background jobs for the CPU Scheduler Simulation web interface.
+
+Simulations run in a pool of worker processes instead of inside the request, and the
+result pages poll the job status until they are done.
+"""
+
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ProcessPoolExecutor
+
+from src import simulation
+from src.process import ProcessTable
+
+
+# Result cache counters that are summed over the jobs run by the worker processes
+CACHE_COUNTERS = ('hits', 'misses', 'memory_hits', 'disk_hits')
+
+
+class QueueFullError(Exception):
+    """Raised when a job is submitted while the queue is full."""
+
+
+class JobQueue:
+    """
+    A bounded queue of simulation jobs run by a pool of worker processes.
+    
+    At most ``JOB_WORKERS`` jobs run at once and at most ``JOB_QUEUE_DEPTH`` more wait
+    for a worker; further submissions are refused until a job finishes. Finished jobs
+    are kept for ``JOB_RESULT_TTL`` seconds, and the oldest ones are forgotten early
+    once the schedules and process tables of the finished jobs take more than
+    ``JOB_RESULT_BYTES``. With ``JOB_WORKERS`` set to 0, jobs run in the request itself.
+    
+    Each worker process has its own result cache, so the cache counters returned by the
+    jobs (see ``run_simulation_job``) are added up here.
+    """
+    
+    def __init__(self, app=None):
+        """
+        Initialize a new JobQueue.
+        
+        Args:
+            app (Flask, optional): Application to read the settings from.
+        """
+        self.max_workers = 2
+        self.max_pending = 8
+        self.result_ttl = 3600
+        self.max_result_bytes = 512 * 1024 * 1024
+        self._executor = None
+        self._jobs = {}
+        self._lock = threading.Lock()
+        self._cache_counters = dict.fromkeys(CACHE_COUNTERS, 0)
+        
+        if app is not None:
+            self.init_app(app)
+    
+    def init_app(self, app):
+        """
+        Read the queue settings from an application.
+        
+        Args:
+            app (Flask): The application.
+        """
+        self.max_workers = app.config['JOB_WORKERS']
+        self.max_pending = app.config['JOB_QUEUE_DEPTH']
+        self.result_ttl = app.config['JOB_RESULT_TTL']
+        self.max_result_bytes = app.config['JOB_RESULT_BYTES']
+        app.extensions['job_queue'] = self
+    
+    def submit(self, function, *args):
+        """
+        Submit a job.
+        
+        Args:
+            function (callable): Module-level function run by a worker.
+            *args: Picklable arguments of the function.
+        
+        Returns:
+            str: Identifier of the job.
+        
+        Raises:
+            QueueFullError: If too many jobs are running or waiting.
+        """
+        job_id = uuid.uuid4().hex
+        with self._lock:
+            self._expire()
+            active = sum(1 for job in self._jobs.values() if not job['future'].done())
+            if active >= self.max_workers + self.max_pending:
+                raise QueueFullError("Too many simulations are in progress")
+            
+            if self.max_workers > 0:
+                future = self._get_executor().submit(function, *args)
+            else:
+                future = Future()
+                future.set_running_or_notify_cancel()
+            job = {'future': future, 'submitted': time.time(), 'finished': None, 'bytes': 0}
+            self._jobs[job_id] = job
+        
+        future.add_done_callback(lambda _: self._finish(job))
+        if self.max_workers > 0:
+            future.add_done_callback(self._count_cache_lookups)
+        if self.max_workers <= 0:
+            try:
+                future.set_result(function(*args))
+            except Exception as e:
+                future.set_exception(e)
+        return job_id
+    
+    def status(self, job_id):
+        """
+        Get the status of a job.
+        
+        Args:
+            job_id (str): Identifier of the job.
+        
+        Returns:
+            dict or None: The job id, its status (queued, running, done or failed), the
+                seconds since it was submitted and the error of a failed job, or None if
+                the job is unknown or expired.
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is None:
+            return None
+        
+        future = job['future']
+        error = None
+        if future.done():
+            error = future.exception()
+            state = 'failed' if error is not None else 'done'
+        else:
+            state = 'running' if future.running() else 'queued'
+        
+        return {
+            'id': job_id,
+            'status': state,
+            'elapsed': round((job['finished'] or time.time()) - job['submitted'], 3),
+            'error': str(error) if error is not None else None
+        }
+    
+    def result(self, job_id):
+        """
+        Get the result of a finished job.
+        
+        Args:
+            job_id (str): Identifier of the job.
+        
+        Returns:
+            object or None: The value returned by the job function, or None if the job is
+                unknown, unfinished or failed.
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is None or not job['future'].done() or job['future'].exception() is not None:
+            return None
+        return job['future'].result()
+    
+    def cache_stats(self):
+        """
+        Get the result cache counters of the web process and of the worker processes.
+        
+        Returns:
+            dict: The counters of ``ResultCache.stats``, with the lookups made by the
+                workers added to the hits and misses. The memory entries are those of the
+                web process only; the disk tier is shared.
+        """
+        stats = simulation.get_result_cache().stats()
+        with self._lock:
+            for name in CACHE_COUNTERS:
+                stats[name] += self._cache_counters[name]
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = stats['hits'] / lookups if lookups else 0
+        return stats
+    
+    def _count_cache_lookups(self, future):
+        """Add the cache counters returned by a job run in a worker process."""
+        if future.cancelled() or future.exception() is not None:
+            return
+        counters = future.result().get('cache_counters', {})
+        with self._lock:
+            for name in CACHE_COUNTERS:
+                self._cache_counters[name] += counters.get(name, 0)
+    
+    def _get_executor(self):
+        """Create the worker pool on first use."""
+        if self._executor is None:
+            cache = simulation.get_result_cache()
+            self._executor = ProcessPoolExecutor(
+                self.max_workers,
+                initializer=simulation.configure_result_cache,
+                initargs=(cache.max_entries, cache.directory, cache.max_bytes)
+            )
+        return self._executor
+    
+    def _finish(self, job):
+        """Record the end time and result size of a job, then enforce the limits."""
+        future = job['future']
+        if not future.cancelled() and future.exception() is None:
+            job['bytes'] = result_bytes(future.result())
+        job['finished'] = time.time()
+        with self._lock:
+            self._expire()
+    
+    def _expire(self):
+        """
+        Forget the jobs that finished more than ``result_ttl`` seconds ago, then the
+        oldest finished jobs while their results take more than ``max_result_bytes``.
+        The most recently finished job is always kept.
+        """
+        deadline = time.time() - self.result_ttl
+        for job_id in [job_id for job_id, job in self._jobs.items()
+                       if job['finished'] is not None and job['finished'] < deadline]:
+            del self._jobs[job_id]
+        
+        finished = sorted((job['finished'], job_id) for job_id, job in self._jobs.items()
+                          if job['finished'] is not None)
+        total = sum(self._jobs[job_id]['bytes'] for _, job_id in finished)
+        for _, job_id in finished[:-1]:
+            if total <= self.max_result_bytes:
+                break
+            total -= self._jobs.pop(job_id)['bytes']
+
+
+def result_bytes(result):
+    """
+    Estimate the memory held by the result of a simulation job.
+    
+    Args:
+        result (dict): The value returned by ``run_simulation_job``.
+    
+    Returns:
+        int: Size of the schedule and process table arrays, in bytes.
+    """
+    size = sum(trace.nbytes for trace in result.get('schedules', {}).values())
+    for run in result.get('runs', {}).values():
+        if isinstance(run, ProcessTable):
+            size += sum(getattr(run, name).nbytes for name in ProcessTable.COLUMNS)
+    return size
+
+
+def run_simulation_job(processes, algorithm, quantum):
+    """
+    Run a simulation.
+    
+    Charts are not drawn here: the result pages draw them in the browser from the
+    schedules, and PNG files are only rendered when they are exported.
+    
+    Args:
+        processes (list or ProcessTable): The workload.
+        algorithm (str): Algorithm to run, or "all" to compare every algorithm.
+        quantum (int): Time quantum for Round Robin.
+    
+    Returns:
+        dict: The results stored in the session (the result type, the algorithm(s) and
+            their metrics, plus the updated processes of a single run), the "schedules"
+            and "runs" of every algorithm, and the "cache_counters" of the result cache
+            lookups made by the job.
+    """
+    cache = simulation.get_result_cache()
+    before = {name: getattr(cache, name) for name in CACHE_COUNTERS}
+    
+    if algorithm == 'all':
+        results = simulation.run_all_simulations(processes, quantum)
+        
+        job_result = {
+            'type': 'comparison',
+            'algorithms': list(results.keys()),
+            'metrics': {algo: result['metrics'] for algo, result in results.items()},
+            'schedules': {algo: result['schedule'] for algo, result in results.items()},
+            'runs': {algo: result['processes'] for algo, result in results.items()}
+        }
+    else:
+        schedule, metrics, updated_processes = simulation.run_simulation(algorithm, processes, quantum)
+        
+        job_result = {
+            'type': 'single',
+            'algorithm': algorithm,
+            'metrics': metrics,
+            'processes': updated_processes,
+            'schedules': {algorithm: schedule},
+            'runs': {algorithm: updated_processes}
+        }
+    
+    job_result['cache_counters'] = {name: getattr(cache, name) - before[name]
+                                    for name in CACHE_COUNTERS}
+    return job_result
@@ -3,26 +3,33 @@ Routes for the CPU Scheduler Simulation web interface.
 """
 
 import os
+import threading
 import uuid
 import json
 import matplotlib
 matplotlib.use('Agg')
-from flask import Blueprint, render_template, request, redirect, url_for, flash, current_app, session, jsonify, send_from_directory
+from flask import Blueprint, render_template, request, redirect, url_for, flash, current_app, jsonify, send_from_directory, abort
 from werkzeug.utils import secure_filename
 
+from app import job_queue, session_store
 from app.forms import SimulationForm
-from src.process import Process
+from app.jobs import QueueFullError, run_simulation_job
+from src.process import ProcessTable
+from src.simulation import as_workload
 from src.utils.process_generator import generate_random_processes, read_processes_from_file
-from src.utils.metrics import calculate_metrics
-from src.schedulers.fcfs import FCFSScheduler
-from src.schedulers.sjf import SJFScheduler
-from src.schedulers.priority import PriorityScheduler
-from src.schedulers.round_robin import RoundRobinScheduler
-from src.schedulers.priority_rr import PriorityRRScheduler
-from src.visualization.visualizer import visualize_schedule, compare_schedulers
+from src.visualization.visualizer import visualize_schedule, visualize_metric_comparison, visualize_timeline_comparison
 
 main = Blueprint('main', __name__)
 
+# Job result fields that are not stored in the session: the schedule API serves the
+# artifacts and the job queue adds up the cache counters
+JOB_ARTIFACTS = ('processes', 'schedules', 'runs', 'cache_counters')
+RESULT_FIELDS = ('pid', 'arrival_time', 'burst_time', 'priority', 'start_time', 'finish_time',
+                 'waiting_time', 'turnaround_time')
+
+# pyplot keeps global state, so PNG exports are rendered one at a time
+chart_lock = threading.Lock()
+
 def allowed_file(filename):
     """Check if the file extension is allowed."""
     return '.' in filename and \
@@ -37,82 +44,52 @@ def save_upload_file(file):
     return file_path
 
 def get_processes_from_session():
-    """Get processes from session or return None."""
-    if 'processes' in session:
-        processes_data = session['processes']
-        processes = []
-        for p_data in processes_data:
-            process = Process(
-                pid=p_data['pid'],
-                arrival_time=p_data['arrival_time'],
-                burst_time=p_data['burst_time'],
-                priority=p_data['priority']
-            )
-            process.start_time = p_data.get('start_time')
-            process.finish_time = p_data.get('finish_time')
-            process.waiting_time = p_data.get('waiting_time', 0)
-            process.turnaround_time = p_data.get('turnaround_time', 0)
-            process.remaining_time = p_data.get('remaining_time', process.burst_time)
-            processes.append(process)
-        return processes
-    return None
+    """Get processes from the session store as a ProcessTable, or return None."""
+    return session_store.get('processes')
 
 def save_processes_to_session(processes):
-    """Save processes to session."""
-    processes_data = []
-    for process in processes:
-        p_data = {
-            'pid': process.pid,
-            'arrival_time': process.arrival_time,
-            'burst_time': process.burst_time,
-            'priority': process.priority,
-            'start_time': process.start_time,
-            'finish_time': process.finish_time,
-            'waiting_time': process.waiting_time,
-            'turnaround_time': process.turnaround_time,
-            'remaining_time': process.remaining_time
-        }
-        processes_data.append(p_data)
-    session['processes'] = processes_data
+    """Save processes to the session store."""
+    if not isinstance(processes, ProcessTable):
+        processes = ProcessTable.from_processes(processes)
+    session_store.set('processes', processes)
 
-def run_simulation(algorithm, processes, quantum=2):
-    """Run the selected scheduling algorithm."""
-    import copy
+def table_rows(processes):
+    """Return the first rows of a process table to display, as Process objects."""
+    if processes is None:
+        return None
+    return [processes[i] for i in range(min(len(processes), current_app.config['TABLE_ROW_LIMIT']))]
 
-    process_copies = copy.deepcopy(processes)
-    for process in process_copies:
-        process.reset()
-
-    schedulers = {
-        "fcfs": FCFSScheduler(),
-        "sjf": SJFScheduler(),
-        "priority": PriorityScheduler(),
-        "rr": RoundRobinScheduler(quantum),
-        "priority_rr": PriorityRRScheduler(quantum)
-    }
+def collect_job_results():
+    """Move the results of a finished job into the session, or return the page to show instead."""
+    job = session_store.get('job')
+    if job is None:
+        return None
     
-    if algorithm in schedulers:
-        scheduler = schedulers[algorithm]
-        schedule = scheduler.schedule(process_copies)
-        metrics = calculate_metrics(schedule, process_copies)
-        return schedule, metrics, process_copies
-    else:
-        raise ValueError(f"Unknown algorithm: {algorithm}")
-
-def run_all_simulations(processes, quantum=2):
-    """Run all scheduling algorithms and compare their performance."""
-    results = {}
-    algorithms = ["fcfs", "sjf", "priority", "rr", "priority_rr"]
+    status = job_queue.status(job['id'])
+    if status is not None and status['status'] in ('queued', 'running'):
+        return render_template('job_pending.html', job=status)
     
-    for algorithm in algorithms:
-        schedule, metrics, updated_processes = run_simulation(algorithm, processes, quantum)
-        results[algorithm] = {
-            "schedule": schedule,
-            "metrics": metrics,
-            "processes": updated_processes
-        }
+    session_store.delete('job')
+    if status is None:
+        flash('The simulation results have expired. Please run the simulation again.', 'warning')
+        return redirect(url_for('main.index'))
+    if status['status'] == 'failed':
+        flash(f"The simulation failed: {status['error']}", 'danger')
+        return redirect(url_for('main.index'))
     
-    return results
+    results = dict(job_queue.result(job['id']))
+    if 'processes' in results:
+        save_processes_to_session(results['processes'])
+    if results['type'] == 'single':
+        trace = results['schedules'][results['algorithm']]
+        limit = current_app.config['TABLE_ROW_LIMIT']
+        results['schedule'] = list(zip(trace.pids[:limit].tolist(), trace.durations[:limit].tolist()))
+        results['schedule_length'] = len(trace)
+    for field in JOB_ARTIFACTS:
+        results.pop(field, None)
+    results['job_id'] = job['id']
+    session_store.set('results', results)
+    return None
 
 @main.route('/', methods=['GET', 'POST'])
 def index():
@@ -120,9 +97,6 @@ def index():
     form = SimulationForm()
     
     if form.validate_on_submit():
-        session_id = str(uuid.uuid4())
-        session['session_id'] = session_id
-        
         algorithm = form.algorithm.data
         quantum = form.quantum.data
 
@@ -130,10 +104,10 @@ def index():
             file = form.process_file.data
             if allowed_file(file.filename):
                 file_path = save_upload_file(file)
-                processes = read_processes_from_file(file_path)
+                processes = read_processes_from_file(file_path, as_table=True)
                 os.remove(file_path)
             else:
-                flash('Invalid file type. Please upload a CSV or JSON file.', 'danger')
+                flash('Invalid file type. Please upload a CSV, JSON or JSONL file.', 'danger')
                 return redirect(url_for('main.index'))
         else:
             processes = generate_random_processes(
@@ -143,84 +117,70 @@ def index():
                 form.min_arrival.data,
                 form.max_arrival.data,
                 form.min_priority.data,
-                form.max_priority.data
+                form.max_priority.data,
+                as_table=True
             )
 
         save_processes_to_session(processes)
-
-        output_dir = os.path.join(current_app.config['OUTPUT_FOLDER'], session_id)
-        os.makedirs(output_dir, exist_ok=True)
+        
+        try:
+            job_id = job_queue.submit(run_simulation_job, processes, algorithm, quantum)
+        except QueueFullError:
+            flash('The server is busy with other simulations. Please try again in a moment.',
+                  'warning')
+            return redirect(url_for('main.index'))
+        
+        session_store.delete('results')
+        session_store.set('job', {'id': job_id})
         
         if algorithm == 'all':
-            results = run_all_simulations(processes, quantum)
-            compare_schedulers(results, output_dir)
-
-            session['results'] = {
-                'type': 'comparison',
-                'algorithms': list(results.keys()),
-                'metrics': {algo: result['metrics'] for algo, result in results.items()},
-                'session_id': session_id
-            }
-            
             return redirect(url_for('main.comparison_results'))
-        else:
-            schedule, metrics, updated_processes = run_simulation(algorithm, processes, quantum)
-
-            save_processes_to_session(updated_processes)
-
-            output_file = visualize_schedule(schedule, updated_processes, algorithm, output_dir)
-
-            session['results'] = {
-                'type': 'single',
-                'algorithm': algorithm,
-                'metrics': metrics,
-                'schedule': [(int(pid), int(time_slice)) for pid, time_slice in schedule],
-                'session_id': session_id
-            }
-            
-            return redirect(url_for('main.algorithm_results'))
+        return redirect(url_for('main.algorithm_results'))
 
     processes = get_processes_from_session()
     
-    return render_template('index.html', form=form, processes=processes)
+    return render_template('index.html', form=form, processes=table_rows(processes),
+                           process_count=len(processes) if processes is not None else 0)
 
 @main.route('/results/algorithm')
 def algorithm_results():
     """Display results for a single algorithm."""
-    if 'results' not in session or session['results']['type'] != 'single':
+    pending = collect_job_results()
+    if pending is not None:
+        return pending
+    
+    results = session_store.get('results')
+    if results is None or results['type'] != 'single':
         flash('No simulation results to display. Please run a simulation first.', 'warning')
         return redirect(url_for('main.index'))
     
-    results = session['results']
     processes = get_processes_from_session()
 
-    session_id = results['session_id']
     algorithm = results['algorithm']
-    gantt_image = f"output/{session_id}/{algorithm}_gantt.png"
     
     return render_template(
         'algorithm_results.html',
         algorithm=algorithm,
         metrics=results['metrics'],
         schedule=results['schedule'],
-        processes=processes,
-        gantt_image=gantt_image
+        schedule_length=results['schedule_length'],
+        processes=table_rows(processes),
+        process_count=len(processes) if processes is not None else 0,
+        job_id=results['job_id']
     )
 
 @main.route('/results/comparison')
 def comparison_results():
     """Display comparison results for all algorithms."""
-    if 'results' not in session or session['results']['type'] != 'comparison':
+    pending = collect_job_results()
+    if pending is not None:
+        return pending
+    
+    results = session_store.get('results')
+    if results is None or results['type'] != 'comparison':
         flash('No comparison results to display. Please run a comparison first.', 'warning')
         return redirect(url_for('main.index'))
     
-    results = session['results']
-    processes = get_processes_from_session()
-
-    session_id = results['session_id']
-    comparison_image = f"output/{session_id}/scheduler_comparison.png"
-    timeline_image = f"output/{session_id}/timeline_comparison.png"
-
     algorithms = results['algorithms']
     metrics = results['metrics']
     
@@ -239,9 +199,7 @@ def comparison_results():
         'comparison_results.html',
         algorithms=algorithms,
         metrics=metrics,
-        processes=processes,
-        comparison_image=comparison_image,
-        timeline_image=timeline_image,
+        job_id=results['job_id'],
         best_algo_waiting=best_algo_waiting,
         best_algo_utilization=best_algo_utilization
     )
@@ -249,10 +207,7 @@ def comparison_results():
 @main.route('/processes/clear', methods=['POST'])
 def clear_processes():
     """Clear processes from session."""
-    if 'processes' in session:
-        del session['processes']
-    if 'results' in session:
-        del session['results']
+    session_store.delete('processes', 'results', 'job')
     flash('Process data has been cleared.', 'success')
     return redirect(url_for('main.index'))
 
@@ -260,16 +215,88 @@ def clear_processes():
 def get_processes_json():
     """Return processes as JSON for AJAX calls."""
     processes = get_processes_from_session()
-    if not processes:
+    if processes is None:
         return jsonify([])
     
-    return jsonify([{
-        'pid': p.pid,
-        'arrival_time': p.arrival_time,
-        'burst_time': p.burst_time,
-        'priority': p.priority,
-        'waiting_time': p.waiting_time,
-        'turnaround_time': p.turnaround_time,
-        'start_time': p.start_time,
-        'finish_time': p.finish_time
-    } for p in processes])
\ No newline at end of file
+    columns = {name: getattr(processes, name).tolist() for name in RESULT_FIELDS}
+    for name in ('start_time', 'finish_time'):
+        columns[name] = [None if value == ProcessTable.UNSET else value for value in columns[name]]
+    return jsonify([dict(zip(columns, row)) for row in zip(*columns.values())])
+
+@main.route('/jobs/<job_id>')
+def job_status(job_id):
+    """Return the status of a simulation job as JSON."""
+    status = job_queue.status(job_id)
+    if status is None:
+        return jsonify({'error': 'Unknown job'}), 404
+    
+    result = job_queue.result(job_id)
+    if result is not None:
+        status['result'] = {key: value for key, value in result.items()
+                            if key not in JOB_ARTIFACTS}
+    return jsonify(status)
+
+@main.route('/jobs/<job_id>/schedule')
+def job_schedule(job_id):
+    """Return the run-length encoded schedules and per-process results of a job as JSON."""
+    result = job_queue.result(job_id)
+    if result is None:
+        return jsonify({'error': 'Unknown job'}), 404
+    with_processes = request.args.get('processes', '1') != '0'
+    
+    algorithms = {}
+    for algo, trace in result['schedules'].items():
+        metrics = result['metrics'][algo] if result['type'] == 'comparison' else result['metrics']
+        algorithms[algo] = {
+            'schedule': {
+                'pid': trace.pids.tolist(),
+                'duration': trace.durations.tolist()
+            },
+            'total_time': trace.total_time,
+            'metrics': metrics
+        }
+        if with_processes:
+            run = as_workload(result['runs'][algo])
+            algorithms[algo]['processes'] = {field: getattr(run, field).tolist()
+                                             for field in RESULT_FIELDS}
+    
+    return jsonify({'type': result['type'], 'algorithms': algorithms})
+
+@main.route('/jobs/<job_id>/charts/<chart>.png')
+def export_chart(job_id, chart):
+    """Render a chart of a job to PNG and send it as a download."""
+    result = job_queue.result(job_id)
+    if result is None:
+        abort(404)
+    
+    output_dir = os.path.join(current_app.config['OUTPUT_FOLDER'], job_id)
+    filename = f"{chart}.png"
+    if not os.path.exists(os.path.join(output_dir, filename)):
+        schedules, runs = result['schedules'], result['runs']
+        gantt_charts = {f"{algo}_gantt": algo for algo in schedules}
+        
+        with chart_lock:
+            if chart in gantt_charts:
+                algo = gantt_charts[chart]
+                visualize_schedule(schedules[algo], runs[algo], algo, output_dir)
+            elif chart in ('scheduler_comparison', 'timeline_comparison') and \
+                    result['type'] == 'comparison':
+                results = {algo: {
+                    'schedule': schedules[algo],
+                    'metrics': result['metrics'][algo],
+                    'processes': runs[algo]
+                } for algo in result['algorithms']}
+                os.makedirs(output_dir, exist_ok=True)
+                if chart == 'timeline_comparison':
+                    visualize_timeline_comparison(results, output_dir)
+                else:
+                    visualize_metric_comparison(result['metrics'], output_dir)
+            else:
+                abort(404)
+    
+    return send_from_directory(os.path.abspath(output_dir), filename, as_attachment=True)
+
+@main.route('/cache/stats')
+def cache_stats():
+    """Return the result cache counters as JSON."""
+    return jsonify(job_queue.cache_stats())
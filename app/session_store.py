@@ -0,0 +1,184 @@
+"""
+Server-side session store for the CPU Scheduler Simulation web interface.
+
+Workloads and results are kept in an SQLite database under a random session ID, and
+only that ID is kept in Flask's cookie session. Values are pickled and compressed, so a
+workload is stored as its NumPy columns rather than one dict per process, and each
+value is read only by the requests that need it.
+"""
+
+import os
+import pickle
+import secrets
+import sqlite3
+import threading
+import time
+import zlib
+from contextlib import contextmanager
+
+from flask import session
+
+
+class SessionStore:
+    """
+    A key-value store of per-session data backed by SQLite.
+    
+    Every write refreshes the expiry of all the values of its session, which expire
+    ``PERMANENT_SESSION_LIFETIME`` after the last write. Expired values are never
+    returned and are deleted at most once every ``purge_interval`` seconds.
+    """
+    
+    def __init__(self, app=None, purge_interval=60):
+        """
+        Initialize a new SessionStore.
+        
+        Args:
+            app (Flask, optional): Application to read the settings from.
+            purge_interval (int): Minimum number of seconds between two purges of the
+                expired values.
+        """
+        self.path = None
+        self.lifetime = 86400
+        self.purge_interval = purge_interval
+        self._last_purge = 0
+        self._lock = threading.Lock()
+        
+        if app is not None:
+            self.init_app(app)
+    
+    def init_app(self, app):
+        """
+        Read the store settings from an application and create the database.
+        
+        Args:
+            app (Flask): The application.
+        """
+        self.path = app.config['SESSION_STORE_PATH']
+        self.lifetime = app.config['PERMANENT_SESSION_LIFETIME'].total_seconds()
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        
+        with self._connection() as connection:
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS session_data ('
+                'sid TEXT NOT NULL, key TEXT NOT NULL, value BLOB NOT NULL, '
+                'expires REAL NOT NULL, PRIMARY KEY (sid, key))'
+            )
+        app.extensions['session_store'] = self
+    
+    def session_id(self, create=False):
+        """
+        Get the ID of the current session.
+        
+        Args:
+            create (bool): Start a new session if there is none.
+        
+        Returns:
+            str or None: The session ID kept in the cookie.
+        """
+        if 'sid' not in session and create:
+            session['sid'] = secrets.token_urlsafe(32)
+        return session.get('sid')
+    
+    def get(self, key, default=None):
+        """
+        Read a value of the current session.
+        
+        Args:
+            key (str): Name of the value.
+            default (object, optional): Value returned if there is none.
+        
+        Returns:
+            object: The stored value, or ``default`` if it is missing or expired.
+        """
+        sid = self.session_id()
+        if sid is None:
+            return default
+        
+        with self._connection() as connection:
+            row = connection.execute(
+                'SELECT value FROM session_data WHERE sid = ? AND key = ? AND expires > ?',
+                (sid, key, time.time())
+            ).fetchone()
+        return decode(row[0]) if row is not None else default
+    
+    def set(self, key, value):
+        """
+        Store a value in the current session, starting a session if needed.
+        
+        Args:
+            key (str): Name of the value.
+            value (object): The value. It must be picklable.
+        """
+        sid = self.session_id(create=True)
+        expires = time.time() + self.lifetime
+        
+        with self._connection() as connection:
+            connection.execute(
+                'INSERT OR REPLACE INTO session_data (sid, key, value, expires) VALUES (?, ?, ?, ?)',
+                (sid, key, encode(value), expires)
+            )
+            connection.execute('UPDATE session_data SET expires = ? WHERE sid = ?', (expires, sid))
+        self._purge()
+    
+    def delete(self, *keys):
+        """
+        Remove values from the current session.
+        
+        Args:
+            *keys (str): Names of the values.
+        """
+        sid = self.session_id()
+        if sid is None or not keys:
+            return
+        
+        with self._connection() as connection:
+            connection.executemany('DELETE FROM session_data WHERE sid = ? AND key = ?',
+                                   [(sid, key) for key in keys])
+    
+    def _purge(self):
+        """Delete the expired values, at most once every ``purge_interval`` seconds."""
+        now = time.time()
+        with self._lock:
+            if now - self._last_purge < self.purge_interval:
+                return
+            self._last_purge = now
+        
+        with self._connection() as connection:
+            connection.execute('DELETE FROM session_data WHERE expires <= ?', (now,))
+    
+    @contextmanager
+    def _connection(self):
+        """Open a connection that commits on success and is always closed."""
+        connection = sqlite3.connect(self.path, timeout=30)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+
+def encode(value):
+    """
+    Encode a session value.
+    
+    Args:
+        value (object): The value.
+    
+    Returns:
+        bytes: The compressed pickle of the value.
+    """
+    return zlib.compress(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), 1)
+
+
+def decode(data):
+    """
+    Decode a session value.
+    
+    Args:
+        data (bytes): Data returned by ``encode``.
+    
+    Returns:
+        object: The value.
+    """
+    return pickle.loads(zlib.decompress(data))
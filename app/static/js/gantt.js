@@ -0,0 +1,289 @@
+/*
+ * Client-side charts for the CPU Scheduler Simulation results pages.
+ *
+ * Schedules come from the /jobs/<job_id>/schedule API as run-length encoded
+ * (pid, duration) columns and are drawn on canvases, with the same colors
+ * as the PNG charts rendered by the server on export.
+ */
+
+const IDLE_COLOR = '#d3d3d3';
+const BASE_COLORS = [
+    '#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd',
+    '#8c564b', '#e377c2', '#7f7f7f', '#bcbd22', '#17becf',
+    '#aec7e8', '#ffbb78', '#98df8a', '#ff9896', '#c5b0d5'
+];
+
+function loadSchedule(url, callback) {
+    fetch(url)
+        .then(function(response) {
+            if (!response.ok) {
+                throw new Error('The schedule is no longer available. Please run the simulation again.');
+            }
+            return response.json();
+        })
+        .then(callback)
+        .catch(function(error) {
+            document.querySelectorAll('canvas[data-chart]').forEach(function(canvas) {
+                const message = document.createElement('p');
+                message.className = 'text-muted';
+                message.textContent = error.message;
+                canvas.replaceWith(message);
+            });
+        });
+}
+
+function generateColors(count) {
+    // Mirrors generate_colors() in src/visualization/visualizer.py
+    const colors = BASE_COLORS.slice(0, count);
+    const extra = count - BASE_COLORS.length;
+
+    for (let i = 0; i < extra; i++) {
+        const saturation = 0.7 + 0.3 * (i % 3) / 2;
+        const value = 0.7 + 0.3 * (Math.floor(i / 3) % 3) / 2;
+        colors.push(hsvToHex(i / extra, saturation, value));
+    }
+    return colors;
+}
+
+function hsvToHex(hue, saturation, value) {
+    const sector = Math.floor(hue * 6);
+    const f = hue * 6 - sector;
+    const p = value * (1 - saturation);
+    const q = value * (1 - saturation * f);
+    const t = value * (1 - saturation * (1 - f));
+    const rgb = [
+        [value, t, p], [q, value, p], [p, value, t],
+        [p, q, value], [t, p, value], [value, p, q]
+    ][sector % 6];
+
+    return '#' + rgb.map(function(channel) {
+        return Math.floor(channel * 255).toString(16).padStart(2, '0');
+    }).join('');
+}
+
+function setupCanvas(canvas, height) {
+    // Size the canvas to its CSS width, at the device pixel ratio
+    const ratio = window.devicePixelRatio || 1;
+    const width = canvas.clientWidth;
+
+    canvas.width = width * ratio;
+    canvas.height = height * ratio;
+    canvas.style.height = height + 'px';
+
+    const ctx = canvas.getContext('2d');
+    ctx.setTransform(ratio, 0, 0, ratio, 0, 0);
+    ctx.clearRect(0, 0, width, height);
+    ctx.font = '11px sans-serif';
+    return { ctx: ctx, width: width, height: height };
+}
+
+function forEachSlice(schedule, callback) {
+    // Expand the run-length encoded schedule into (pid, start, duration) slices
+    const pids = schedule.pid;
+    const durations = schedule.duration;
+    let start = 0;
+
+    for (let i = 0; i < pids.length; i++) {
+        callback(pids[i], start, durations[i]);
+        start += durations[i];
+    }
+}
+
+function drawTimeAxis(ctx, left, right, top, bottom, totalTime) {
+    const ticks = Math.max(1, Math.min(10, Math.floor((right - left) / 70)));
+    const step = Math.max(1, Math.ceil(totalTime / ticks));
+
+    ctx.strokeStyle = '#e0e0e0';
+    ctx.fillStyle = '#333';
+    ctx.textAlign = 'center';
+    ctx.textBaseline = 'top';
+    ctx.setLineDash([4, 3]);
+
+    for (let time = 0; time <= totalTime; time += step) {
+        const x = left + (right - left) * time / Math.max(1, totalTime);
+        ctx.beginPath();
+        ctx.moveTo(x, top);
+        ctx.lineTo(x, bottom);
+        ctx.stroke();
+        ctx.fillText(String(time), x, bottom + 4);
+    }
+
+    ctx.setLineDash([]);
+    ctx.fillText('Time', (left + right) / 2, bottom + 20);
+}
+
+function drawLane(ctx, slices, left, right, top, height, totalTime) {
+    // Draw the slices of one lane, skipping slices that fall in an already painted pixel
+    const scale = (right - left) / Math.max(1, totalTime);
+    let lastPixel = -1;
+
+    slices.forEach(function(slice) {
+        const x0 = left + slice.start * scale;
+        const x1 = left + (slice.start + slice.duration) * scale;
+        if (Math.floor(x1) <= lastPixel && x1 - x0 < 1) {
+            return;
+        }
+        lastPixel = Math.floor(x1);
+
+        ctx.fillStyle = slice.color;
+        ctx.fillRect(x0, top, Math.max(1, x1 - x0), height);
+
+        if (x1 - x0 > 24) {
+            ctx.fillStyle = '#000';
+            ctx.textAlign = 'center';
+            ctx.textBaseline = 'middle';
+            ctx.fillText(slice.label, (x0 + x1) / 2, top + height / 2);
+        }
+    });
+}
+
+function drawGantt(canvas, data) {
+    // One row per process, with idle time spanning every row
+    const processes = data.processes;
+    const count = processes.pid.length;
+    const rowHeight = Math.min(28, 480 / Math.max(1, count));
+    const top = 30;
+    const chart = setupCanvas(canvas, top + rowHeight * count + 50);
+    const ctx = chart.ctx;
+    const left = 60;
+    const right = chart.width - 10;
+    const bottom = top + rowHeight * count;
+
+    const colors = generateColors(count + 1);
+    const rowOf = new Map();
+    processes.pid.forEach(function(pid, index) { rowOf.set(pid, index); });
+
+    ctx.fillStyle = '#333';
+    ctx.textAlign = 'center';
+    ctx.textBaseline = 'top';
+    ctx.fillText('CPU Schedule - ' + canvas.dataset.algorithm.toUpperCase(), chart.width / 2, 8);
+    drawTimeAxis(ctx, left, right, top, bottom, data.total_time);
+
+    const scale = (right - left) / Math.max(1, data.total_time);
+    const lastPixel = new Int32Array(count + 1).fill(-1);
+    forEachSlice(data.schedule, function(pid, start, duration) {
+        const idle = pid === -1;
+        const row = idle ? count : rowOf.get(pid);
+        if (row === undefined) {
+            return;
+        }
+
+        const x0 = left + start * scale;
+        const x1 = left + (start + duration) * scale;
+        if (Math.floor(x1) <= lastPixel[row] && x1 - x0 < 1) {
+            return;
+        }
+        lastPixel[row] = Math.floor(x1);
+
+        ctx.fillStyle = idle ? IDLE_COLOR : colors[row];
+        if (idle) {
+            ctx.fillRect(x0, top, Math.max(1, x1 - x0), rowHeight * count);
+        } else {
+            ctx.fillRect(x0, top + row * rowHeight, Math.max(1, x1 - x0), rowHeight);
+        }
+    });
+
+    // Label every row when they fit, or every n-th row otherwise (rows can be under a pixel)
+    const every = Math.ceil(12 / rowHeight);
+    ctx.fillStyle = '#333';
+    ctx.textAlign = 'right';
+    ctx.textBaseline = 'middle';
+    for (let row = 0; row < count; row += every) {
+        ctx.fillText('P' + processes.pid[row], left - 6, top + (row + 0.5) * rowHeight);
+    }
+}
+
+function drawTimeline(canvas, algorithms) {
+    // One lane per algorithm, colored by process
+    const names = Object.keys(algorithms);
+    const laneHeight = 36;
+    const gap = 14;
+    const top = 30;
+    const chart = setupCanvas(canvas, top + names.length * (laneHeight + gap) + 40);
+    const ctx = chart.ctx;
+    const left = 100;
+    const right = chart.width - 10;
+    const bottom = top + names.length * (laneHeight + gap) - gap;
+
+    const pids = new Set();
+    let totalTime = 0;
+    names.forEach(function(name) {
+        algorithms[name].schedule.pid.forEach(function(pid) {
+            if (pid !== -1) {
+                pids.add(pid);
+            }
+        });
+        totalTime = Math.max(totalTime, algorithms[name].total_time);
+    });
+    const sortedPids = Array.from(pids).sort(function(a, b) { return a - b; });
+    const colors = generateColors(sortedPids.length + 1);
+    const colorOf = new Map();
+    sortedPids.forEach(function(pid, index) { colorOf.set(pid, colors[index]); });
+    colorOf.set(-1, IDLE_COLOR);
+
+    ctx.fillStyle = '#333';
+    ctx.textAlign = 'center';
+    ctx.textBaseline = 'top';
+    ctx.fillText('CPU Scheduling Algorithms Timeline Comparison', chart.width / 2, 8);
+    drawTimeAxis(ctx, left, right, top, bottom, totalTime);
+
+    names.forEach(function(name, lane) {
+        const laneTop = top + lane * (laneHeight + gap);
+        const slices = [];
+        forEachSlice(algorithms[name].schedule, function(pid, start, duration) {
+            slices.push({
+                start: start,
+                duration: duration,
+                color: colorOf.get(pid) || IDLE_COLOR,
+                label: pid === -1 ? 'Idle' : 'P' + pid
+            });
+        });
+
+        drawLane(ctx, slices, left, right, laneTop, laneHeight, totalTime);
+        ctx.fillStyle = '#333';
+        ctx.textAlign = 'right';
+        ctx.textBaseline = 'middle';
+        ctx.fillText(name.toUpperCase(), left - 8, laneTop + laneHeight / 2);
+    });
+}
+
+function drawMetricBars(canvas, algorithms) {
+    // Average turnaround time, average waiting time and CPU utilization side by side
+    const panels = [
+        { metric: 'avg_turnaround_time', title: 'Average Turnaround Time', color: 'skyblue', suffix: '' },
+        { metric: 'avg_waiting_time', title: 'Average Waiting Time', color: 'lightgreen', suffix: '' },
+        { metric: 'cpu_utilization', title: 'CPU Utilization', color: 'salmon', suffix: '%', max: 100 }
+    ];
+    const names = Object.keys(algorithms);
+    const chart = setupCanvas(canvas, 300);
+    const ctx = chart.ctx;
+    const panelWidth = chart.width / panels.length;
+    const top = 30;
+    const bottom = chart.height - 40;
+
+    panels.forEach(function(panel, index) {
+        const left = index * panelWidth + 20;
+        const width = panelWidth - 40;
+        const values = names.map(function(name) { return algorithms[name].metrics[panel.metric]; });
+        const max = panel.max || Math.max.apply(null, values.concat([1])) * 1.15;
+        const barWidth = width / names.length * 0.7;
+
+        ctx.fillStyle = '#333';
+        ctx.textAlign = 'center';
+        ctx.textBaseline = 'top';
+        ctx.fillText(panel.title, left + width / 2, 8);
+
+        values.forEach(function(value, bar) {
+            const x = left + (bar + 0.15) * width / names.length;
+            const height = (bottom - top) * value / max;
+
+            ctx.fillStyle = panel.color;
+            ctx.fillRect(x, bottom - height, barWidth, height);
+            ctx.fillStyle = '#333';
+            ctx.textBaseline = 'bottom';
+            ctx.fillText(value.toFixed(2) + panel.suffix, x + barWidth / 2, bottom - height - 2);
+            ctx.textBaseline = 'top';
+            ctx.fillText(names[bar], x + barWidth / 2, bottom + 6);
+        });
+    });
+}
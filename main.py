@@ -9,13 +9,10 @@ import argparse
 import os
 from src.process import Process
 from src.utils.process_generator import generate_random_processes, read_processes_from_file
-from src.utils.metrics import calculate_metrics
-from src.schedulers.fcfs import FCFSScheduler
-from src.schedulers.sjf import SJFScheduler
-from src.schedulers.priority import PriorityScheduler
-from src.schedulers.round_robin import RoundRobinScheduler
-from src.schedulers.priority_rr import PriorityRRScheduler
-from src.visualization.visualizer import visualize_schedule, compare_schedulers
+from src.utils.workload_generator import synthesize_workload
+from src.utils.file_handler import write_process_results_jsonl
+from src import simulation
+from src.visualization.visualizer import visualize_schedule, compare_schedulers, visualize_quantum_sweep
 
 
 def parse_arguments():
@@ -43,58 +40,127 @@ def parse_arguments():
                         help="Input file with process data")
     parser.add_argument("--output_dir", "-o", type=str, default="output",
                         help="Directory to save visualizations")
+    parser.add_argument("--schedule_file", "-s", type=str,
+                        help="Stream the schedule of the selected algorithm to a .csv, .jsonl, .npy "
+                             "or .npz file instead of plotting it (.npz is written once the "
+                             "schedule is complete)")
+    parser.add_argument("--results_file", "-r", type=str,
+                        help="Write the per-process results to a JSON Lines file (.jsonl)")
+    parser.add_argument("--sweep_quanta", type=str,
+                        help="Sweep the Round Robin algorithms over time quanta, given as "
+                             "START:STOP[:STEP] or a comma-separated list")
+    parser.add_argument("--sweep_metric", type=str, choices=simulation.SWEEP_METRICS,
+                        default="avg_waiting_time", help="Metric optimized by --sweep_quanta")
+    parser.add_argument("--samples", "-n", type=int,
+                        help="Run a Monte Carlo experiment over this many random workloads")
+    parser.add_argument("--seed", type=int,
+                        help="Root seed of the random workloads")
+    parser.add_argument("--arrival", type=str, choices=["uniform", "poisson", "bursty"],
+                        default="uniform", help="Arrival process of the generated processes")
+    parser.add_argument("--burst_dist", type=str, choices=["exponential", "lognormal", "pareto"],
+                        default="exponential",
+                        help="Burst time distribution for --arrival poisson/bursty")
+    parser.add_argument("--priority_dist", type=str, choices=["uniform", "zipf"],
+                        default="uniform",
+                        help="Priority distribution for --arrival poisson/bursty")
+    parser.add_argument("--workers", "-w", type=int,
+                        help="Number of worker processes for --samples")
+    parser.add_argument("--cache_dir", type=str,
+                        help="Directory in which simulation results are cached between runs")
     
-    return parser.parse_args()
+    args = parser.parse_args()
+    if args.samples and args.input_file:
+        parser.error("--input_file cannot be used with --samples, which generates its workloads")
+    return args
+
+
+def synthetic_options(args):
+    """Return the WorkloadGenerator options of --arrival poisson/bursty, or None."""
+    if args.arrival == "uniform":
+        return None
+    return {
+        "arrival": args.arrival,
+        "arrival_rate": args.processes / max(1, args.max_arrival - args.min_arrival),
+        "burst": args.burst_dist,
+        "mean_burst": (args.min_burst + args.max_burst) / 2,
+        "priority": args.priority_dist,
+        "min_priority": args.min_priority,
+        "max_priority": args.max_priority,
+        "start_time": args.min_arrival
+    }
 
 
 def run_simulation(algorithm, processes, quantum=2):
     """Run the selected scheduling algorithm."""
-    import copy
-
-    process_copies = copy.deepcopy(processes)
-    for process in process_copies:
-        process.reset()
-
-    schedulers = {
-        "fcfs": FCFSScheduler(),
-        "sjf": SJFScheduler(),
-        "priority": PriorityScheduler(),
-        "rr": RoundRobinScheduler(quantum),
-        "priority_rr": PriorityRRScheduler(quantum)
-    }
-    
-    if algorithm in schedulers:
-        scheduler = schedulers[algorithm]
-        schedule = scheduler.schedule(process_copies)
-        metrics = calculate_metrics(schedule, process_copies)
-        return schedule, metrics
-    else:
-        raise ValueError(f"Unknown algorithm: {algorithm}")
+    schedule, metrics, _ = simulation.run_simulation(algorithm, processes, quantum)
+    return schedule, metrics
 
 
 def run_all_simulations(processes, quantum=2):
     """Run all scheduling algorithms and compare their performance."""
-    results = {}
-    algorithms = ["fcfs", "sjf", "priority", "rr", "priority_rr"]
-    
-    for algorithm in algorithms:
-        schedule, metrics = run_simulation(algorithm, processes, quantum)
-        results[algorithm] = {
-            "schedule": schedule,
-            "metrics": metrics
-        }
+    return simulation.run_all_simulations(processes, quantum)
+
+def print_progress(done, total, elapsed):
+    """Print the progress of an experiment on one line."""
+    rate = done / elapsed if elapsed > 0 else 0
+    print(f"\rSample {done}/{total} ({rate:.1f} samples/s)", end="\n" if done == total else "",
+          flush=True)
+
+
+def run_experiment(args):
+    """Run a Monte Carlo experiment and print the metrics with confidence intervals."""
+    algorithms = None if args.algorithm == "all" else [args.algorithm]
+    workload = {
+        "num_processes": args.processes,
+        "min_burst": args.min_burst,
+        "max_burst": args.max_burst,
+        "min_arrival": args.min_arrival,
+        "max_arrival": args.max_arrival,
+        "min_priority": args.min_priority,
+        "max_priority": args.max_priority
+    }
+    experiment = simulation.run_experiment(args.samples, args.seed, workload, args.quantum,
+                                           algorithms, max_workers=args.workers,
+                                           progress=print_progress,
+                                           synthetic=synthetic_options(args))
     
-    return results
+    print(f"\nExperiment: {args.samples} samples, seed {experiment['seed']}, "
+          f"{experiment['elapsed']:.2f}s")
+    print(f"{'Algorithm':<15} {'Avg Turnaround':<20} {'Avg Waiting':<20} {'CPU Utilization':<20}")
+    print("-" * 75)
+    for algorithm, summary in experiment["summary"].items():
+        cells = [f"{summary[name]['mean']:.2f} ± {summary[name]['half_width']:.2f}"
+                 for name in ("avg_turnaround_time", "avg_waiting_time", "cpu_utilization")]
+        print(f"{algorithm:<15} {cells[0]:<20} {cells[1]:<20} {cells[2]:<20}")
+    print("(means with 95% confidence intervals)")
+
 
 def main():
     """Main function to run the CPU scheduler simulation."""
     args = parse_arguments()
     
+    if args.samples:
+        run_experiment(args)
+        return
+    
+    quanta = None
+    if args.sweep_quanta:
+        try:
+            quanta = simulation.parse_quanta(args.sweep_quanta)
+        except ValueError as e:
+            print(f"Error: {str(e)}")
+            return
+    
+    if args.cache_dir:
+        simulation.configure_result_cache(directory=args.cache_dir)
+    
     if not os.path.exists(args.output_dir):
         os.makedirs(args.output_dir)
     
     if args.input_file:
         processes = read_processes_from_file(args.input_file)
+    elif args.arrival != "uniform":
+        processes = synthesize_workload(args.processes, args.seed, **synthetic_options(args))
     else:
         processes = generate_random_processes(
             args.processes,
@@ -111,9 +177,25 @@ def main():
         print(f"Process {process.pid}: Arrival={process.arrival_time}, "
               f"Burst={process.burst_time}, Priority={process.priority}")
     
-    if args.algorithm == "all":
+    if quanta:
+        algorithms = simulation.SWEEP_ALGORITHMS
+        if args.algorithm in algorithms:
+            algorithms = [args.algorithm]
+        sweep = simulation.sweep_quantum(processes, quanta, algorithms, args.sweep_metric)
+        output_file = visualize_quantum_sweep(sweep, args.sweep_metric, args.output_dir)
+        
+        print(f"\nQuantum Sweep ({args.sweep_metric}):")
+        for algorithm, result in sweep.items():
+            print(f"{algorithm:<15} best quantum {result['best_quantum']:<6} "
+                  f"{args.sweep_metric} = {result['best_value']:.2f}")
+        print(f"Curve saved to {output_file}")
+    elif args.algorithm == "all":
         results = run_all_simulations(processes, args.quantum)
         compare_schedulers(results, args.output_dir)
+        if args.results_file:
+            for index, (algorithm, result) in enumerate(results.items()):
+                write_process_results_jsonl(result["processes"], args.results_file, algorithm,
+                                            append=index > 0)
         
         print("\nPerformance Comparison:")
         print(f"{'Algorithm':<15} {'Avg Turnaround':<15} {'Avg Waiting':<15} {'CPU Utilization':<15}")
@@ -124,13 +206,33 @@ def main():
                   f"{metrics['avg_waiting_time']:<15.2f} "
                   f"{metrics['cpu_utilization']:<15.2f}%")
     else:
-        schedule, metrics = run_simulation(args.algorithm, processes, args.quantum)
-        visualize_schedule(schedule, processes, args.algorithm, args.output_dir)
+        if args.schedule_file:
+            streamed = simulation.stream_simulation(args.algorithm, processes, args.schedule_file,
+                                                    args.quantum)
+            if streamed is None:
+                return
+            metrics, run = streamed
+            print(f"\n{args.algorithm.upper()} schedule written to {args.schedule_file}")
+        else:
+            schedule, metrics, run = simulation.run_simulation(args.algorithm, processes,
+                                                               args.quantum)
+            visualize_schedule(schedule, processes, args.algorithm, args.output_dir)
+        if args.results_file:
+            write_process_results_jsonl(run, args.results_file, args.algorithm)
         
         print(f"\n{args.algorithm.upper()} Metrics:")
         print(f"Average Turnaround Time: {metrics['avg_turnaround_time']:.2f}")
         print(f"Average Waiting Time: {metrics['avg_waiting_time']:.2f}")
+        print(f"Average Response Time: {metrics['avg_response_time']:.2f}")
+        print(f"Waiting Time p50/p95/p99/max: {metrics['p50_waiting_time']:.2f} / "
+              f"{metrics['p95_waiting_time']:.2f} / {metrics['p99_waiting_time']:.2f} / "
+              f"{metrics['max_waiting_time']}")
+        print(f"Throughput: {metrics['throughput']:.4f} processes per time unit")
         print(f"CPU Utilization: {metrics['cpu_utilization']:.2f}%")
+    
+    if args.cache_dir:
+        stats = simulation.get_result_cache().stats()
+        print(f"\nResult cache: {stats['hits']} hits, {stats['misses']} misses")
 
 
 if __name__ == "__main__":
@@ -1,8 +1,11 @@
 """
 Process Class Module
-This module defines the Process class, which represents a process in the CPU scheduler simulation.
+This module defines the Process class, which represents a process in the CPU scheduler simulation,
+and the ProcessTable class, which stores a whole workload as parallel NumPy columns.
 """
 
+import numpy as np
+
 
 class Process:
     """
@@ -108,4 +111,242 @@ class Process:
     def __repr__(self):
         """Return a formal string representation of the process."""
         return (f"Process(pid={self.pid}, arrival_time={self.arrival_time}, "
-                f"burst_time={self.burst_time}, priority={self.priority})")
\ No newline at end of file
+                f"burst_time={self.burst_time}, priority={self.priority})")
+
+
+class ProcessTable:
+    """
+    A columnar table of processes backed by parallel int64 NumPy arrays.
+    
+    The table holds the same fields as Process, one array per field, which avoids the
+    per-object overhead of large lists of Process objects. Start and finish times that
+    have not been set yet are stored as UNSET. Tables built with ``from_columns`` allocate
+    their result columns on first access, so wrapping memory-mapped workload columns
+    costs nothing until the table is used for a run.
+    
+    Attributes:
+        pid (ndarray): Process IDs.
+        arrival_time (ndarray): Arrival times.
+        burst_time (ndarray): Total CPU time required by each process.
+        priority (ndarray): Priorities (lower number means higher priority).
+        remaining_time (ndarray): Remaining CPU time of each process.
+        start_time (ndarray): Start times, or UNSET.
+        finish_time (ndarray): Finish times, or UNSET.
+        waiting_time (ndarray): Waiting times.
+        turnaround_time (ndarray): Turnaround times.
+    """
+    
+    UNSET = -1
+    PID_MIN = -2 ** 31
+    PID_MAX = 2 ** 31 - 1
+    COLUMNS = ('pid', 'arrival_time', 'burst_time', 'priority', 'remaining_time',
+               'start_time', 'finish_time', 'waiting_time', 'turnaround_time')
+    
+    def __init__(self, pid, arrival_time, burst_time, priority=None):
+        """
+        Initialize a new ProcessTable from workload columns.
+        
+        Args:
+            pid (array-like): Process IDs.
+            arrival_time (array-like): Arrival times.
+            burst_time (array-like): Burst times.
+            priority (array-like, optional): Priorities (default: 1 for every process).
+        
+        Raises:
+            ValueError: If the columns differ in length or a pid does not fit in 32 bits.
+        """
+        self.pid = np.asarray(pid, dtype=np.int64)
+        self.arrival_time = np.asarray(arrival_time, dtype=np.int64)
+        self.burst_time = np.asarray(burst_time, dtype=np.int64)
+        if priority is None:
+            self.priority = np.ones(len(self.pid), dtype=np.int64)
+        else:
+            self.priority = np.asarray(priority, dtype=np.int64)
+        
+        if not len(self.pid) == len(self.arrival_time) == len(self.burst_time) == len(self.priority):
+            raise ValueError("All process columns must have the same length")
+        self.check_pids(self.pid)
+        
+        self.reset()
+    
+    @classmethod
+    def from_columns(cls, pid, arrival_time, burst_time, priority):
+        """
+        Wrap existing int64 workload columns without copying them.
+        
+        The result columns are only allocated when first accessed.
+        
+        Args:
+            pid (ndarray): Process IDs.
+            arrival_time (ndarray): Arrival times.
+            burst_time (ndarray): Burst times.
+            priority (ndarray): Priorities.
+        
+        Returns:
+            ProcessTable: The table.
+        
+        Raises:
+            ValueError: If the columns differ in length or a pid does not fit in 32 bits.
+        """
+        table = cls.__new__(cls)
+        table.pid = pid
+        table.arrival_time = arrival_time
+        table.burst_time = burst_time
+        table.priority = priority
+        if not len(pid) == len(arrival_time) == len(burst_time) == len(priority):
+            raise ValueError("All process columns must have the same length")
+        cls.check_pids(pid)
+        return table
+    
+    @classmethod
+    def check_pids(cls, pids):
+        """
+        Check that process IDs fit in the int32 pid column of schedule traces.
+        
+        Args:
+            pids (array-like): Process IDs.
+        
+        Raises:
+            ValueError: If a pid is outside [PID_MIN, PID_MAX].
+        """
+        pids = np.asarray(pids)
+        if not len(pids):
+            return
+        for value in (pids.min(), pids.max()):
+            if not cls.PID_MIN <= value <= cls.PID_MAX:
+                raise ValueError(f"pid {int(value)} does not fit in a 32-bit process ID "
+                                 f"(range {cls.PID_MIN} to {cls.PID_MAX})")
+    
+    @classmethod
+    def from_processes(cls, processes):
+        """
+        Build a table from a list of Process objects, including their current state.
+        
+        Args:
+            processes (list): List of Process objects.
+        
+        Returns:
+            ProcessTable: The equivalent table.
+        """
+        table = cls(
+            [process.pid for process in processes],
+            [process.arrival_time for process in processes],
+            [process.burst_time for process in processes],
+            [process.priority for process in processes]
+        )
+        table.update_from_processes(processes)
+        return table
+    
+    def to_processes(self):
+        """
+        Convert the table to a list of Process objects.
+        
+        Returns:
+            list: List of Process objects carrying the table's state.
+        """
+        rows = zip(*(getattr(self, name).tolist() for name in self.COLUMNS))
+        return [self._row_to_process(row) for row in rows]
+    
+    def update_from_processes(self, processes):
+        """
+        Copy the run state of Process objects into the table, row by row.
+        
+        Args:
+            processes (list): List of Process objects in the same order as the table.
+        """
+        self.remaining_time[:] = [process.remaining_time for process in processes]
+        self.start_time[:] = [self.UNSET if process.start_time is None else process.start_time
+                              for process in processes]
+        self.finish_time[:] = [self.UNSET if process.finish_time is None else process.finish_time
+                               for process in processes]
+        self.waiting_time[:] = [process.waiting_time for process in processes]
+        self.turnaround_time[:] = [process.turnaround_time for process in processes]
+    
+    def reset(self):
+        """Reset every process to its initial state."""
+        self.remaining_time = self.burst_time.copy()
+        self.start_time = np.full(len(self.pid), self.UNSET, dtype=np.int64)
+        self.finish_time = np.full(len(self.pid), self.UNSET, dtype=np.int64)
+        self.waiting_time = np.zeros(len(self.pid), dtype=np.int64)
+        self.turnaround_time = np.zeros(len(self.pid), dtype=np.int64)
+    
+    def new_run(self):
+        """
+        Start a new simulation run on this workload.
+        
+        The returned table shares the pid, arrival, burst and priority columns of this
+        table as read-only views and has its own, freshly reset result columns.
+        
+        Returns:
+            ProcessTable: The table holding the state of the new run.
+        """
+        run = ProcessTable.__new__(ProcessTable)
+        for name in self.COLUMNS[:4]:
+            column = getattr(self, name).view()
+            column.flags.writeable = False
+            setattr(run, name, column)
+        run.reset()
+        return run
+    
+    def copy(self):
+        """
+        Return an independent copy of the table.
+        
+        Returns:
+            ProcessTable: The copy.
+        """
+        table = ProcessTable(self.pid.copy(), self.arrival_time.copy(),
+                             self.burst_time.copy(), self.priority.copy())
+        for name in self.COLUMNS[4:]:
+            getattr(table, name)[:] = getattr(self, name)
+        return table
+    
+    def sort_by_arrival(self):
+        """Reorder the rows by arrival time (stable)."""
+        order = np.argsort(self.arrival_time, kind='stable')
+        for name in self.COLUMNS:
+            setattr(self, name, getattr(self, name)[order])
+    
+    def completed(self):
+        """
+        Get a mask of the processes that have completed.
+        
+        Returns:
+            ndarray: Boolean mask, True where the process has a finish time.
+        """
+        return self.finish_time != self.UNSET
+    
+    def _row_to_process(self, row):
+        """Build a Process object from one row of column values."""
+        (pid, arrival_time, burst_time, priority, remaining_time,
+         start_time, finish_time, waiting_time, turnaround_time) = row
+        process = Process(pid, arrival_time, burst_time, priority)
+        process.remaining_time = remaining_time
+        process.start_time = None if start_time == self.UNSET else start_time
+        process.finish_time = None if finish_time == self.UNSET else finish_time
+        process.waiting_time = waiting_time
+        process.turnaround_time = turnaround_time
+        return process
+    
+    def __getattr__(self, name):
+        """Allocate the result columns on first access (see ``from_columns``)."""
+        if name in self.COLUMNS[4:] and 'burst_time' in self.__dict__:
+            self.reset()
+            return getattr(self, name)
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+    
+    def __len__(self):
+        """Return the number of processes in the table."""
+        return len(self.pid)
+    
+    def __getitem__(self, index):
+        """Return row ``index`` as a Process object."""
+        return self._row_to_process([getattr(self, name)[index].item() for name in self.COLUMNS])
+    
+    def __iter__(self):
+        """Iterate over the rows as Process objects (changes to them are not written back)."""
+        return iter(self.to_processes())
+    
+    def __repr__(self):
+        """Return a formal string representation of the table."""
+        return f"ProcessTable(n={len(self)})"
\ No newline at end of file
@@ -0,0 +1,247 @@
+"""
+Schedule Trace Module
+This module defines the ScheduleTrace class, a compact array-backed schedule.
+"""
+
+from array import array
+import numpy as np
+
+
+class ScheduleTrace:
+    """
+    A schedule stored in typed arrays instead of a list of (pid, time_slice) tuples.
+    
+    Adjacent slices of the same process (or of idle time, pid -1) are merged into one
+    slice as they are added. The total time and the busy time are kept up to date, so
+    both queries are O(1). Iterating over a trace yields (pid, time_slice) tuples, so a
+    trace can be used wherever a schedule list is expected.
+    
+    Only the pid and duration of each slice are stored; start times are derived from the
+    durations when asked for. The pids and durations are handed out as read-only views
+    of the trace's own arrays. Adding slices after a view was handed out first copies the
+    arrays, so a view always shows the trace as it was when the view was taken.
+    
+    Attributes:
+        pids (ndarray): Process ID of each slice as int32 (-1 for idle time).
+        starts (ndarray): Start time of each slice as int64.
+        durations (ndarray): Duration of each slice as int64.
+    """
+    
+    def __init__(self, slices=None):
+        """
+        Initialize a new ScheduleTrace.
+        
+        Args:
+            slices (iterable, optional): (pid, time_slice) tuples to add.
+        """
+        self._pids = array('i')
+        self._durations = array('q')
+        self._shared = False
+        self._last_pid = None
+        self._total_time = 0
+        self._busy_time = 0
+        
+        if slices is not None:
+            self.extend(slices)
+    
+    @classmethod
+    def from_schedule(cls, schedule):
+        """
+        Get a schedule as a ScheduleTrace.
+        
+        Args:
+            schedule (list or ScheduleTrace): The schedule.
+        
+        Returns:
+            ScheduleTrace: The schedule itself if it already is a trace, or a new trace.
+        """
+        if isinstance(schedule, cls):
+            return schedule
+        return cls(schedule)
+    
+    @classmethod
+    def from_arrays(cls, pids, durations):
+        """
+        Build a trace from slice arrays.
+        
+        Args:
+            pids (array-like): Process ID of each slice (-1 for idle time).
+            durations (array-like): Duration of each slice.
+        
+        Returns:
+            ScheduleTrace: The trace.
+        """
+        trace = cls()
+        trace.extend_arrays(pids, durations)
+        return trace
+    
+    def add(self, pid, time_slice):
+        """
+        Add a slice at the end of the trace, merging it with the last slice if the pid matches.
+        
+        Args:
+            pid (int): Process ID (-1 for idle time).
+            time_slice (int): Duration of the slice.
+        """
+        if self._shared:
+            self._unshare()
+        
+        if pid == self._last_pid:
+            self._durations[-1] += time_slice
+        else:
+            self._pids.append(pid)
+            self._durations.append(time_slice)
+            self._last_pid = pid
+        
+        self._total_time += time_slice
+        if pid != -1:
+            self._busy_time += time_slice
+    
+    def append(self, entry):
+        """
+        Add a (pid, time_slice) tuple, like list.append on a schedule list.
+        
+        Args:
+            entry (tuple): The (pid, time_slice) slice.
+        """
+        self.add(*entry)
+    
+    def extend(self, slices):
+        """
+        Add (pid, time_slice) tuples at the end of the trace.
+        
+        Args:
+            slices (iterable): The slices.
+        """
+        if isinstance(slices, ScheduleTrace):
+            self.extend_arrays(slices.pids, slices.durations)
+            return
+        
+        for pid, time_slice in slices:
+            self.add(pid, time_slice)
+    
+    def extend_arrays(self, pids, durations):
+        """
+        Add slices given as arrays, merging adjacent slices of the same pid.
+        
+        Args:
+            pids (array-like): Process ID of each slice (-1 for idle time).
+            durations (array-like): Duration of each slice.
+        """
+        pids = np.asarray(pids, dtype=np.int32)
+        durations = np.asarray(durations, dtype=np.int64)
+        if not len(pids):
+            return
+        
+        if self._last_pid == pids[0]:
+            run_end = np.flatnonzero(pids != pids[0])
+            head = int(run_end[0]) if len(run_end) else len(pids)
+            self.add(int(pids[0]), int(durations[:head].sum()))
+            pids, durations = pids[head:], durations[head:]
+            if not len(pids):
+                return
+        
+        run_starts = np.flatnonzero(np.concatenate(([True], pids[1:] != pids[:-1])))
+        run_pids = pids[run_starts]
+        run_durations = np.add.reduceat(durations, run_starts)
+        
+        if self._shared:
+            self._unshare()
+        self._pids.frombytes(run_pids.tobytes())
+        self._durations.frombytes(run_durations.astype(np.int64).tobytes())
+        self._last_pid = int(run_pids[-1])
+        self._total_time += int(run_durations.sum())
+        self._busy_time += int(run_durations[run_pids != -1].sum())
+    
+    def extend_repeated(self, slices, times):
+        """
+        Add a sequence of slices repeated a number of times.
+        
+        Args:
+            slices (list): The (pid, time_slice) tuples of one repetition.
+            times (int): Number of repetitions.
+        """
+        if not slices or times <= 0:
+            return
+        
+        if all(pid == slices[0][0] for pid, _ in slices):
+            self.add(slices[0][0], sum(time_slice for _, time_slice in slices) * times)
+            return
+        
+        pids, durations = zip(*slices)
+        self.extend_arrays(np.tile(pids, times), np.tile(durations, times))
+    
+    def _unshare(self):
+        """Copy the slice arrays, leaving the old ones to the views handed out."""
+        self._pids = array('i', self._pids)
+        self._durations = array('q', self._durations)
+        self._shared = False
+    
+    def _view(self, values, dtype):
+        """Get a read-only NumPy view of a slice array."""
+        view = np.frombuffer(values, dtype=dtype)
+        view.flags.writeable = False
+        self._shared = True
+        return view
+    
+    @property
+    def pids(self):
+        """Process ID of each slice (-1 for idle time), as a read-only view."""
+        return self._view(self._pids, np.int32)
+    
+    @property
+    def starts(self):
+        """Start time of each slice, computed from the durations."""
+        durations = np.frombuffer(self._durations, dtype=np.int64)
+        return np.cumsum(durations) - durations
+    
+    @property
+    def durations(self):
+        """Duration of each slice, as a read-only view."""
+        return self._view(self._durations, np.int64)
+    
+    @property
+    def total_time(self):
+        """Total time covered by the trace, idle time included."""
+        return self._total_time
+    
+    @property
+    def busy_time(self):
+        """Time during which a process was running."""
+        return self._busy_time
+    
+    @property
+    def idle_time(self):
+        """Time during which the CPU was idle."""
+        return self._total_time - self._busy_time
+    
+    @property
+    def nbytes(self):
+        """Memory used by the slice arrays, in bytes."""
+        return (self._pids.itemsize * len(self._pids) +
+                self._durations.itemsize * len(self._durations))
+    
+    def to_list(self):
+        """
+        Convert the trace to a list of (pid, time_slice) tuples.
+        
+        Returns:
+            list: The schedule as a list of (pid, time_slice) tuples.
+        """
+        return list(zip(self._pids.tolist(), self._durations.tolist()))
+    
+    def __len__(self):
+        """Return the number of slices in the trace."""
+        return len(self._pids)
+    
+    def __iter__(self):
+        """Iterate over the slices as (pid, time_slice) tuples."""
+        return zip(self._pids, self._durations)
+    
+    def __getitem__(self, index):
+        """Return slice ``index`` as a (pid, time_slice) tuple."""
+        return self._pids[index], self._durations[index]
+    
+    def __repr__(self):
+        """Return a formal string representation of the trace."""
+        return f"ScheduleTrace(slices={len(self)}, total_time={self._total_time})"
@@ -6,6 +6,10 @@ scheduling algorithm implementations.
 
 from abc import ABC, abstractmethod
 import copy
+import heapq
+import numpy as np
+from src.process import ProcessTable
+from src.schedule_trace import ScheduleTrace
 
 
 class BaseScheduler(ABC):
@@ -15,12 +19,28 @@ class BaseScheduler(ABC):
     This class defines the common interface and functionality for all CPU scheduling
     algorithms. Specific algorithms should inherit from this class and implement
     the abstract methods.
+    
+    Run-to-completion policies that only order the ready queue by a process attribute
+    can set ``ready_key`` to that attribute name. ``schedule_processes`` then uses an
+    event-driven core (a pre-sorted arrival cursor plus a heap keyed by ``ready_key``)
+    instead of calling ``get_next_process`` and ``execute_process`` on every dispatch.
+    
+    When ``accumulator`` is set to a MetricsAccumulator, the engines feed it each
+    process as it completes.
+    
+    ``schedule_trace`` runs the same scheduling but has the engines emit a ScheduleTrace
+    instead of a list of tuples, and ``iter_schedule`` streams the slices as they are
+    decided instead of returning them at the end.
     """
     
+    ready_key = None
+    emit_trace = False
+    
     def __init__(self):
         """Initialize the scheduler."""
         self.current_time = 0
         self.schedule_result = []
+        self.accumulator = None
     
     @abstractmethod
     def get_next_process(self, ready_queue):
@@ -40,33 +60,86 @@ class BaseScheduler(ABC):
         Schedule the given processes according to the scheduling algorithm.
         
         Args:
-            processes (list): List of Process objects to schedule.
+            processes (list or ProcessTable): Processes to schedule.
         
         Returns:
             list: The schedule as a list of (pid, time_slice) tuples.
         """
+        for _ in self._run_schedule(processes):
+            pass
+        
+        return self.schedule_result
+    
+    def iter_schedule(self, processes, chunk_size=1024):
+        """
+        Schedule the given processes, yielding slices as they are decided.
+        
+        The engine hands its slices over every ``chunk_size`` slices, so the schedule is
+        never held in memory as a whole and the first slices are available right away.
+        The results are stored in the processes when the engine finishes.
+        
+        Args:
+            processes (list or ProcessTable): Processes to schedule.
+            chunk_size (int): Number of slices buffered between hand-overs (default: 1024).
+        
+        Yields:
+            tuple: (pid, time_slice) slices in schedule order, with pid -1 for idle time.
+        """
+        for chunk in self._run_schedule(processes, max(1, chunk_size)):
+            yield from chunk
+        
+        yield from self.schedule_result
+        self.schedule_result = []
+    
+    def _run_schedule(self, processes, chunk_size=None):
+        """
+        Run the scheduling engine for the given processes.
+        
+        Engines are generators. With a ``chunk_size``, they yield the decided slices
+        (all but the last one, which may still be extended) whenever more than
+        ``chunk_size`` of them are buffered. Without one they never yield, and the whole
+        schedule is left in ``schedule_result``.
+        
+        Args:
+            processes (list or ProcessTable): Processes to schedule.
+            chunk_size (int, optional): Streaming chunk size, or None to keep the schedule.
+        
+        Yields:
+            list: Chunks of (pid, time_slice) tuples.
+        """
+        if isinstance(processes, ProcessTable):
+            yield from self._run_table(processes, chunk_size)
+            return
+        if self.ready_key is not None:
+            yield from self._run_by_key(processes, chunk_size)
+            return
          
-        processes_copy = copy.deepcopy(processes)
+        processes_copy = [copy.copy(process) for process in processes]
         
          
         self.current_time = 0
-        self.schedule_result = []
+        self.schedule_result = self._new_schedule()
         
          
         ready_queue = []
+        in_ready_queue = set()
         
          
         completed_processes = {}
         
          
         while len(completed_processes) < len(processes_copy):
+            if chunk_size and len(self.schedule_result) > chunk_size:
+                yield self.schedule_result[:-1]
+                del self.schedule_result[:-1]
              
             for process in processes_copy:
                 if (process.arrival_time <= self.current_time and
                         process.pid not in completed_processes and
-                        process not in ready_queue and
+                        id(process) not in in_ready_queue and
                         not process.is_completed()):
                     ready_queue.append(process)
+                    in_ready_queue.add(id(process))
             
              
             if not ready_queue:
@@ -100,22 +173,256 @@ class BaseScheduler(ABC):
             if next_process.is_completed():
                 next_process.complete(self.current_time)
                 completed_processes[next_process.pid] = next_process
-                
-                 
-                for original_process in processes:
-                    if original_process.pid == next_process.pid:
-                        original_process.start_time = next_process.start_time
-                        original_process.finish_time = next_process.finish_time
-                        original_process.waiting_time = next_process.waiting_time
-                        original_process.turnaround_time = next_process.turnaround_time
-                        original_process.remaining_time = 0
-                        break
+                if self.accumulator is not None:
+                    self.accumulator.add_process(next_process)
                 
                  
                 if next_process in ready_queue:
                     ready_queue.remove(next_process)
+                    in_ready_queue.discard(id(next_process))
         
-        return self.schedule_result
+        
+        for original_process, process_copy in zip(processes, processes_copy):
+            if completed_processes.get(process_copy.pid) is process_copy:
+                original_process.start_time = process_copy.start_time
+                original_process.finish_time = process_copy.finish_time
+                original_process.waiting_time = process_copy.waiting_time
+                original_process.turnaround_time = process_copy.turnaround_time
+                original_process.remaining_time = 0
+    
+    def schedule_trace(self, processes):
+        """
+        Schedule the given processes and return the schedule as a ScheduleTrace.
+        
+        Args:
+            processes (list or ProcessTable): Processes to schedule.
+        
+        Returns:
+            ScheduleTrace: The schedule, with adjacent slices of the same pid merged.
+        
+        Raises:
+            ValueError: If a pid does not fit in the int32 pid column of the trace.
+        """
+        if not isinstance(processes, ProcessTable):
+            ProcessTable.check_pids([process.pid for process in processes])
+        self.emit_trace = True
+        try:
+            schedule = self.schedule(processes)
+        finally:
+            self.emit_trace = False
+        
+        return ScheduleTrace.from_schedule(schedule)
+    
+    def _new_schedule(self):
+        """
+        Create the empty schedule an engine appends its slices to.
+        
+        Returns:
+            list or ScheduleTrace: A ScheduleTrace while ``schedule_trace`` runs, a list otherwise.
+        """
+        return ScheduleTrace() if self.emit_trace else []
+    
+    def _run_by_key(self, processes, chunk_size=None):
+        """
+        Schedule a run-to-completion policy with the event-driven core.
+        
+        The input processes are only read while scheduling and their results are written
+        back once the schedule is complete, so no copy of the workload is needed.
+        
+        Args:
+            processes (list): List of Process objects to schedule.
+            chunk_size (int, optional): Streaming chunk size, or None to keep the schedule.
+        
+        Yields:
+            list: Chunks of (pid, time_slice) tuples.
+        """
+        pids = [process.pid for process in processes]
+        arrivals = [process.arrival_time for process in processes]
+        remaining = [process.remaining_time for process in processes]
+        keys = [getattr(process, self.ready_key) for process in processes]
+        start_times = [process.start_time for process in processes]
+        
+        finish_times = yield from self._dispatch_by_key(
+            pids, arrivals, remaining, keys, start_times, chunk_size,
+            self._completion_callback(processes, start_times)
+        )
+        self._store_results(processes, start_times, finish_times)
+    
+    def _run_table(self, table, chunk_size=None):
+        """
+        Schedule the processes of a ProcessTable and store the results in its columns.
+        
+        Run-to-completion policies with a ``ready_key`` run directly on the columns.
+        Other schedulers run on Process objects converted from the table.
+        
+        Args:
+            table (ProcessTable): Processes to schedule.
+            chunk_size (int, optional): Streaming chunk size, or None to keep the schedule.
+        
+        Yields:
+            list: Chunks of (pid, time_slice) tuples.
+        """
+        if self.ready_key is None:
+            processes = table.to_processes()
+            yield from self._run_schedule(list(processes), chunk_size)
+            table.update_from_processes(processes)
+            return
+        
+        start_times = [None if start_time == table.UNSET else start_time
+                       for start_time in table.start_time.tolist()]
+        finish_times = yield from self._dispatch_by_key(
+            table.pid.tolist(),
+            table.arrival_time.tolist(),
+            table.remaining_time.tolist(),
+            getattr(table, self.ready_key).tolist(),
+            start_times,
+            chunk_size,
+            self._completion_callback(table, start_times)
+        )
+        
+        self._store_table_results(table, start_times, finish_times)
+    
+    def _completion_callback(self, processes, start_times):
+        """
+        Build the callback an engine calls when a process completes.
+        
+        Args:
+            processes (list or ProcessTable): Processes being scheduled, in engine row order.
+            start_times (list): Start times, updated in place by the engine.
+        
+        Returns:
+            callable or None: ``on_complete(i, finish_time)`` feeding ``accumulator``, or None
+                if no accumulator is set.
+        """
+        accumulator = self.accumulator
+        if accumulator is None:
+            return None
+        
+        if isinstance(processes, ProcessTable):
+            arrivals = processes.arrival_time.tolist()
+            bursts = processes.burst_time.tolist()
+        else:
+            arrivals = [process.arrival_time for process in processes]
+            bursts = [process.burst_time for process in processes]
+        
+        def on_complete(i, finish_time):
+            accumulator.add(arrivals[i], bursts[i], start_times[i], finish_time)
+        
+        return on_complete
+    
+    def _store_results(self, processes, start_times, finish_times):
+        """
+        Write the results of the completed processes back to Process objects.
+        
+        Args:
+            processes (list): List of Process objects that were scheduled.
+            start_times (list): Start time of each process.
+            finish_times (list): Finish time of each process, or None if it never completed.
+        """
+        for i, process in enumerate(processes):
+            if finish_times[i] is not None:
+                process.start_time = start_times[i]
+                process.finish_time = finish_times[i]
+                process.turnaround_time = finish_times[i] - process.arrival_time
+                process.waiting_time = process.turnaround_time - process.burst_time
+                process.remaining_time = 0
+    
+    def _store_table_results(self, table, start_times, finish_times):
+        """
+        Write the results of the completed processes into the columns of a ProcessTable.
+        
+        Args:
+            table (ProcessTable): The table that was scheduled.
+            start_times (list or ndarray): Start time of each process (None or UNSET if unset).
+            finish_times (list or ndarray): Finish time of each process (None or UNSET if
+                it never completed).
+        """
+        if not isinstance(start_times, np.ndarray):
+            start_times = np.array([table.UNSET if start_time is None else start_time
+                                    for start_time in start_times], dtype=np.int64)
+        if not isinstance(finish_times, np.ndarray):
+            finish_times = np.array([table.UNSET if finish_time is None else finish_time
+                                     for finish_time in finish_times], dtype=np.int64)
+        completed = finish_times != table.UNSET
+        
+        table.start_time[completed] = start_times[completed]
+        table.finish_time[completed] = finish_times[completed]
+        table.turnaround_time[completed] = finish_times[completed] - table.arrival_time[completed]
+        table.waiting_time[completed] = (table.turnaround_time[completed] -
+                                         table.burst_time[completed])
+        table.remaining_time[completed] = 0
+    
+    def _dispatch_by_key(self, pids, arrivals, remaining, keys, start_times, chunk_size=None,
+                         on_complete=None):
+        """
+        Run the event-driven core over per-process columns.
+        
+        Processes are admitted from an arrival cursor (sorted once by arrival time) into a
+        heap keyed by (key, admission round, input index). That tie-break reproduces the
+        stable re-sorting of the ready list done by ``get_next_process``, so the schedule
+        is identical to the generic loop while each dispatch costs O(log n).
+        
+        Args:
+            pids (list): Process IDs.
+            arrivals (list): Arrival times.
+            remaining (list): Remaining burst times. Processes with nothing left to run
+                are never admitted.
+            keys (list): Ready-queue ordering key of each process.
+            start_times (list): Start times (None if not started), updated in place.
+            chunk_size (int, optional): Streaming chunk size, or None to keep the schedule.
+            on_complete (callable, optional): Called as ``on_complete(i, finish_time)`` when
+                process i completes.
+        
+        Yields:
+            list: Chunks of (pid, time_slice) tuples (streaming only).
+        
+        Returns:
+            list: Finish time of each process, or None if it was never completed.
+        """
+        n = len(arrivals)
+        order = sorted(range(n), key=arrivals.__getitem__)
+        finish_times = [None] * n
+        schedule = self._new_schedule()
+        ready_heap = []
+        cursor = 0
+        admission_round = 0
+        current_time = 0
+        
+        while True:
+            if chunk_size and len(schedule) > chunk_size:
+                yield schedule[:-1]
+                del schedule[:-1]
+            
+            while cursor < n and arrivals[order[cursor]] <= current_time:
+                i = order[cursor]
+                cursor += 1
+                if remaining[i] > 0:
+                    heapq.heappush(ready_heap, (keys[i], admission_round, i))
+            admission_round += 1
+            
+            if not ready_heap:
+                if cursor == n:
+                    break
+                
+                next_arrival = arrivals[order[cursor]]
+                schedule.append((-1, next_arrival - current_time))
+                current_time = next_arrival
+                continue
+            
+            _, _, i = heapq.heappop(ready_heap)
+            if start_times[i] is None:
+                start_times[i] = current_time
+            
+            time_slice = remaining[i]
+            schedule.append((pids[i], time_slice))
+            current_time += time_slice
+            finish_times[i] = current_time
+            if on_complete is not None:
+                on_complete(i, current_time)
+        
+        self.current_time = current_time
+        self.schedule_result = schedule
+        return finish_times
     
     @abstractmethod
     def execute_process(self, process, ready_queue):
@@ -3,7 +3,81 @@ First-Come, First-Served (FCFS) Scheduler Module
 This module implements the FCFS CPU scheduling algorithm.
 """
 
+import numpy as np
 from src.schedulers.base_scheduler import BaseScheduler
+from src.process import ProcessTable
+from src.schedule_trace import ScheduleTrace
+
+
+def fcfs_closed_form(pid, arrival_time, burst_time):
+    """
+    Compute a complete FCFS schedule with vectorized NumPy operations.
+    
+    Processes run in order of arrival (ties keep their input order), so with
+    C the running sum of burst times, each finish time is
+    finish_i = C_i + max(0, max_{j<=i}(arrival_j - C_{j-1})), which is the
+    recurrence start_i = max(arrival_i, finish_{i-1}) in closed form. Processes
+    with no burst time are never dispatched but, like in the event-driven core,
+    the CPU still idles up to their arrival.
+    
+    Args:
+        pid (ndarray): Process IDs.
+        arrival_time (ndarray): Arrival times.
+        burst_time (ndarray): Burst (or remaining) times.
+    
+    Returns:
+        tuple: (slice_pids, slice_times, start_time, finish_time). The first two arrays
+            hold the schedule with -1 for idle slices; the last two are in input order,
+            with ProcessTable.UNSET for processes that were never dispatched.
+    """
+    pid = np.asarray(pid, dtype=np.int64)
+    arrival_time = np.asarray(arrival_time, dtype=np.int64)
+    burst_time = np.maximum(np.asarray(burst_time, dtype=np.int64), 0)
+    n = len(arrival_time)
+    
+    presorted = bool(np.all(arrival_time[1:] >= arrival_time[:-1]))
+    if presorted:
+        arrivals, bursts, pids = arrival_time, burst_time, pid
+    else:
+        order = np.argsort(arrival_time, kind='stable')
+        arrivals, bursts, pids = arrival_time[order], burst_time[order], pid[order]
+    
+    finish_sorted = np.cumsum(bursts)
+    lateness = arrivals - finish_sorted
+    lateness += bursts
+    np.maximum.accumulate(lateness, out=lateness)
+    np.maximum(lateness, 0, out=lateness)
+    finish_sorted += lateness
+    start_sorted = finish_sorted - bursts
+    
+    idle_gaps = np.empty(n, dtype=np.int64)
+    idle_gaps[0:1] = start_sorted[:1]
+    np.subtract(start_sorted[1:], finish_sorted[:-1], out=idle_gaps[1:])
+    dispatched = bursts > 0
+    
+    if not idle_gaps.any() and dispatched.all():
+        slice_pids, slice_times = pids.copy(), bursts.copy()
+    else:
+        slice_pids = np.empty(2 * n, dtype=np.int64)
+        slice_times = np.empty(2 * n, dtype=np.int64)
+        slice_pids[0::2] = -1
+        slice_pids[1::2] = pids
+        slice_times[0::2] = idle_gaps
+        slice_times[1::2] = bursts
+        keep = slice_times > 0
+        slice_pids, slice_times = slice_pids[keep], slice_times[keep]
+    
+    start_sorted[~dispatched] = ProcessTable.UNSET
+    finish_sorted[~dispatched] = ProcessTable.UNSET
+    if presorted:
+        start_time, finish_time = start_sorted, finish_sorted
+    else:
+        start_time = np.empty(n, dtype=np.int64)
+        finish_time = np.empty(n, dtype=np.int64)
+        start_time[order] = start_sorted
+        finish_time[order] = finish_sorted
+    
+    return slice_pids, slice_times, start_time, finish_time
 
 
 class FCFSScheduler(BaseScheduler):
@@ -14,6 +88,8 @@ class FCFSScheduler(BaseScheduler):
     scheduler, meaning once a process starts executing, it runs until completion.
     """
     
+    ready_key = 'arrival_time'
+    
     def get_next_process(self, ready_queue):
         """
         Get the next process to execute according to FCFS.
@@ -62,9 +138,62 @@ class FCFSScheduler(BaseScheduler):
         Schedule the given processes according to FCFS.
         
         Args:
-            processes (list): List of Process objects to schedule.
+            processes (list or ProcessTable): Processes to schedule.
         
         Returns:
             list: The schedule as a list of (pid, time_slice) tuples.
         """
-        return self.schedule_processes(processes)
\ No newline at end of file
+        return self.schedule_processes(processes)
+    
+    def schedule_vectorized(self, table):
+        """
+        Schedule a ProcessTable with the closed-form FCFS engine.
+        
+        The result columns of the table are filled in, and the schedule is returned as
+        NumPy arrays rather than a list of tuples.
+        
+        Args:
+            table (ProcessTable): Processes to schedule.
+        
+        Returns:
+            tuple: (slice_pids, slice_times) arrays, with -1 marking idle slices.
+        """
+        slice_pids, slice_times, start_time, finish_time = fcfs_closed_form(
+            table.pid, table.arrival_time, table.remaining_time
+        )
+        
+        already_started = table.start_time != table.UNSET
+        start_time[already_started] = table.start_time[already_started]
+        self._store_table_results(table, start_time, finish_time)
+        
+        if self.accumulator is not None:
+            completed = finish_time != table.UNSET
+            self.accumulator.add_many(table.arrival_time[completed], table.burst_time[completed],
+                                      start_time[completed], finish_time[completed])
+        
+        self.current_time = int(slice_times.sum())
+        return slice_pids, slice_times
+    
+    def _run_table(self, table, chunk_size=None):
+        """
+        Schedule a ProcessTable with the closed-form FCFS engine.
+        
+        Args:
+            table (ProcessTable): Processes to schedule.
+            chunk_size (int, optional): Streaming chunk size, or None to keep the schedule.
+        
+        Yields:
+            list: Chunks of (pid, time_slice) tuples (streaming only).
+        """
+        slice_pids, slice_times = self.schedule_vectorized(table)
+        if self.emit_trace:
+            self.schedule_result = ScheduleTrace.from_arrays(slice_pids, slice_times)
+            return
+        
+        if chunk_size:
+            for begin in range(0, len(slice_pids), chunk_size):
+                yield list(zip(slice_pids[begin:begin + chunk_size].tolist(),
+                               slice_times[begin:begin + chunk_size].tolist()))
+            self.schedule_result = []
+        else:
+            self.schedule_result = list(zip(slice_pids.tolist(), slice_times.tolist()))
@@ -15,6 +15,8 @@ class PriorityScheduler(BaseScheduler):
     completion.
     """
     
+    ready_key = 'priority'
+    
     def get_next_process(self, ready_queue):
         """
         Get the next process to execute according to Priority scheduling.
@@ -64,7 +66,7 @@ class PriorityScheduler(BaseScheduler):
         Schedule the given processes according to Priority scheduling.
         
         Args:
-            processes (list): List of Process objects to schedule.
+            processes (list or ProcessTable): Processes to schedule.
         
         Returns:
             list: The schedule as a list of (pid, time_slice) tuples.
@@ -4,7 +4,10 @@ This module implements a combination of Priority and Round Robin CPU scheduling
 """
 
 from src.schedulers.base_scheduler import BaseScheduler
+from src.process import ProcessTable
 from collections import defaultdict, deque
+import heapq
+import numpy as np
 
 
 class PriorityRRScheduler(BaseScheduler):
@@ -13,6 +16,10 @@ class PriorityRRScheduler(BaseScheduler):
     
     This scheduler combines priority scheduling with round robin. Processes are grouped
     by priority, and within each priority level, round robin scheduling is applied.
+    
+    The non-empty priority levels are kept in a min-heap and every queued process is
+    flagged as such, so admitting and dispatching a process costs O(log P) for P
+    priority levels.
     """
     
     def __init__(self, quantum=2):
@@ -25,8 +32,23 @@ class PriorityRRScheduler(BaseScheduler):
         super().__init__()
         self.quantum = quantum
         self.priority_queues = defaultdict(deque)
+        self.priority_heap = []
+        self.queued = set()
         self.current_priority = None
     
+    def _enqueue(self, process):
+        """
+        Append a process to the queue of its priority level.
+        
+        Args:
+            process (Process): The process to enqueue.
+        """
+        queue = self.priority_queues[process.priority]
+        if not queue:
+            heapq.heappush(self.priority_heap, process.priority)
+        queue.append(process)
+        self.queued.add(id(process))
+    
     def get_next_process(self, ready_queue):
         """
         Get the next process to execute according to Priority + Round Robin.
@@ -39,23 +61,23 @@ class PriorityRRScheduler(BaseScheduler):
         """
          
         for process in ready_queue:
-            if (not any(process in queue for queue in self.priority_queues.values()) and
-                    not process.is_completed()):
-                self.priority_queues[process.priority].append(process)
-        
-         
-        empty_priorities = [p for p, q in self.priority_queues.items() if not q]
-        for priority in empty_priorities:
-            del self.priority_queues[priority]
+            if id(process) not in self.queued and not process.is_completed():
+                self._enqueue(process)
         
-        if not self.priority_queues:
+        if not self.priority_heap:
             return None
         
          
-        self.current_priority = min(self.priority_queues.keys())
+        self.current_priority = self.priority_heap[0]
+        queue = self.priority_queues[self.current_priority]
+        process = queue.popleft()
+        self.queued.discard(id(process))
         
-         
-        return self.priority_queues[self.current_priority].popleft()
+        if not queue:
+            heapq.heappop(self.priority_heap)
+            del self.priority_queues[self.current_priority]
+        
+        return process
     
     def execute_process(self, process, ready_queue):
         """
@@ -82,14 +104,14 @@ class PriorityRRScheduler(BaseScheduler):
          
         for p in ready_queue:
             if (p.arrival_time <= self.current_time and
-                    not any(p in queue for queue in self.priority_queues.values()) and
+                    id(p) not in self.queued and
                     not p.is_completed() and
                     p != process):
-                self.priority_queues[p.priority].append(p)
+                self._enqueue(p)
         
          
         if not process.is_completed():
-            self.priority_queues[process.priority].append(process)
+            self._enqueue(process)
         else:
              
             process.complete(self.current_time)
@@ -99,12 +121,162 @@ class PriorityRRScheduler(BaseScheduler):
         Schedule the given processes according to Priority + Round Robin.
         
         Args:
-            processes (list): List of Process objects to schedule.
+            processes (list or ProcessTable): Processes to schedule.
         
         Returns:
             list: The schedule as a list of (pid, time_slice) tuples.
         """
+        return self.schedule_processes(processes)
+    
+    def _run_schedule(self, processes, chunk_size=None):
+        """
+        Run Priority + Round Robin for the given processes.
+        
+        Args:
+            processes (list or ProcessTable): Processes to schedule.
+            chunk_size (int, optional): Streaming chunk size, or None to keep the schedule.
+        
+        Yields:
+            list: Chunks of (pid, time_slice) tuples (streaming only).
+        """
          
         self.priority_queues = defaultdict(deque)
+        self.priority_heap = []
+        self.queued = set()
         self.current_priority = None
-        return self.schedule_processes(processes)
\ No newline at end of file
+        
+        if isinstance(processes, ProcessTable):
+            yield from self._run_table(processes, chunk_size)
+            return
+        
+        start_times = [process.start_time for process in processes]
+        arrivals = [process.arrival_time for process in processes]
+        finish_times = yield from self._dispatch_priority_rr(
+            [process.pid for process in processes],
+            arrivals,
+            [process.remaining_time for process in processes],
+            [process.priority for process in processes],
+            start_times,
+            sorted(range(len(processes)), key=arrivals.__getitem__),
+            chunk_size,
+            self._completion_callback(processes, start_times)
+        )
+        self._store_results(processes, start_times, finish_times)
+    
+    def _run_table(self, table, chunk_size=None):
+        """
+        Schedule the processes of a ProcessTable and store the results in its columns.
+        
+        Args:
+            table (ProcessTable): Processes to schedule.
+            chunk_size (int, optional): Streaming chunk size, or None to keep the schedule.
+        
+        Yields:
+            list: Chunks of (pid, time_slice) tuples (streaming only).
+        """
+        start_times = [None if start_time == table.UNSET else start_time
+                       for start_time in table.start_time.tolist()]
+        finish_times = yield from self._dispatch_priority_rr(
+            table.pid.tolist(),
+            table.arrival_time.tolist(),
+            table.remaining_time.tolist(),
+            table.priority.tolist(),
+            start_times,
+            np.argsort(table.arrival_time, kind='stable').tolist(),
+            chunk_size,
+            self._completion_callback(table, start_times)
+        )
+        self._store_table_results(table, start_times, finish_times)
+    
+    def _dispatch_priority_rr(self, pids, arrivals, remaining, priorities, start_times, order,
+                              chunk_size=None, on_complete=None):
+        """
+        Run Priority + Round Robin over per-process columns.
+        
+        Each priority level holds a deque of row indices, and the heap holds the levels
+        whose deque is non-empty. Processes that arrived by the current time are admitted
+        in input order, after the preempted process has gone back to its level, which
+        is the same order as the generic scheduling loop.
+        
+        Args:
+            pids (list): Process IDs.
+            arrivals (list): Arrival times.
+            remaining (list): Remaining burst times, updated in place. Processes with
+                nothing left to run are never admitted.
+            priorities (list): Priority of each process.
+            start_times (list): Start times (None if not started), updated in place.
+            order (sequence): Row indices sorted by arrival time.
+            chunk_size (int, optional): Streaming chunk size, or None to keep the schedule.
+            on_complete (callable, optional): Called as ``on_complete(i, finish_time)`` when
+                process i completes.
+        
+        Yields:
+            list: Chunks of (pid, time_slice) tuples (streaming only).
+        
+        Returns:
+            list: Finish time of each process, or None if it was never completed.
+        """
+        quantum = self.quantum
+        n = len(order)
+        finish_times = [None] * n
+        schedule = self._new_schedule()
+        levels = {}
+        level_heap = []
+        cursor = 0
+        current_time = 0
+        
+        while True:
+            if chunk_size and len(schedule) > chunk_size:
+                yield schedule[:-1]
+                del schedule[:-1]
+            
+            admitted = []
+            while cursor < n and arrivals[order[cursor]] <= current_time:
+                if remaining[order[cursor]] > 0:
+                    admitted.append(order[cursor])
+                cursor += 1
+            admitted.sort()
+            
+            for i in admitted:
+                level = levels.get(priorities[i])
+                if level is None:
+                    level = levels[priorities[i]] = deque()
+                if not level:
+                    heapq.heappush(level_heap, priorities[i])
+                level.append(i)
+            
+            if not level_heap:
+                if cursor == n:
+                    break
+                
+                next_arrival = arrivals[order[cursor]]
+                schedule.append((-1, next_arrival - current_time))
+                current_time = next_arrival
+                continue
+            
+            self.current_priority = level_heap[0]
+            level = levels[self.current_priority]
+            i = level.popleft()
+            if not level:
+                heapq.heappop(level_heap)
+            
+            if start_times[i] is None:
+                start_times[i] = current_time
+            
+            time_slice = min(quantum, remaining[i])
+            remaining[i] -= time_slice
+            schedule.append((pids[i], time_slice))
+            current_time += time_slice
+            
+            if remaining[i] > 0:
+                if not level:
+                    heapq.heappush(level_heap, priorities[i])
+                level.append(i)
+            else:
+                finish_times[i] = current_time
+                if on_complete is not None:
+                    on_complete(i, current_time)
+        
+        self.current_time = current_time
+        self.schedule_result = schedule
+        return finish_times
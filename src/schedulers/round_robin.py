@@ -1,5 +1,8 @@
 from src.schedulers.base_scheduler import BaseScheduler
+from src.process import ProcessTable
+from src.schedule_trace import ScheduleTrace
 from collections import deque
+import numpy as np
 
 
 class RoundRobinScheduler(BaseScheduler):
@@ -11,16 +14,19 @@ class RoundRobinScheduler(BaseScheduler):
     if it exceeds its time quantum.
     """
     
-    def __init__(self, quantum=2):
+    def __init__(self, quantum=2, compress=False):
         """
         Initialize the Round Robin scheduler.
         
         Args:
             quantum (int): Time quantum for each process execution.
+            compress (bool, optional): Merge consecutive slices of the same process into a
+                single slice in the schedule (default: False).
         """
         super().__init__()
         self.quantum = quantum
-        self.ready_queue = []  
+        self.compress = compress
+        self.ready_queue = deque()
         self.process_index = 0 
     
     def get_next_process(self, ready_queue):
@@ -36,25 +42,26 @@ class RoundRobinScheduler(BaseScheduler):
             Process or None: The next process to execute, or None if no process is ready.
         """
 
-        while (self.process_index < len(ready_queue) and 
-               ready_queue[self.process_index].arrival_time <= self.current_time):
-            process = ready_queue[self.process_index]
-            self.ready_queue.append((process, process.remaining_time))
-            self.process_index += 1
-        
-        if not self.ready_queue:
-            if self.process_index < len(ready_queue):
-                next_process = ready_queue[self.process_index]
-                idle_time = next_process.arrival_time - self.current_time
-
-                self.schedule_result.append((-1, idle_time))
-                self.current_time += idle_time
-
-                return self.get_next_process(ready_queue)
-            else:
+        while True:
+            while (self.process_index < len(ready_queue) and 
+                   ready_queue[self.process_index].arrival_time <= self.current_time):
+                process = ready_queue[self.process_index]
+                self.ready_queue.append((process, process.remaining_time))
+                self.process_index += 1
+            
+            if self.ready_queue:
+                break
+            
+            if self.process_index >= len(ready_queue):
                 return None
+            
+            next_process = ready_queue[self.process_index]
+            idle_time = next_process.arrival_time - self.current_time
+            
+            self.schedule_result.append((-1, idle_time))
+            self.current_time += idle_time
 
-        process, remaining_time = self.ready_queue.pop(0)
+        process, remaining_time = self.ready_queue.popleft()
         return process
     
     def execute_process(self, process, ready_queue):
@@ -93,23 +100,182 @@ class RoundRobinScheduler(BaseScheduler):
         Schedule the given processes according to Round Robin.
         
         Args:
-            processes (list): List of Process objects to schedule.
+            processes (list or ProcessTable): Processes to schedule.
         
         Returns:
             list: The schedule as a list of (pid, time_slice) tuples.
         """
+        return self.schedule_processes(processes)
+    
+    def _run_schedule(self, processes, chunk_size=None):
+        """
+        Run Round Robin for the given processes.
+        
+        Args:
+            processes (list or ProcessTable): Processes to schedule.
+            chunk_size (int, optional): Streaming chunk size, or None to keep the schedule.
+        
+        Yields:
+            list: Chunks of (pid, time_slice) tuples (streaming only).
+        """
+        if isinstance(processes, ProcessTable):
+            yield from self._run_table(processes, chunk_size)
+            return
+        
         processes.sort(key=lambda p: p.arrival_time)
 
-        self.current_time = 0
-        self.schedule_result = []
-        self.ready_queue = []
-        self.process_index = 0
-
-        while self.process_index < len(processes) or self.ready_queue:
-            process = self.get_next_process(processes)
-            if process is None:
-                break
+        start_times = [process.start_time for process in processes]
+        finish_times = yield from self._dispatch_round_robin(
+            [process.pid for process in processes],
+            [process.arrival_time for process in processes],
+            [process.remaining_time for process in processes],
+            start_times,
+            range(len(processes)),
+            chunk_size,
+            self._completion_callback(processes, start_times)
+        )
+        self._store_results(processes, start_times, finish_times)
+    
+    def _run_table(self, table, chunk_size=None):
+        """
+        Schedule the processes of a ProcessTable and store the results in its columns.
+        
+        Args:
+            table (ProcessTable): Processes to schedule.
+            chunk_size (int, optional): Streaming chunk size, or None to keep the schedule.
+        
+        Yields:
+            list: Chunks of (pid, time_slice) tuples (streaming only).
+        """
+        start_times = [None if start_time == table.UNSET else start_time
+                       for start_time in table.start_time.tolist()]
+        finish_times = yield from self._dispatch_round_robin(
+            table.pid.tolist(),
+            table.arrival_time.tolist(),
+            table.remaining_time.tolist(),
+            start_times,
+            np.argsort(table.arrival_time, kind='stable').tolist(),
+            chunk_size,
+            self._completion_callback(table, start_times)
+        )
+        self._store_table_results(table, start_times, finish_times)
+    
+    def _dispatch_round_robin(self, pids, arrivals, remaining, start_times, order,
+                              chunk_size=None, on_complete=None):
+        """
+        Run Round Robin over per-process columns.
+        
+        The ready queue is a deque of row indices, so each quantum is O(1), and idle gaps
+        are handled iteratively. Once per rotation of the ready queue the engine checks
+        whether the next k whole rounds are stable, meaning no process finishes and
+        nothing arrives before the end of round k. Such rounds are applied in a single
+        arithmetic step, and the emitted schedule is the same as stepping them one
+        quantum at a time. When a ScheduleTrace is emitted, the slices of skipped rounds
+        are added as one repeated block and slices are always merged by the trace. When
+        streaming, at most about ``chunk_size`` slices of skipped rounds are emitted at once.
+        
+        Args:
+            pids (list): Process IDs.
+            arrivals (list): Arrival times.
+            remaining (list): Remaining burst times, updated in place.
+            start_times (list): Start times (None if not started), updated in place.
+            order (sequence): Row indices sorted by arrival time.
+            chunk_size (int, optional): Streaming chunk size, or None to keep the schedule.
+            on_complete (callable, optional): Called as ``on_complete(i, finish_time)`` when
+                process i completes.
+        
+        Yields:
+            list: Chunks of (pid, time_slice) tuples (streaming only).
+        
+        Returns:
+            list: Finish time of each process, or None if it was never completed.
+        """
+        quantum = self.quantum
+        schedule = self._new_schedule()
+        trace = isinstance(schedule, ScheduleTrace)
+        compress = self.compress and not trace
+        n = len(order)
+        finish_times = [None] * n
+        queue = deque()
+        cursor = 0
+        current_time = 0
+        dispatches_before_check = 0
+        
+        while True:
+            if chunk_size and len(schedule) > chunk_size:
+                yield schedule[:-1]
+                del schedule[:-1]
+            
+            while cursor < n and arrivals[order[cursor]] <= current_time:
+                queue.append(order[cursor])
+                cursor += 1
+            
+            if not queue:
+                if cursor == n:
+                    break
+                
+                next_arrival = arrivals[order[cursor]]
+                schedule.append((-1, next_arrival - current_time))
+                current_time = next_arrival
+                continue
+            
+            if dispatches_before_check <= 0:
+                rotation = len(queue) * quantum
+                rounds = (min(remaining[i] for i in queue) - 1) // quantum
+                if cursor < n:
+                    rounds = min(rounds, (arrivals[order[cursor]] - current_time - 1) // rotation)
+                if chunk_size and not (compress and len(queue) == 1):
+                    rounds = min(rounds, max(1, chunk_size // len(queue)))
+                
+                if rounds > 0:
+                    round_slices = []
+                    for position, i in enumerate(queue):
+                        if start_times[i] is None:
+                            start_times[i] = current_time + position * quantum
+                        remaining[i] -= rounds * quantum
+                        round_slices.append((pids[i], quantum))
+                    
+                    if trace:
+                        schedule.extend_repeated(round_slices, rounds)
+                    elif compress and len(queue) == 1:
+                        pid = pids[queue[0]]
+                        if schedule and schedule[-1][0] == pid:
+                            schedule[-1] = (pid, schedule[-1][1] + rounds * quantum)
+                        else:
+                            schedule.append((pid, rounds * quantum))
+                    else:
+                        schedule.extend(round_slices * rounds)
+                    current_time += rounds * rotation
+                
+                dispatches_before_check = len(queue)
+                continue
+            dispatches_before_check -= 1
             
-            self.execute_process(process, processes)
+            i = queue.popleft()
+            if start_times[i] is None:
+                start_times[i] = current_time
+            
+            time_slice = min(quantum, remaining[i])
+            remaining[i] -= time_slice
+            if compress and schedule and schedule[-1][0] == pids[i]:
+                schedule[-1] = (pids[i], schedule[-1][1] + time_slice)
+            else:
+                schedule.append((pids[i], time_slice))
+            current_time += time_slice
+            
+            while cursor < n and arrivals[order[cursor]] <= current_time:
+                queue.append(order[cursor])
+                cursor += 1
+            
+            if remaining[i] > 0:
+                queue.append(i)
+            else:
+                finish_times[i] = current_time
+                if on_complete is not None:
+                    on_complete(i, current_time)
         
-        return self.schedule_result
+        self.current_time = current_time
+        self.schedule_result = schedule
+        self.ready_queue = deque()
+        self.process_index = n
+        return finish_times
@@ -15,6 +15,8 @@ class SJFScheduler(BaseScheduler):
     completion.
     """
     
+    ready_key = 'remaining_time'
+    
     def get_next_process(self, ready_queue):
         """
         Get the next process to execute according to SJF.
@@ -63,7 +65,7 @@ class SJFScheduler(BaseScheduler):
         Schedule the given processes according to SJF.
         
         Args:
-            processes (list): List of Process objects to schedule.
+            processes (list or ProcessTable): Processes to schedule.
         
         Returns:
             list: The schedule as a list of (pid, time_slice) tuples.
@@ -0,0 +1,40 @@
+"""
+Simulation Package
+This package contains helpers that run the scheduling algorithms on a workload.
+"""
+
+from src.simulation.cache import (ENGINE_VERSION, ResultCache, workload_hash, result_key,
+                                  configure_result_cache, get_result_cache)
+from src.simulation.runner import (ALGORITHMS, create_scheduler, as_workload,
+                                   run_simulation, run_all_simulations, stream_simulation)
+from src.simulation.parallel import SharedWorkload, run_all_simulations_parallel
+from src.simulation.sweep import (SWEEP_ALGORITHMS, SWEEP_METRICS, parse_quanta,
+                                  sweep_quantum, clear_sweep_cache)
+from src.simulation.experiment import (DEFAULT_WORKLOAD, spawn_seeds, summarize_samples,
+                                       run_experiment)
+
+__all__ = [
+    'ENGINE_VERSION',
+    'ResultCache',
+    'workload_hash',
+    'result_key',
+    'configure_result_cache',
+    'get_result_cache',
+    'ALGORITHMS',
+    'create_scheduler',
+    'as_workload',
+    'run_simulation',
+    'run_all_simulations',
+    'stream_simulation',
+    'SharedWorkload',
+    'run_all_simulations_parallel',
+    'SWEEP_ALGORITHMS',
+    'SWEEP_METRICS',
+    'parse_quanta',
+    'sweep_quantum',
+    'clear_sweep_cache',
+    'DEFAULT_WORKLOAD',
+    'spawn_seeds',
+    'summarize_samples',
+    'run_experiment'
+]
\ No newline at end of file
@@ -0,0 +1,281 @@
+"""
+Result Cache Module
+This module caches simulation results by the content of what was simulated.
+
+A result is keyed by a canonical hash of the workload columns, the algorithm, the
+parameters the algorithm actually uses and ENGINE_VERSION, so re-running the same
+uploaded workload with the same settings is a lookup instead of a simulation. Results
+are kept in a bounded in-memory LRU tier and, when a directory is configured, in an
+on-disk tier that evicts the least recently used files beyond a size budget.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import threading
+from collections import OrderedDict
+from src.process import ProcessTable
+
+
+# Bump whenever a change to the schedulers, metrics or ScheduleTrace layout can change the
+# cached results, so that results cached by an older engine are not served.
+ENGINE_VERSION = "3"
+QUANTUM_ALGORITHMS = ("rr", "priority_rr")
+
+
+def workload_hash(processes):
+    """
+    Compute a content hash of a workload.
+    
+    Args:
+        processes (list or ProcessTable): The workload.
+    
+    Returns:
+        str: Hex SHA-256 digest of the pid, arrival, burst and priority columns.
+    """
+    if not isinstance(processes, ProcessTable):
+        processes = ProcessTable.from_processes(processes)
+    
+    digest = hashlib.sha256()
+    for name in ProcessTable.COLUMNS[:4]:
+        digest.update(getattr(processes, name).astype('<i8', copy=False).tobytes())
+    return digest.hexdigest()
+
+
+def result_key(workload_digest, algorithm, quantum=None, kind="run"):
+    """
+    Build the cache key of a simulation result.
+    
+    The quantum is only part of the key for the algorithms that use it, so e.g. an FCFS
+    result is shared by every quantum.
+    
+    Args:
+        workload_digest (str): Digest returned by ``workload_hash``.
+        algorithm (str): Algorithm name.
+        quantum (int, optional): Time quantum.
+        kind (str): What is cached, e.g. "run" for full results or "metrics".
+    
+    Returns:
+        str: Hex SHA-256 digest of the canonical description of the result.
+    """
+    params = {"quantum": quantum} if algorithm in QUANTUM_ALGORITHMS else {}
+    description = json.dumps({
+        "workload": workload_digest,
+        "algorithm": algorithm,
+        "params": params,
+        "engine": ENGINE_VERSION,
+        "kind": kind
+    }, sort_keys=True)
+    return hashlib.sha256(description.encode()).hexdigest()
+
+
+class ResultCache:
+    """
+    A two-tier cache of simulation results.
+    
+    The memory tier holds up to ``max_entries`` values in least-recently-used order.
+    The optional disk tier stores one pickle file per key in ``directory`` and removes
+    the least recently used files once they take more than ``max_bytes``. A value found
+    on disk is promoted to the memory tier. The cache can be shared between threads.
+    
+    Attributes:
+        hits (int): Lookups served from either tier.
+        misses (int): Lookups that found nothing.
+        memory_hits (int): Lookups served from the memory tier.
+        disk_hits (int): Lookups served from the disk tier.
+    """
+    
+    def __init__(self, max_entries=64, directory=None, max_bytes=256 * 1024 * 1024):
+        """
+        Initialize an empty cache.
+        
+        Args:
+            max_entries (int): Maximum number of values kept in memory (0 disables the
+                memory tier).
+            directory (str, optional): Directory of the disk tier (default: no disk tier).
+            max_bytes (int): Size budget of the disk tier, in bytes.
+        """
+        self.max_entries = max_entries
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.memory_hits = 0
+        self.disk_hits = 0
+        
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+    
+    def get(self, key):
+        """
+        Look up a value.
+        
+        Args:
+            key (str): The key.
+        
+        Returns:
+            object or None: The cached value, or None on a miss.
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                self.memory_hits += 1
+                return self._entries[key]
+        
+        value = self._load(key)
+        with self._lock:
+            if value is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.disk_hits += 1
+            self._remember(key, value)
+        return value
+    
+    def put(self, key, value):
+        """
+        Store a value in both tiers.
+        
+        Args:
+            key (str): The key.
+            value (object): The value. It must be picklable for the disk tier.
+        """
+        with self._lock:
+            self._remember(key, value)
+        self._store(key, value)
+    
+    def clear(self):
+        """Remove every value from both tiers and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.memory_hits = self.disk_hits = 0
+            for path, _, _ in self._disk_entries():
+                self._remove(path)
+    
+    def stats(self):
+        """
+        Get the cache counters.
+        
+        Returns:
+            dict: Hits (in total and per tier), misses, hit rate, number of values in
+                memory, and number of files and bytes on disk.
+        """
+        with self._lock:
+            files = self._disk_entries()
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "hit_rate": self.hits / lookups if lookups else 0,
+                "memory_entries": len(self._entries),
+                "disk_entries": len(files),
+                "disk_bytes": sum(size for _, size, _ in files)
+            }
+    
+    def _remember(self, key, value):
+        """Add a value to the memory tier, evicting the least recently used ones."""
+        if self.max_entries <= 0:
+            return
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+    
+    def _path(self, key):
+        """Return the disk tier path of a key."""
+        return os.path.join(self.directory, f"{key}.pkl")
+    
+    def _load(self, key):
+        """Read a value from the disk tier, or return None."""
+        if self.directory is None:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as file:
+                value = pickle.load(file)
+            os.utime(path)
+            return value
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            return None
+    
+    def _store(self, key, value):
+        """Write a value to the disk tier and enforce its size budget."""
+        if self.directory is None:
+            return
+        try:
+            descriptor, temporary = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            with os.fdopen(descriptor, 'wb') as file:
+                pickle.dump(value, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary, self._path(key))
+        except OSError as e:
+            print(f"Error writing to result cache: {str(e)}")
+            return
+        
+        with self._lock:
+            files = self._disk_entries()
+            total = sum(size for _, size, _ in files)
+            for path, size, _ in sorted(files, key=lambda entry: entry[2]):
+                if total <= self.max_bytes:
+                    break
+                self._remove(path)
+                total -= size
+    
+    def _disk_entries(self):
+        """List the (path, size, mtime) of the files of the disk tier."""
+        if self.directory is None:
+            return []
+        entries = []
+        with os.scandir(self.directory) as scan:
+            for entry in scan:
+                if entry.name.endswith('.pkl'):
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    entries.append((entry.path, stat.st_size, stat.st_mtime))
+        return entries
+    
+    @staticmethod
+    def _remove(path):
+        """Remove a file of the disk tier, ignoring files already gone."""
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+result_cache = ResultCache()
+
+
+def configure_result_cache(max_entries=64, directory=None, max_bytes=256 * 1024 * 1024):
+    """
+    Replace the shared result cache used by the simulation helpers.
+    
+    Args:
+        max_entries (int): Maximum number of results kept in memory.
+        directory (str, optional): Directory of the disk tier (default: no disk tier).
+        max_bytes (int): Size budget of the disk tier, in bytes.
+    
+    Returns:
+        ResultCache: The new cache.
+    """
+    global result_cache
+    result_cache = ResultCache(max_entries, directory, max_bytes)
+    return result_cache
+
+
+def get_result_cache():
+    """
+    Get the shared result cache.
+    
+    Returns:
+        ResultCache: The cache currently used by the simulation helpers.
+    """
+    return result_cache
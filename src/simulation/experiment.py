@@ -0,0 +1,223 @@
+"""
+Experiment Module
+This module runs Monte Carlo experiments over many independent random workloads.
+
+Each sample is a workload generated from its own seed, spawned from one root seed with
+numpy's SeedSequence, so an experiment is fully reproducible from the root seed alone and
+the samples do not depend on which worker runs them or in which order. Workers receive
+only the seed and generate their workload themselves, then run every algorithm on it.
+The per-sample metrics are aggregated into means with confidence intervals.
+"""
+
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from statistics import NormalDist
+import numpy as np
+from src.utils.process_generator import generate_random_processes
+from src.utils.workload_generator import synthesize_workload
+from src.simulation.runner import ALGORITHMS, run_simulation
+
+
+DEFAULT_WORKLOAD = {
+    "num_processes": 50,
+    "min_burst": 1,
+    "max_burst": 10,
+    "min_arrival": 0,
+    "max_arrival": 100,
+    "min_priority": 1,
+    "max_priority": 10
+}
+
+# Two-sided critical values of Student's t distribution for 1 to 30 degrees of freedom
+T_CRITICAL_TABLE = {
+    0.95: (12.706205, 4.302653, 3.182446, 2.776445, 2.570582, 2.446912, 2.364624,
+           2.306004, 2.262157, 2.228139, 2.200985, 2.178813, 2.160369, 2.144787,
+           2.131450, 2.119905, 2.109816, 2.100922, 2.093024, 2.085963, 2.079614,
+           2.073873, 2.068658, 2.063899, 2.059539, 2.055529, 2.051831, 2.048407,
+           2.045230, 2.042272),
+    0.99: (63.656741, 9.924843, 5.840909, 4.604095, 4.032143, 3.707428, 3.499483,
+           3.355387, 3.249836, 3.169273, 3.105807, 3.054540, 3.012276, 2.976843,
+           2.946713, 2.920782, 2.898231, 2.878440, 2.860935, 2.845340, 2.831360,
+           2.818756, 2.807336, 2.796940, 2.787436, 2.778715, 2.770683, 2.763262,
+           2.756386, 2.749996)
+}
+
+
+def spawn_seeds(seed, samples):
+    """
+    Derive independent per-sample seeds from a root seed.
+    
+    Args:
+        seed (int): Root seed of the experiment.
+        samples (int): Number of samples.
+    
+    Returns:
+        list: One integer seed per sample.
+    """
+    children = np.random.SeedSequence(seed).spawn(samples)
+    return [int(child.generate_state(1, dtype=np.uint64)[0]) for child in children]
+
+
+def t_critical(confidence, dof):
+    """
+    Two-sided critical value of Student's t distribution.
+    
+    The 95% and 99% values for up to 30 degrees of freedom come from T_CRITICAL_TABLE.
+    Other values use the Cornish-Fisher expansion around the normal quantile, which is
+    accurate to about 1e-5 above 30 degrees of freedom but too small for only a few
+    (11.30 instead of 12.71 at one degree of freedom and 95%).
+    
+    Args:
+        confidence (float): Confidence level, e.g. 0.95.
+        dof (int): Degrees of freedom.
+    
+    Returns:
+        float: The critical value.
+    """
+    if dof <= 0:
+        return math.inf
+    table = T_CRITICAL_TABLE.get(round(confidence, 6))
+    if table is not None and dof <= len(table):
+        return table[dof - 1]
+    
+    z = NormalDist().inv_cdf((1 + confidence) / 2)
+    return (z + (z ** 3 + z) / (4 * dof)
+            + (5 * z ** 5 + 16 * z ** 3 + 3 * z) / (96 * dof ** 2)
+            + (3 * z ** 7 + 19 * z ** 5 + 17 * z ** 3 - 15 * z) / (384 * dof ** 3)
+            + (79 * z ** 9 + 776 * z ** 7 + 1482 * z ** 5 - 1920 * z ** 3 - 945 * z)
+            / (92160 * dof ** 4))
+
+
+def summarize_samples(samples, confidence=0.95):
+    """
+    Aggregate per-sample metrics into means with confidence intervals.
+    
+    Args:
+        samples (list): Per-sample results, each a dict of metrics keyed by algorithm.
+        confidence (float): Confidence level of the intervals.
+    
+    Returns:
+        dict: Per algorithm and metric, a dict with "mean", "std", "half_width",
+            "ci_low", "ci_high" and "n".
+    """
+    summary = {}
+    if not samples:
+        return summary
+    
+    for algorithm in samples[0]:
+        names = [name for name, value in samples[0][algorithm].items()
+                 if isinstance(value, (int, float))]
+        values = np.array([[sample[algorithm][name] for name in names] for sample in samples],
+                          dtype=np.float64)
+        n = len(values)
+        means = values.mean(axis=0)
+        stds = values.std(axis=0, ddof=1) if n > 1 else np.zeros(len(names))
+        half_widths = t_critical(confidence, n - 1) * stds / math.sqrt(n) if n > 1 else \
+            np.zeros(len(names))
+        
+        summary[algorithm] = {
+            name: {
+                "mean": means[i].item(),
+                "std": stds[i].item(),
+                "half_width": half_widths[i].item(),
+                "ci_low": (means[i] - half_widths[i]).item(),
+                "ci_high": (means[i] + half_widths[i]).item(),
+                "n": n
+            }
+            for i, name in enumerate(names)
+        }
+    
+    return summary
+
+
+def run_experiment(samples, seed=None, workload=None, quantum=2, algorithms=None,
+                   confidence=0.95, max_workers=None, progress=None, synthetic=None):
+    """
+    Run every algorithm on independent seeded random workloads.
+    
+    Args:
+        samples (int): Number of workloads to generate.
+        seed (int, optional): Root seed. A random one is drawn (and returned) if omitted.
+        workload (dict, optional): Arguments of ``generate_random_processes`` overriding
+            DEFAULT_WORKLOAD.
+        quantum (int): Time quantum for the Round Robin algorithms.
+        algorithms (list, optional): Algorithms to run (default: ALGORITHMS).
+        confidence (float): Confidence level of the intervals.
+        max_workers (int, optional): Number of worker processes (default: number of
+            CPUs). With one worker the samples run in this process.
+        progress (callable, optional): Called as ``progress(done, samples, elapsed)``
+            after each completed sample.
+        synthetic (dict, optional): Distribution options of ``WorkloadGenerator``. When
+            given, the workloads are synthesized with ``synthesize_workload`` instead, and
+            only "num_processes" is read from ``workload``.
+    
+    Returns:
+        dict: "seed" (the root seed), "samples" (per-sample metrics keyed by algorithm,
+            in sample order), "summary" (see ``summarize_samples``) and "elapsed"
+            (seconds).
+    """
+    if seed is None:
+        seed = np.random.SeedSequence().entropy
+    params = dict(DEFAULT_WORKLOAD, **(workload or {}))
+    algorithms = list(algorithms or ALGORITHMS)
+    seeds = spawn_seeds(seed, samples)
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    
+    results = [None] * samples
+    start = time.perf_counter()
+    
+    if max_workers > 1 and samples > 1:
+        with ProcessPoolExecutor(min(max_workers, samples)) as executor:
+            futures = {
+                executor.submit(_run_sample, sample_seed, params, quantum, algorithms,
+                                synthetic): index
+                for index, sample_seed in enumerate(seeds)
+            }
+            for done, future in enumerate(as_completed(futures), 1):
+                results[futures[future]] = future.result()
+                if progress is not None:
+                    progress(done, samples, time.perf_counter() - start)
+    else:
+        for index, sample_seed in enumerate(seeds):
+            results[index] = _run_sample(sample_seed, params, quantum, algorithms, synthetic)
+            if progress is not None:
+                progress(index + 1, samples, time.perf_counter() - start)
+    
+    return {
+        "seed": seed,
+        "samples": results,
+        "summary": summarize_samples(results, confidence),
+        "elapsed": time.perf_counter() - start
+    }
+
+
+def _run_sample(seed, params, quantum, algorithms, synthetic=None):
+    """
+    Generate one workload and run the algorithms on it (executed in a worker process).
+    
+    Args:
+        seed (int): Seed of the workload.
+        params (dict): Arguments of ``generate_random_processes``.
+        quantum (int): Time quantum for the Round Robin algorithms.
+        algorithms (list): Algorithms to run.
+        synthetic (dict, optional): Options of ``synthesize_workload``, used instead of
+            ``generate_random_processes`` when given.
+    
+    Returns:
+        dict: The scalar metrics of each algorithm, keyed by algorithm.
+    """
+    if synthetic is not None:
+        workload = synthesize_workload(params['num_processes'], seed, **synthetic)
+    else:
+        workload = generate_random_processes(as_table=True, seed=seed, **params)
+    sample = {}
+    
+    for algorithm in algorithms:
+        _, metrics, _ = run_simulation(algorithm, workload, quantum, cache=False)
+        sample[algorithm] = {name: value for name, value in metrics.items()
+                             if isinstance(value, (int, float))}
+    
+    return sample
@@ -0,0 +1,179 @@
+"""
+Parallel Simulation Module
+This module runs the scheduling algorithms of a comparison in parallel worker processes.
+
+The workload columns are published once in a shared memory block. Each worker maps that
+block and schedules the table in place, so the processes are never pickled per task; only
+the schedule, the metrics and the result columns travel back to the parent.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import numpy as np
+from src.process import ProcessTable
+from src.simulation.cache import get_result_cache, result_key, workload_hash
+from src.simulation.runner import (ALGORITHMS, as_workload, run_simulation, result_columns,
+                                   restore_run)
+
+
+WORKLOAD_COLUMNS = ProcessTable.COLUMNS[:4]
+
+
+class SharedWorkload:
+    """
+    A workload published in shared memory.
+    
+    The pid, arrival, burst and priority columns are stored as rows of one int64 block.
+    Worker processes attach to it by name with ``attach_workload``. The block is removed
+    when the SharedWorkload is closed.
+    
+    Attributes:
+        name (str): Name of the shared memory block.
+        length (int): Number of processes.
+    """
+    
+    def __init__(self, processes):
+        """
+        Publish a workload in shared memory.
+        
+        Args:
+            processes (list or ProcessTable): The workload.
+        """
+        table = as_workload(processes)
+        self.length = len(table)
+        self._shm = shared_memory.SharedMemory(
+            create=True, size=max(1, len(WORKLOAD_COLUMNS) * self.length * 8)
+        )
+        self.name = self._shm.name
+        
+        columns = np.ndarray((len(WORKLOAD_COLUMNS), self.length), dtype=np.int64,
+                             buffer=self._shm.buf)
+        for row, name in enumerate(WORKLOAD_COLUMNS):
+            columns[row] = getattr(table, name)
+        del columns
+    
+    def close(self):
+        """Release and remove the shared memory block."""
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+    
+    def __enter__(self):
+        """Return the workload when used as a context manager."""
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Remove the shared memory block when leaving the context."""
+        self.close()
+
+
+def attach_workload(shm, length):
+    """
+    Build a ProcessTable over the columns of a shared workload block.
+    
+    Args:
+        shm (SharedMemory): The attached shared memory block.
+        length (int): Number of processes.
+    
+    Returns:
+        ProcessTable: A table whose workload columns are views of the block.
+    """
+    columns = np.ndarray((len(WORKLOAD_COLUMNS), length), dtype=np.int64, buffer=shm.buf)
+    return ProcessTable(*columns)
+
+
+def _simulate_shared(name, length, algorithm, quantum):
+    """
+    Run one algorithm on a shared workload (executed in a worker process).
+    
+    Args:
+        name (str): Name of the shared memory block.
+        length (int): Number of processes.
+        algorithm (str): One of ALGORITHMS.
+        quantum (int): Time quantum for the Round Robin algorithms.
+    
+    Returns:
+        tuple: (schedule, metrics, columns), where columns maps each result column name
+            to its array.
+    """
+    shm = shared_memory.SharedMemory(name=name)
+    result = _simulate_attached(shm, length, algorithm, quantum)
+    shm.close()
+    return result
+
+
+def _simulate_attached(shm, length, algorithm, quantum):
+    """
+    Run one algorithm on an attached shared workload.
+    
+    Kept apart from ``_simulate_shared`` so that every view of the block is released
+    before the block is closed.
+    
+    Args:
+        shm (SharedMemory): The attached shared memory block.
+        length (int): Number of processes.
+        algorithm (str): One of ALGORITHMS.
+        quantum (int): Time quantum for the Round Robin algorithms.
+    
+    Returns:
+        tuple: (schedule, metrics, columns), as returned by ``_simulate_shared``.
+    """
+    schedule, metrics, run = run_simulation(algorithm, attach_workload(shm, length), quantum,
+                                            cache=False)
+    return schedule, metrics, result_columns(run)
+
+
+def run_all_simulations_parallel(processes, quantum=2, max_workers=None, cache=True):
+    """
+    Run every scheduling algorithm on the same workload, one worker process per algorithm.
+    
+    Args:
+        processes (list or ProcessTable): The workload. It is not modified.
+        quantum (int): Time quantum for the Round Robin algorithms.
+        max_workers (int, optional): Number of worker processes (default: one per
+            algorithm, up to the number of CPUs).
+        cache (bool): Serve the algorithms found in the shared result cache from it, run
+            only the others, and store their results.
+    
+    Returns:
+        dict: Results keyed by algorithm, each with "schedule", "metrics" and "processes".
+    """
+    workload = as_workload(processes)
+    result_cache = get_result_cache()
+    keys = {}
+    cached = {}
+    if cache:
+        digest = workload_hash(workload)
+        keys = {algorithm: result_key(digest, algorithm, quantum) for algorithm in ALGORITHMS}
+        cached = {algorithm: result_cache.get(key) for algorithm, key in keys.items()}
+    pending = [algorithm for algorithm in ALGORITHMS if cached.get(algorithm) is None]
+    
+    computed = {}
+    if pending:
+        if max_workers is None:
+            max_workers = min(len(pending), os.cpu_count() or 1)
+        
+        with SharedWorkload(workload) as shared, ProcessPoolExecutor(max_workers) as executor:
+            futures = {
+                algorithm: executor.submit(_simulate_shared, shared.name, shared.length,
+                                           algorithm, quantum)
+                for algorithm in pending
+            }
+            for algorithm, future in futures.items():
+                computed[algorithm] = future.result()
+                if cache:
+                    schedule, metrics, columns = computed[algorithm]
+                    result_cache.put(keys[algorithm], (schedule, dict(metrics), columns))
+    
+    results = {}
+    for algorithm in ALGORITHMS:
+        schedule, metrics, columns = computed.get(algorithm) or cached[algorithm]
+        results[algorithm] = {
+            "schedule": schedule,
+            "metrics": dict(metrics),
+            "processes": restore_run(workload, columns)
+        }
+    
+    return results
@@ -0,0 +1,232 @@
+"""
+Simulation Runner Module
+This module runs the scheduling algorithms on a shared workload without copying it.
+
+The workload is a ProcessTable whose input columns are shared, read-only, by every run.
+Each run gets its own table of result columns (remaining, start, finish, waiting and
+turnaround times), so comparing algorithms allocates O(n) state per algorithm and never
+copies the processes themselves.
+"""
+
+import os
+from src.process import ProcessTable
+from src.utils.metrics import calculate_metrics
+from src.utils.online_metrics import MetricsAccumulator
+from src.utils.file_handler import write_schedule_to_file
+from src.schedulers.fcfs import FCFSScheduler
+from src.schedulers.sjf import SJFScheduler
+from src.schedulers.priority import PriorityScheduler
+from src.schedulers.round_robin import RoundRobinScheduler
+from src.schedulers.priority_rr import PriorityRRScheduler
+from src.simulation.cache import get_result_cache, result_key, workload_hash
+
+
+ALGORITHMS = ["fcfs", "sjf", "priority", "rr", "priority_rr"]
+PARALLEL_MIN_PROCESSES = 50000
+RESULT_COLUMNS = ProcessTable.COLUMNS[4:]
+
+
+def create_scheduler(algorithm, quantum=2):
+    """
+    Create the scheduler for an algorithm name.
+    
+    Args:
+        algorithm (str): One of ALGORITHMS.
+        quantum (int): Time quantum for the Round Robin algorithms.
+    
+    Returns:
+        BaseScheduler: The scheduler.
+    """
+    if algorithm == "fcfs":
+        return FCFSScheduler()
+    elif algorithm == "sjf":
+        return SJFScheduler()
+    elif algorithm == "priority":
+        return PriorityScheduler()
+    elif algorithm == "rr":
+        return RoundRobinScheduler(quantum)
+    elif algorithm == "priority_rr":
+        return PriorityRRScheduler(quantum)
+    else:
+        raise ValueError(f"Unknown algorithm: {algorithm}")
+
+
+def as_workload(processes):
+    """
+    Get the workload described by a list of processes or a ProcessTable.
+    
+    A ProcessTable is used as is. A list of Process objects is converted once.
+    
+    Args:
+        processes (list or ProcessTable): The processes.
+    
+    Returns:
+        ProcessTable: The workload.
+    """
+    if isinstance(processes, ProcessTable):
+        return processes
+    return ProcessTable.from_processes(processes)
+
+
+def run_simulation(algorithm, processes, quantum=2, cache=True):
+    """
+    Run one scheduling algorithm on a workload.
+    
+    Args:
+        algorithm (str): One of ALGORITHMS.
+        processes (list or ProcessTable): The workload. It is not modified.
+        quantum (int): Time quantum for the Round Robin algorithms.
+        cache (bool): Look the result up in the shared result cache first, and store it
+            there after a run (see ``src.simulation.cache``).
+    
+    Returns:
+        tuple: (schedule, metrics, run), where schedule is a ScheduleTrace and run is a
+            ProcessTable holding the per-process results of this run. A schedule served
+            from the cache is shared with it and must not be modified.
+    """
+    workload = as_workload(processes)
+    if not cache:
+        return _simulate(algorithm, workload, quantum)
+    return _simulate_cached(algorithm, workload, quantum, workload_hash(workload))
+
+
+def _simulate(algorithm, workload, quantum):
+    """
+    Run one scheduling algorithm on a workload, without the cache.
+    
+    Args:
+        algorithm (str): One of ALGORITHMS.
+        workload (ProcessTable): The workload.
+        quantum (int): Time quantum for the Round Robin algorithms.
+    
+    Returns:
+        tuple: (schedule, metrics, run), as returned by ``run_simulation``.
+    """
+    scheduler = create_scheduler(algorithm, quantum)
+    run = workload.new_run()
+    schedule = scheduler.schedule_trace(run)
+    metrics = calculate_metrics(schedule, run)
+    return schedule, metrics, run
+
+
+def _simulate_cached(algorithm, workload, quantum, digest):
+    """
+    Run one scheduling algorithm on a workload, through the shared result cache.
+    
+    Args:
+        algorithm (str): One of ALGORITHMS.
+        workload (ProcessTable): The workload.
+        quantum (int): Time quantum for the Round Robin algorithms.
+        digest (str): Content hash of the workload (see ``workload_hash``).
+    
+    Returns:
+        tuple: (schedule, metrics, run), as returned by ``run_simulation``.
+    """
+    cache = get_result_cache()
+    key = result_key(digest, algorithm, quantum)
+    cached = cache.get(key)
+    if cached is not None:
+        schedule, metrics, columns = cached
+        return schedule, dict(metrics), restore_run(workload, columns)
+    
+    schedule, metrics, run = _simulate(algorithm, workload, quantum)
+    cache.put(key, (schedule, dict(metrics), result_columns(run)))
+    return schedule, metrics, run
+
+
+def result_columns(run):
+    """
+    Copy the result columns of a run.
+    
+    Args:
+        run (ProcessTable): A completed run.
+    
+    Returns:
+        dict: A copy of each result column, keyed by column name.
+    """
+    return {name: getattr(run, name).copy() for name in RESULT_COLUMNS}
+
+
+def restore_run(workload, columns):
+    """
+    Rebuild a run of a workload from its result columns.
+    
+    Args:
+        workload (ProcessTable): The workload.
+        columns (dict): Result columns keyed by column name (see ``result_columns``).
+    
+    Returns:
+        ProcessTable: A new run of the workload holding a copy of the results.
+    """
+    run = workload.new_run()
+    for name, column in columns.items():
+        getattr(run, name)[:] = column
+    return run
+
+
+def run_all_simulations(processes, quantum=2, parallel=None, cache=True):
+    """
+    Run every scheduling algorithm on the same workload.
+    
+    Args:
+        processes (list or ProcessTable): The workload. It is not modified.
+        quantum (int): Time quantum for the Round Robin algorithms.
+        parallel (bool, optional): Run the algorithms in worker processes (see
+            ``run_all_simulations_parallel``). By default this is done for workloads of at
+            least PARALLEL_MIN_PROCESSES processes when more than one CPU is available.
+        cache (bool): Serve and store the results through the shared result cache.
+    
+    Returns:
+        dict: Results keyed by algorithm, each with "schedule", "metrics" and "processes".
+    """
+    workload = as_workload(processes)
+    if parallel is None:
+        parallel = len(workload) >= PARALLEL_MIN_PROCESSES and (os.cpu_count() or 1) > 1
+    if parallel:
+        from src.simulation.parallel import run_all_simulations_parallel
+        return run_all_simulations_parallel(workload, quantum, cache=cache)
+    
+    digest = workload_hash(workload) if cache else None
+    results = {}
+    
+    for algorithm in ALGORITHMS:
+        if cache:
+            schedule, metrics, run = _simulate_cached(algorithm, workload, quantum, digest)
+        else:
+            schedule, metrics, run = _simulate(algorithm, workload, quantum)
+        results[algorithm] = {
+            "schedule": schedule,
+            "metrics": metrics,
+            "processes": run
+        }
+    
+    return results
+
+
+def stream_simulation(algorithm, processes, filename, quantum=2):
+    """
+    Run one scheduling algorithm and stream its schedule to a file.
+    
+    The slices are written as the scheduler decides them, so the schedule is never held
+    in memory as a whole, and the metrics are accumulated as the processes complete.
+    This holds for .csv, .jsonl and .npy files; an .npz file is written column by column,
+    so the whole schedule is collected into a ScheduleTrace first.
+    
+    Args:
+        algorithm (str): One of ALGORITHMS.
+        processes (list or ProcessTable): The workload. It is not modified.
+        filename (str): Path to the output file (.csv, .jsonl, .npy or .npz; .csv and
+            .jsonl may be compressed, see ``write_schedule_to_file``).
+        quantum (int): Time quantum for the Round Robin algorithms.
+    
+    Returns:
+        tuple or None: (metrics, run), where run is a ProcessTable holding the per-process
+            results, or None if the schedule could not be written.
+    """
+    scheduler = create_scheduler(algorithm, quantum)
+    scheduler.accumulator = MetricsAccumulator()
+    run = as_workload(processes).new_run()
+    
+    if not write_schedule_to_file(scheduler.iter_schedule(run), filename):
+        return None
+    return scheduler.accumulator.metrics(), run
\ No newline at end of file
@@ -0,0 +1,181 @@
+"""
+Quantum Sweep Module
+This module evaluates the Round Robin algorithms over a range of time quanta.
+
+Every (algorithm, quantum) point is scheduled on the same loaded workload. Points are run
+in worker processes attached to a shared-memory copy of the workload, and their metrics
+are kept in a ResultCache keyed by (workload hash, algorithm, quantum, engine version), so
+a repeated or extended sweep only runs the new points.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from src.utils.metrics import calculate_metrics
+from src.simulation.cache import ResultCache, result_key, workload_hash
+from src.simulation.runner import as_workload, create_scheduler
+from src.simulation.parallel import SharedWorkload, attach_workload
+
+
+SWEEP_ALGORITHMS = ["rr", "priority_rr"]
+SWEEP_METRICS = ("avg_waiting_time", "avg_turnaround_time", "avg_response_time",
+                 "cpu_utilization", "throughput", "fairness_index", "avg_slowdown",
+                 "max_slowdown", "max_waiting_time", "context_switches", "total_time",
+                 "p50_waiting_time", "p95_waiting_time", "p99_waiting_time",
+                 "p50_response_time", "p95_response_time", "p99_response_time")
+MAXIMIZED_METRICS = {"cpu_utilization", "throughput", "fairness_index"}
+SWEEP_CACHE_ENTRIES = 4096
+
+_sweep_cache = ResultCache(max_entries=SWEEP_CACHE_ENTRIES)
+
+
+def parse_quanta(text):
+    """
+    Parse a quantum range or list.
+    
+    Accepts "start:stop" or "start:stop:step" (both ends included) and comma-separated
+    values such as "1,2,4,8".
+    
+    Args:
+        text (str): The quanta specification.
+    
+    Returns:
+        list: The quanta, in increasing order and without duplicates.
+    
+    Raises:
+        ValueError: If the specification is malformed or yields no positive quanta.
+    """
+    try:
+        if ':' in text:
+            bounds = [int(value) for value in text.split(':')]
+            if len(bounds) not in (2, 3) or (len(bounds) == 3 and bounds[2] < 1):
+                raise ValueError
+            step = bounds[2] if len(bounds) == 3 else 1
+            quanta = range(bounds[0], bounds[1] + 1, step)
+        else:
+            quanta = [int(value) for value in text.split(',') if value.strip()]
+    except ValueError:
+        raise ValueError(f"Invalid quantum range: {text}") from None
+    
+    quanta = sorted(set(quanta))
+    if not quanta:
+        raise ValueError(f"Empty quantum range: {text}")
+    if quanta[0] < 1:
+        raise ValueError(f"Quanta must be positive integers: {text}")
+    return quanta
+
+
+def clear_sweep_cache():
+    """Forget the cached sweep results."""
+    _sweep_cache.clear()
+
+
+def sweep_quantum(processes, quanta, algorithms=None, metric="avg_waiting_time",
+                  parallel=None, max_workers=None):
+    """
+    Evaluate Round Robin algorithms over a set of time quanta.
+    
+    Args:
+        processes (list or ProcessTable): The workload. It is not modified.
+        quanta (iterable): Time quanta to evaluate.
+        algorithms (list, optional): Algorithms to sweep (default: SWEEP_ALGORITHMS).
+        metric (str): Metric to optimize, one of SWEEP_METRICS. Metrics in
+            MAXIMIZED_METRICS are maximized, the others minimized.
+        parallel (bool, optional): Run the points in worker processes. By default this is
+            done when more than one CPU is available and more than one point is not cached.
+        max_workers (int, optional): Number of worker processes (default: number of CPUs).
+    
+    Returns:
+        dict: Per algorithm, a dict with "quanta" and "values" (the metric-vs-quantum
+            curve), "best_quantum", "best_value" and "metrics" (all the metrics of each
+            quantum).
+    
+    Raises:
+        ValueError: If the metric is not in SWEEP_METRICS.
+    """
+    if metric not in SWEEP_METRICS:
+        raise ValueError(f"Unknown sweep metric: {metric}")
+    
+    workload = as_workload(processes)
+    algorithms = list(algorithms or SWEEP_ALGORITHMS)
+    quanta = sorted(set(quanta))
+    digest = workload_hash(workload)
+    
+    points = {}
+    for algorithm in algorithms:
+        for quantum in quanta:
+            points[algorithm, quantum] = _sweep_cache.get(result_key(digest, algorithm, quantum,
+                                                                     kind="metrics"))
+    pending = [point for point, metrics in points.items() if metrics is None]
+    if parallel is None:
+        parallel = len(pending) > 1 and (os.cpu_count() or 1) > 1
+    
+    if parallel and pending:
+        with SharedWorkload(workload) as shared, ProcessPoolExecutor(max_workers) as executor:
+            futures = {
+                point: executor.submit(_sweep_shared, shared.name, shared.length, *point)
+                for point in pending
+            }
+            for point, future in futures.items():
+                points[point] = future.result()
+    else:
+        for algorithm, quantum in pending:
+            points[algorithm, quantum] = _sweep_point(workload, algorithm, quantum)
+    
+    for algorithm, quantum in pending:
+        _sweep_cache.put(result_key(digest, algorithm, quantum, kind="metrics"),
+                         points[algorithm, quantum])
+    
+    maximize = metric in MAXIMIZED_METRICS
+    results = {}
+    for algorithm in algorithms:
+        metrics = {quantum: points[algorithm, quantum] for quantum in quanta}
+        values = [metrics[quantum][metric] for quantum in quanta]
+        best = max(range(len(values)), key=values.__getitem__) if maximize else \
+            min(range(len(values)), key=values.__getitem__)
+        
+        results[algorithm] = {
+            "quanta": quanta,
+            "values": values,
+            "best_quantum": quanta[best],
+            "best_value": values[best],
+            "metrics": metrics
+        }
+    
+    return results
+
+
+def _sweep_point(workload, algorithm, quantum):
+    """
+    Schedule a workload with one algorithm and quantum.
+    
+    Args:
+        workload (ProcessTable): The workload.
+        algorithm (str): Algorithm name.
+        quantum (int): Time quantum.
+    
+    Returns:
+        dict: The metrics of the run.
+    """
+    run = workload.new_run()
+    schedule = create_scheduler(algorithm, quantum).schedule_trace(run)
+    return calculate_metrics(schedule, run)
+
+
+def _sweep_shared(name, length, algorithm, quantum):
+    """
+    Run one sweep point on a shared workload (executed in a worker process).
+    
+    Args:
+        name (str): Name of the shared memory block.
+        length (int): Number of processes.
+        algorithm (str): Algorithm name.
+        quantum (int): Time quantum.
+    
+    Returns:
+        dict: The metrics of the run.
+    """
+    shm = shared_memory.SharedMemory(name=name)
+    metrics = _sweep_point(attach_workload(shm, length), algorithm, quantum)
+    shm.close()
+    return metrics
@@ -4,14 +4,22 @@ This package contains utility functions for the CPU scheduler simulation.
 """
 
 from src.utils.metrics import calculate_metrics
+from src.utils.online_metrics import MetricsAccumulator, QuantileSketch
 from src.utils.process_generator import generate_random_processes, read_processes_from_file
+from src.utils.workload_generator import (WorkloadGenerator, synthesize_workload,
+                                         write_synthetic_workload)
 from src.utils.file_handler import read_processes_from_file as read_file
 from src.utils.file_handler import write_processes_to_file, write_results_to_file
 
 __all__ = [
     'calculate_metrics',
+    'MetricsAccumulator',
+    'QuantileSketch',
     'generate_random_processes',
     'read_processes_from_file',
+    'WorkloadGenerator',
+    'synthesize_workload',
+    'write_synthetic_workload',
     'read_file',
     'write_processes_to_file',
     'write_results_to_file'
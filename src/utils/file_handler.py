@@ -3,76 +3,782 @@ File Handler Module
 This module provides functions to read and write process data from/to files.
 """
 
+import bz2
 import csv
+import gzip
 import json
+import lzma
 import os
-from src.process import Process
+import struct
+import tempfile
+import warnings
+import zipfile
+from itertools import chain, islice
+import numpy as np
+from src.process import Process, ProcessTable
+from src.schedule_trace import ScheduleTrace
 
 
-def read_csv_file(filename):
+SCHEDULE_DTYPE = np.dtype([('pid', '<i4'), ('start', '<i8'), ('duration', '<i8')])
+NPY_HEADER_SIZE = 256
+PROCESS_FIELDS = ('pid', 'arrival_time', 'burst_time', 'priority')
+READ_CHUNK_SIZE = 65536
+SORT_MEMORY_ROWS = 1 << 22
+SPILL_RECORD_SIZE = 5 * 8
+MERGE_MIN_BLOCK = 1024
+BINARY_EXTENSIONS = ('.npy', '.npz')
+WORKLOAD_FLAGS = ('checked', 'sorted')
+COMPRESSION_EXTENSIONS = ('.gz', '.xz', '.bz2')
+
+
+def split_extension(filename):
+    """
+    Split the format and compression extensions of a file name.
+    
+    For example "trace.csv.gz" gives (".csv", ".gz") and "trace.csv" gives (".csv", None).
+    
+    Args:
+        filename (str): The file name.
+    
+    Returns:
+        tuple: (ext, compression), both lower-case and including the dot.
+    """
+    base, ext = os.path.splitext(filename)
+    ext = ext.lower()
+    if ext in COMPRESSION_EXTENSIONS:
+        return os.path.splitext(base)[1].lower(), ext
+    return ext, None
+
+
+def open_file(filename, mode='r', newline=None):
+    """
+    Open a file, compressing or decompressing it on the fly based on its extension.
+    
+    Names ending in .gz, .xz or .bz2 are opened through the gzip, lzma or bz2 module,
+    which (de)compress incrementally, so reading or writing them streams in constant
+    memory. Other names are opened as regular files.
+    
+    Args:
+        filename (str): Path to the file.
+        mode (str): 'r', 'w', 'rb' or 'wb'. Modes without 'b' open the file as text.
+        newline (str, optional): Newline handling of text files, as for ``open``.
+    
+    Returns:
+        file: The open file object.
+    """
+    _, compression = split_extension(filename)
+    if compression is None:
+        return open(filename, mode, newline=newline)
+    
+    if 'b' not in mode:
+        mode += 't'
+    if compression == '.gz':
+        return gzip.open(filename, mode, compresslevel=6, newline=newline)
+    elif compression == '.xz':
+        return lzma.open(filename, mode, newline=newline)
+    else:
+        return bz2.open(filename, mode, newline=newline)
+
+
+def _build_processes(rows, as_table):
+    """
+    Build the processes read from a file.
+    
+    Args:
+        rows (list): List of (pid, arrival_time, burst_time, priority) tuples.
+        as_table (bool): Whether to return a ProcessTable instead of a list.
+    
+    Returns:
+        list or ProcessTable: The processes.
+    """
+    if as_table:
+        if not rows:
+            return ProcessTable([], [], [], [])
+        return ProcessTable(*zip(*rows))
+    return [Process(pid, arrival_time, burst_time, priority)
+            for pid, arrival_time, burst_time, priority in rows]
+
+
+def read_csv_file(filename, as_table=False):
     """
     Read process data from a CSV file.
     
+    The file is parsed chunk by chunk (see ``iter_csv_chunks``); the processes are kept
+    in file order.
+    
     Args:
         filename (str): Path to the CSV file.
+        as_table (bool, optional): Return a ProcessTable instead of a list (default: False).
     
     Returns:
-        list: List of Process objects.
+        list or ProcessTable: The processes read from the file.
+    """
+    return _read_chunks(iter_csv_chunks(filename), filename, as_table)
+
+
+def read_json_file(filename, as_table=False):
     """
-    processes = []
+    Read process data from a JSON file.
     
+    The file is parsed record by record (see ``iter_json_chunks``); the processes are
+    kept in file order.
+    
+    Args:
+        filename (str): Path to the JSON file.
+        as_table (bool, optional): Return a ProcessTable instead of a list (default: False).
+    
+    Returns:
+        list or ProcessTable: The processes read from the file.
+    """
+    return _read_chunks(iter_json_chunks(filename), filename, as_table)
+
+
+def read_jsonl_file(filename, as_table=False):
+    """
+    Read process data from a JSON Lines file.
+    
+    The file is parsed line by line (see ``iter_jsonl_chunks``); the processes are kept
+    in file order.
+    
+    Args:
+        filename (str): Path to the JSONL file.
+        as_table (bool, optional): Return a ProcessTable instead of a list (default: False).
+    
+    Returns:
+        list or ProcessTable: The processes read from the file.
+    """
+    return _read_chunks(iter_jsonl_chunks(filename), filename, as_table)
+
+
+def _read_chunks(chunks, filename, as_table):
+    """
+    Collect the record chunks of a workload file.
+    
+    Args:
+        chunks (iterable): (n, 4) int64 arrays of (pid, arrival_time, burst_time, priority).
+        filename (str): Path to the file, for error messages.
+        as_table (bool): Whether to return a ProcessTable instead of a list.
+    
+    Returns:
+        list or ProcessTable: The processes, or none if the file could not be read.
+    """
     try:
-        with open(filename, 'r') as file:
-            reader = csv.DictReader(file)
-            
-            for row in reader:
-                pid = int(row['pid'])
-                arrival_time = int(row['arrival_time'])
-                burst_time = int(row['burst_time'])
-                priority = int(row.get('priority', 1))   
-                
-                processes.append(Process(pid, arrival_time, burst_time, priority))
+        records = list(chunks)
     
     except FileNotFoundError:
         print(f"Error: File '{filename}' not found.")
+        return _build_processes([], as_table)
     
     except (KeyError, ValueError) as e:
         print(f"Error: Invalid file format - {str(e)}")
+        return _build_processes([], as_table)
     
-    return processes
+    records = np.concatenate(records) if records else np.empty((0, 4), dtype=np.int64)
+    if as_table:
+        return ProcessTable(*np.ascontiguousarray(records.T))
+    return _build_processes(records.tolist(), as_table)
 
 
-def read_json_file(filename):
+def _check_records(records, numbers, label):
     """
-    Read process data from a JSON file.
+    Validate parsed process records.
+    
+    Args:
+        records (ndarray): (n, 4) int64 array of (pid, arrival_time, burst_time, priority).
+        numbers (list): Line or record number of each row, for error messages.
+        label (str): "line" or "record".
+    
+    Raises:
+        ValueError: If a row has a pid outside the 32-bit range, or a negative arrival time
+            or burst time.
+    """
+    bad_pid = (records[:, 0] < ProcessTable.PID_MIN) | (records[:, 0] > ProcessTable.PID_MAX)
+    invalid = bad_pid | (records[:, 1] < 0) | (records[:, 2] < 0)
+    if invalid.any():
+        row = int(np.argmax(invalid))
+        if bad_pid[row]:
+            field = f'pid {records[row, 0]} does not fit in a 32-bit process ID'
+        elif records[row, 1] < 0:
+            field = 'arrival_time must not be negative'
+        else:
+            field = 'burst_time must not be negative'
+        raise ValueError(f"{label} {numbers[row]}: {field}")
+
+
+def _parse_csv_lines(lines, first_line, indices, width):
+    """
+    Convert a chunk of CSV lines to records.
+    
+    The chunk is parsed at once by NumPy when every line has exactly ``width`` fields;
+    otherwise, or if that does not yield ``width`` integers per line (blank lines, quoted
+    fields or bad values), the lines are parsed as CSV one by one, which also reports the
+    first bad one.
+    
+    Args:
+        lines (list): Lines of the file, without the header.
+        first_line (int): Line number of the first line.
+        indices (list): Position of the pid, arrival_time, burst_time and priority fields
+            (None for a missing priority column).
+        width (int): Number of fields per line.
+    
+    Returns:
+        ndarray: (n, 4) int64 array of (pid, arrival_time, burst_time, priority).
+    
+    Raises:
+        ValueError: If a row is malformed, with its line number.
+    """
+    values = None
+    if all(line.count(',') == width - 1 for line in lines):
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter('error', DeprecationWarning)
+                values = np.fromstring(''.join(lines).replace('\n', ','), dtype=np.int64, sep=',')
+        except (DeprecationWarning, ValueError):
+            values = None
+    
+    if values is not None and len(values) == len(lines) * width:
+        fields = values.reshape(-1, width)
+        numbers = range(first_line, first_line + len(lines))
+        records = np.ones((len(lines), 4), dtype=np.int64)
+        for column, index in enumerate(indices):
+            if index is not None:
+                records[:, column] = fields[:, index]
+    else:
+        parsed, numbers = [], []
+        for offset, row in enumerate(csv.reader(lines)):
+            if not row:
+                continue
+            try:
+                parsed.append([int(row[index]) if index is not None else 1 for index in indices])
+            except (ValueError, IndexError):
+                raise ValueError(f"line {first_line + offset}: invalid row {row}") from None
+            numbers.append(first_line + offset)
+        records = np.array(parsed, dtype=np.int64).reshape(-1, 4)
+    
+    _check_records(records, numbers, 'line')
+    return records
+
+
+def iter_csv_chunks(filename, chunk_size=READ_CHUNK_SIZE):
+    """
+    Parse a CSV workload file in chunks of typed records.
+    
+    The file should have columns: pid, arrival_time, burst_time and optionally priority
+    (default 1), in any order. Only one chunk of lines is held in memory at a time.
+    
+    Args:
+        filename (str): Path to the CSV file.
+        chunk_size (int): Number of lines per chunk.
+    
+    Yields:
+        ndarray: (n, 4) int64 arrays of (pid, arrival_time, burst_time, priority).
+    
+    Raises:
+        KeyError: If a required column is missing.
+        ValueError: If a row is malformed, with its line number.
+    """
+    with open_file(filename, 'r', newline='') as file:
+        header = [name.strip() for name in next(csv.reader([file.readline()]), [])]
+        indices = [header.index(name) if name in header else None for name in PROCESS_FIELDS]
+        missing = [name for name, index in zip(PROCESS_FIELDS[:3], indices) if index is None]
+        if missing:
+            raise KeyError(missing[0])
+        
+        line = 2
+        while True:
+            lines = list(islice(file, chunk_size))
+            if not lines:
+                break
+            yield _parse_csv_lines(lines, line, indices, len(header))
+            line += len(lines)
+
+
+def _iter_json_array(file, block_size=1 << 20):
+    """
+    Decode the elements of a top-level JSON array incrementally.
+    
+    At most about two blocks are buffered: an element that still does not decode once
+    ``block_size`` characters from its start are buffered is reported as malformed, so
+    elements are limited to ``block_size`` characters.
+    
+    Args:
+        file (file): Text file holding a JSON array.
+        block_size (int): Number of characters read at a time.
+    
+    Yields:
+        object: The decoded elements, in order.
+    
+    Raises:
+        ValueError: If the file is not a well-formed JSON array, with the number of the
+            record at fault.
+    """
+    decoder = json.JSONDecoder()
+    buffer = file.read(block_size).lstrip()
+    if not buffer.startswith('['):
+        raise ValueError("expected a JSON array of processes")
+    position = 1
+    count = 0
+    eof = False
+    expect_value = True
+    
+    while True:
+        while True:
+            while position < len(buffer) and buffer[position] in ' \t\r\n':
+                position += 1
+            if position < len(buffer) or eof:
+                break
+            block = file.read(block_size)
+            eof = not block
+            buffer, position = buffer[position:] + block, 0
+        
+        if position == len(buffer):
+            raise ValueError("unterminated JSON array")
+        if buffer[position] == ']':
+            if expect_value and count:
+                raise ValueError(f"after record {count}: trailing ',' before ']'")
+            _check_json_end(file, buffer[position + 1:], block_size, count)
+            return
+        if not expect_value:
+            if buffer[position] != ',':
+                raise ValueError(f"after record {count}: expected ',' or ']'")
+            position += 1
+            expect_value = True
+            continue
+        
+        try:
+            element, end = decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError as e:
+            if eof:
+                raise ValueError(f"record {count + 1}: {e.msg}") from None
+            if len(buffer) - position >= block_size:
+                raise ValueError(f"record {count + 1}: {e.msg} (or longer than "
+                                 f"{block_size} characters)") from None
+            block = file.read(block_size)
+            eof = not block
+            buffer, position = buffer[position:] + block, 0
+            continue
+        
+        if end == len(buffer) and not eof:
+            block = file.read(block_size)
+            if block:
+                buffer, position = buffer[position:] + block, 0
+                continue
+            eof = True
+        
+        yield element
+        count += 1
+        position = end
+        expect_value = False
+
+
+def _check_json_end(file, rest, block_size, count):
+    """
+    Check that only whitespace follows the closing bracket of a JSON array.
+    
+    Args:
+        file (file): Text file positioned after ``rest``.
+        rest (str): Buffered text following the closing bracket.
+        block_size (int): Number of characters read at a time.
+        count (int): Number of records in the array, for error messages.
+    
+    Raises:
+        ValueError: If anything but whitespace follows the array.
+    """
+    while rest:
+        if rest.strip():
+            raise ValueError(f"after record {count}: unexpected data after the JSON array")
+        rest = file.read(block_size)
+
+
+def iter_json_chunks(filename, chunk_size=READ_CHUNK_SIZE):
+    """
+    Parse a JSON workload file in chunks of typed records.
+    
+    The file should hold an array of objects with keys pid, arrival_time, burst_time and
+    optionally priority (default 1). The array is decoded element by element, so only one
+    chunk of records is held in memory at a time.
     
     Args:
         filename (str): Path to the JSON file.
+        chunk_size (int): Number of records per chunk.
+    
+    Yields:
+        ndarray: (n, 4) int64 arrays of (pid, arrival_time, burst_time, priority).
+    
+    Raises:
+        ValueError: If a record is malformed, with its record number.
+    """
+    with open_file(filename, 'r') as file:
+        yield from _chunk_json_objects(enumerate(_iter_json_array(file), 1), chunk_size,
+                                       'record')
+
+
+def _iter_json_lines(file):
+    """
+    Decode a JSON Lines file line by line.
+    
+    Args:
+        file (file): Text file with one JSON value per line.
+    
+    Yields:
+        tuple: (line_number, value) for each non-blank line.
+    
+    Raises:
+        ValueError: If a line is not valid JSON, with its line number.
+    """
+    for number, line in enumerate(file, 1):
+        if not line.strip():
+            continue
+        try:
+            yield number, json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"line {number}: {e.msg}") from None
+
+
+def iter_jsonl_chunks(filename, chunk_size=READ_CHUNK_SIZE):
+    """
+    Parse a JSON Lines workload file in chunks of typed records.
+    
+    Each line holds one object with keys pid, arrival_time, burst_time and optionally
+    priority (default 1). Lines are decoded one at a time, so only one chunk of records
+    is held in memory at a time.
+    
+    Args:
+        filename (str): Path to the JSONL file.
+        chunk_size (int): Number of records per chunk.
+    
+    Yields:
+        ndarray: (n, 4) int64 arrays of (pid, arrival_time, burst_time, priority).
+    
+    Raises:
+        ValueError: If a line is malformed, with its line number.
+    """
+    with open_file(filename, 'r') as file:
+        yield from _chunk_json_objects(_iter_json_lines(file), chunk_size, 'line')
+
+
+def _chunk_json_objects(objects, chunk_size, label):
+    """
+    Convert decoded JSON process objects to chunks of typed records.
+    
+    Args:
+        objects (iterable): (number, object) pairs.
+        chunk_size (int): Number of records per chunk.
+        label (str): "line" or "record", for error messages.
+    
+    Yields:
+        ndarray: (n, 4) int64 arrays of (pid, arrival_time, burst_time, priority).
+    
+    Raises:
+        ValueError: If an object is malformed, with its number.
+    """
+    rows, numbers = [], []
+    for number, process_data in objects:
+        try:
+            rows.append((int(process_data['pid']), int(process_data['arrival_time']),
+                         int(process_data['burst_time']),
+                         int(process_data.get('priority', 1))))
+        except (KeyError, TypeError, ValueError, AttributeError) as e:
+            raise ValueError(f"{label} {number}: invalid process {process_data!r} "
+                             f"({type(e).__name__}: {e})") from None
+        numbers.append(number)
+        
+        if len(rows) == chunk_size:
+            records = np.array(rows, dtype=np.int64)
+            _check_records(records, numbers, label)
+            yield records
+            rows, numbers = [], []
+    
+    if rows:
+        records = np.array(rows, dtype=np.int64)
+        _check_records(records, numbers, label)
+        yield records
+
+
+def iter_process_chunks(filename, chunk_size=READ_CHUNK_SIZE):
+    """
+    Parse a CSV, JSON or JSON Lines workload file, based on its extension, in chunks.
+    
+    Args:
+        filename (str): Path to the input file.
+        chunk_size (int): Number of records per chunk.
     
     Returns:
-        list: List of Process objects.
+        iterator: (n, 4) int64 arrays of (pid, arrival_time, burst_time, priority).
+    
+    Raises:
+        ValueError: If the extension is not supported.
     """
-    processes = []
+    ext, compression = split_extension(filename)
     
+    if ext == '.csv':
+        return iter_csv_chunks(filename, chunk_size)
+    elif ext == '.json':
+        return iter_json_chunks(filename, chunk_size)
+    elif ext == '.jsonl':
+        return iter_jsonl_chunks(filename, chunk_size)
+    else:
+        raise ValueError(f"Unsupported file format '{ext}{compression or ''}'")
+
+
+def load_processes(filename, output=None, chunk_size=READ_CHUNK_SIZE, memory_rows=SORT_MEMORY_ROWS):
+    """
+    Load a workload into a ProcessTable sorted by arrival time, with bounded memory.
+    
+    Binary (.npy/.npz) workloads are memory-mapped (see ``read_workload_binary``) and only
+    copied if they are not sorted by arrival time, which is only checked for files that
+    are not flagged as sorted.
+    
+    CSV, JSON and JSONL files, optionally compressed (see ``open_file``), are parsed chunk
+    by chunk. While the records are sorted by arrival time they go straight to the table
+    (or to ``output``), so a sorted file is never spilled. From the first record out of
+    order on, records are buffered up to ``memory_rows`` rows; beyond that the buffer is
+    sorted and spilled to a temporary file as a run, and the runs are combined with an
+    external merge sort. Ties keep the file order. With ``output``, the table columns are
+    written to that .npy file, as a (4, n) int64 array stored in column-major order (one
+    record of four values per process, so records can be appended as they are parsed),
+    and memory-mapped, so the table itself is not held in memory either.
+    
+    Args:
+        filename (str): Path to the input file.
+        output (str, optional): Path of a .npy file to hold the table columns.
+        chunk_size (int): Number of records parsed at a time.
+        memory_rows (int): Maximum number of records buffered in memory.
+    
+    Returns:
+        ProcessTable: The processes sorted by arrival time (empty if the file could not
+            be read).
+    """
     try:
-        with open(filename, 'r') as file:
-            data = json.load(file)
-            
-            for process_data in data:
-                pid = int(process_data['pid'])
-                arrival_time = int(process_data['arrival_time'])
-                burst_time = int(process_data['burst_time'])
-                priority = int(process_data.get('priority', 1))   
-                
-                processes.append(Process(pid, arrival_time, burst_time, priority))
+        if split_extension(filename) in [(ext, None) for ext in BINARY_EXTENSIONS]:
+            table, flags = _open_workload_binary(filename)
+            if 'sorted' not in flags and (table.arrival_time[1:] < table.arrival_time[:-1]).any():
+                table.sort_by_arrival()
+            return table
+        
+        with tempfile.TemporaryFile() as spill:
+            return _load_sorted(iter_process_chunks(filename, chunk_size), spill, output,
+                                memory_rows)
     
     except FileNotFoundError:
         print(f"Error: File '{filename}' not found.")
     
-    except (json.JSONDecodeError, KeyError, ValueError) as e:
+    except (KeyError, ValueError, zipfile.BadZipFile) as e:
         print(f"Error: Invalid file format - {str(e)}")
     
-    return processes
+    return ProcessTable([], [], [], [])
+
+
+def _load_sorted(chunks, spill, output, memory_rows):
+    """
+    Sort parsed record chunks by arrival time, spilling sorted runs to disk as needed.
+    
+    Chunks are handed straight to the destination for as long as they are sorted: they
+    are written to ``output`` as they arrive, or, without an output, kept as they are to
+    become the table. Runs only start at the first chunk out of order; the records
+    handed over so far then become the first run.
+    
+    Args:
+        chunks (iterable): (n, 4) int64 record arrays, in file order.
+        spill (file): Binary temporary file for the runs.
+        output (str or None): Path of a .npy file to hold the table columns.
+        memory_rows (int): Maximum number of records buffered in memory.
+    
+    Returns:
+        ProcessTable: The processes sorted by arrival time.
+    """
+    chunks = iter(chunks)
+    buffered, runs = [], []
+    
+    if output is None:
+        prefix = []
+        length, records = _read_sorted_prefix(chunks, prefix.append)
+        if records is None:
+            columns = np.empty((4, length), dtype=np.int64)
+            written = 0
+            for records in prefix:
+                columns[:, written:written + len(records)] = records.T
+                written += len(records)
+            return ProcessTable.from_columns(*columns)
+        
+        written = 0
+        for sorted_records in prefix:
+            sequence = np.arange(written, written + len(sorted_records), dtype=np.int64)[:, None]
+            buffered.append(np.hstack((sorted_records, sequence)))
+            written += len(sorted_records)
+        del prefix
+    else:
+        with open(output, 'wb+') as sink:
+            _write_npy_header(sink, np.int64, (4, 0), fortran_order=True)
+            length, records = _read_sorted_prefix(chunks, lambda records: records.tofile(sink))
+            if records is None:
+                sink.seek(0)
+                _write_npy_header(sink, np.int64, (4, length), fortran_order=True,
+                                  flags=('sorted',))
+            elif length:
+                runs.append(_spill_sorted(spill, sink, length, memory_rows))
+        if records is None:
+            return ProcessTable.from_columns(*np.load(output, mmap_mode='r+'))
+    
+    buffered_rows = sum(len(sorted_records) for sorted_records in buffered)
+    for records in chain([records], chunks):
+        sequence = np.arange(length, length + len(records), dtype=np.int64)[:, None]
+        buffered.append(np.hstack((records, sequence)))
+        buffered_rows += len(records)
+        length += len(records)
+        if buffered_rows >= memory_rows:
+            runs.append(_spill_run(spill, buffered, runs))
+            buffered, buffered_rows = [], 0
+    
+    if output is not None:
+        with open(output, 'wb') as sink:
+            _write_npy_header(sink, np.int64, (4, length), fortran_order=True, flags=('sorted',))
+            sink.truncate(NPY_HEADER_SIZE + 4 * 8 * length)
+        columns = np.memmap(output, dtype=np.int64, mode='r+', offset=NPY_HEADER_SIZE,
+                            shape=(4, length), order='F')
+    else:
+        columns = np.empty((4, length), dtype=np.int64)
+    
+    if not runs:
+        records = np.concatenate(buffered)
+        columns[:] = records[np.argsort(records[:, 1], kind='stable'), :4].T
+    else:
+        if buffered:
+            runs.append(_spill_run(spill, buffered, runs))
+        _merge_runs(spill, runs, columns, memory_rows)
+    
+    if output is not None:
+        columns.flush()
+    return ProcessTable.from_columns(*columns)
+
+
+def _read_sorted_prefix(chunks, write):
+    """
+    Hand over record chunks for as long as they are sorted by arrival time.
+    
+    Args:
+        chunks (iterator): (n, 4) int64 record arrays, in file order.
+        write (callable): Called with each chunk that keeps the records sorted.
+    
+    Returns:
+        tuple: (length, records), the number of records handed over and the first chunk
+            out of order, or None if all the chunks were sorted.
+    """
+    length = 0
+    last_arrival = None
+    for records in chunks:
+        arrivals = records[:, 1]
+        if not len(arrivals):
+            continue
+        if (last_arrival is not None and arrivals[0] < last_arrival) or \
+                (arrivals[1:] < arrivals[:-1]).any():
+            return length, records
+        write(records)
+        length += len(records)
+        last_arrival = arrivals[-1]
+    return length, None
+
+
+def _spill_sorted(spill, sink, length, memory_rows):
+    """
+    Copy the sorted records already written to an output file to the spill file as a run.
+    
+    Args:
+        spill (file): Binary temporary file for the runs, still empty.
+        sink (file): Output file holding ``length`` records after its .npy header.
+        length (int): Number of records in the output file.
+        memory_rows (int): Maximum number of records copied at once.
+    
+    Returns:
+        tuple: (offset, length) of the run, in rows.
+    """
+    sink.seek(NPY_HEADER_SIZE)
+    spill.seek(0)
+    for start in range(0, length, memory_rows):
+        count = min(memory_rows, length - start)
+        records = np.fromfile(sink, dtype=np.int64, count=count * 4).reshape(-1, 4)
+        sequence = np.arange(start, start + count, dtype=np.int64)[:, None]
+        np.hstack((records, sequence)).tofile(spill)
+    return 0, length
+
+
+def _spill_run(spill, buffered, runs):
+    """
+    Sort buffered records and append them to the spill file as a run.
+    
+    Args:
+        spill (file): Binary temporary file for the runs.
+        buffered (list): (n, 5) int64 arrays of records followed by their file position.
+        runs (list): The (offset, length) of the runs already spilled, in rows.
+    
+    Returns:
+        tuple: (offset, length) of the new run, in rows.
+    """
+    records = np.concatenate(buffered)
+    records = records[np.argsort(records[:, 1], kind='stable')]
+    offset = runs[-1][0] + runs[-1][1] if runs else 0
+    spill.seek(offset * SPILL_RECORD_SIZE)
+    records.tofile(spill)
+    return offset, len(records)
+
+
+def _read_run(spill, offset, count):
+    """Read ``count`` spilled records starting at row ``offset``."""
+    spill.seek(offset * SPILL_RECORD_SIZE)
+    return np.fromfile(spill, dtype=np.int64, count=count * 5).reshape(-1, 5)
+
+
+def _merge_runs(spill, runs, columns, memory_rows):
+    """
+    Merge sorted runs of the spill file into the table columns.
+    
+    Records are ordered by (arrival_time, file position), which is unique. Each round
+    loads a block of every run (at least MERGE_MIN_BLOCK records), takes the smallest
+    last key among the runs that still have records on disk as a cutoff, and writes out
+    every buffered record up to it, vectorized.
+    
+    Args:
+        spill (file): Binary temporary file holding the runs.
+        runs (list): The (offset, length) of each run, in rows.
+        columns (ndarray): (4, n) int64 output array.
+        memory_rows (int): Maximum number of records buffered in memory.
+    """
+    block = max(MERGE_MIN_BLOCK, memory_rows // (2 * len(runs)))
+    written = 0
+    
+    positions = [offset for offset, _ in runs]
+    ends = [offset + length for offset, length in runs]
+    buffers = []
+    for run in range(len(runs)):
+        buffers.append(_read_run(spill, positions[run], min(block, ends[run] - positions[run])))
+        positions[run] += len(buffers[run])
+    
+    while any(len(buffer) for buffer in buffers):
+        pending = [(buffer[-1, 1], buffer[-1, 4]) for run, buffer in enumerate(buffers)
+                   if positions[run] < ends[run]]
+        cutoff = min(pending) if pending else None
+        
+        taken = []
+        for run, buffer in enumerate(buffers):
+            if cutoff is None:
+                count = len(buffer)
+            else:
+                low = np.searchsorted(buffer[:, 1], cutoff[0], side='left')
+                high = np.searchsorted(buffer[:, 1], cutoff[0], side='right')
+                count = low + np.searchsorted(buffer[low:high, 4], cutoff[1], side='right')
+            taken.append(buffer[:count])
+            buffers[run] = buffer[count:]
+        
+        records = np.concatenate(taken)
+        records = records[np.lexsort((records[:, 4], records[:, 1]))]
+        columns[:, written:written + len(records)] = records[:, :4].T
+        written += len(records)
+        
+        for run in range(len(runs)):
+            if not len(buffers[run]) and positions[run] < ends[run]:
+                buffers[run] = _read_run(spill, positions[run],
+                                         min(block, ends[run] - positions[run]))
+                positions[run] += len(buffers[run])
 
 
 def write_csv_file(processes, filename):
@@ -80,27 +786,35 @@ def write_csv_file(processes, filename):
     Write process data to a CSV file.
     
     Args:
-        processes (list): List of Process objects.
+        processes (list or ProcessTable): Processes to write.
         filename (str): Path to the CSV file.
     
     Returns:
         bool: True if successful, False otherwise.
     """
     try:
-        with open(filename, 'w', newline='') as file:
+        with open_file(filename, 'w', newline='') as file:
             writer = csv.writer(file)
             
              
             writer.writerow(['pid', 'arrival_time', 'burst_time', 'priority'])
             
              
-            for process in processes:
-                writer.writerow([
-                    process.pid,
-                    process.arrival_time,
-                    process.burst_time,
-                    process.priority
-                ])
+            if isinstance(processes, ProcessTable):
+                writer.writerows(zip(
+                    processes.pid.tolist(),
+                    processes.arrival_time.tolist(),
+                    processes.burst_time.tolist(),
+                    processes.priority.tolist()
+                ))
+            else:
+                for process in processes:
+                    writer.writerow([
+                        process.pid,
+                        process.arrival_time,
+                        process.burst_time,
+                        process.priority
+                    ])
         
         return True
     
@@ -113,26 +827,336 @@ def write_json_file(processes, filename):
     """
     Write process data to a JSON file.
     
+    The array is written one record at a time, so the file is never built in memory.
+    
     Args:
-        processes (list): List of Process objects.
+        processes (list or ProcessTable): Processes to write.
         filename (str): Path to the JSON file.
     
     Returns:
         bool: True if successful, False otherwise.
     """
     try:
-        process_data = []
+        with open_file(filename, 'w') as file:
+            separator = '[\n'
+            for pid, arrival_time, burst_time, priority in _workload_rows(processes):
+                process_data = {
+                    'pid': pid,
+                    'arrival_time': arrival_time,
+                    'burst_time': burst_time,
+                    'priority': priority
+                }
+                record = json.dumps(process_data, indent=4).replace('\n', '\n    ')
+                file.write(f"{separator}    {record}")
+                separator = ',\n'
+            file.write('\n]' if separator == ',\n' else '[]')
+        
+        return True
+    
+    except Exception as e:
+        print(f"Error writing to file: {str(e)}")
+        return False
+
+
+def _workload_rows(processes):
+    """
+    Iterate over the workload fields of processes.
+    
+    Args:
+        processes (list or ProcessTable): The processes.
+    
+    Returns:
+        iterator: (pid, arrival_time, burst_time, priority) tuples.
+    """
+    if isinstance(processes, ProcessTable):
+        return zip(
+            processes.pid.tolist(),
+            processes.arrival_time.tolist(),
+            processes.burst_time.tolist(),
+            processes.priority.tolist()
+        )
+    return ((process.pid, process.arrival_time, process.burst_time, process.priority)
+            for process in processes)
+
+
+def write_jsonl_file(processes, filename):
+    """
+    Write process data to a JSON Lines file, one object per line.
+    
+    Args:
+        processes (list or ProcessTable): Processes to write.
+        filename (str): Path to the JSONL file.
+    
+    Returns:
+        bool: True if successful, False otherwise.
+    """
+    try:
+        with open_file(filename, 'w') as file:
+            for pid, arrival_time, burst_time, priority in _workload_rows(processes):
+                file.write(json.dumps({
+                    'pid': pid,
+                    'arrival_time': arrival_time,
+                    'burst_time': burst_time,
+                    'priority': priority
+                }) + '\n')
+        
+        return True
+    
+    except Exception as e:
+        print(f"Error writing to file: {str(e)}")
+        return False
+
+
+def _result_rows(processes, chunk_size=READ_CHUNK_SIZE):
+    """
+    Iterate over the per-process results of a run, one chunk of columns at a time.
+    
+    Args:
+        processes (list or ProcessTable): The processes of a completed run.
+        chunk_size (int): Number of processes converted at once.
+    
+    Yields:
+        dict: The workload fields, start and finish times (None if unset), waiting,
+            turnaround and response times of each process.
+    """
+    if not isinstance(processes, ProcessTable):
+        processes = ProcessTable.from_processes(processes)
+    
+    for start in range(0, len(processes), chunk_size):
+        columns = [getattr(processes, name)[start:start + chunk_size].tolist()
+                   for name in ProcessTable.COLUMNS]
+        for (pid, arrival_time, burst_time, priority, _, start_time, finish_time,
+             waiting_time, turnaround_time) in zip(*columns):
+            started = start_time != ProcessTable.UNSET
+            yield {
+                'pid': pid,
+                'arrival_time': arrival_time,
+                'burst_time': burst_time,
+                'priority': priority,
+                'start_time': start_time if started else None,
+                'finish_time': finish_time if finish_time != ProcessTable.UNSET else None,
+                'waiting_time': waiting_time,
+                'turnaround_time': turnaround_time,
+                'response_time': start_time - arrival_time if started else None
+            }
+
+
+def write_process_results_jsonl(processes, filename, algorithm=None, append=False):
+    """
+    Stream the per-process results of a run to a JSON Lines file, one object per line.
+    
+    Args:
+        processes (list or ProcessTable): The processes of a completed run.
+        filename (str): Path to the output file, optionally compressed (see ``open_file``).
+        algorithm (str, optional): Algorithm name added to every line.
+        append (bool, optional): Append to the file instead of overwriting it, e.g. to
+            write several algorithms to one file.
+    
+    Returns:
+        bool: True if successful, False otherwise.
+    """
+    try:
+        with open_file(filename, 'a' if append else 'w') as file:
+            for result in _result_rows(processes):
+                if algorithm is not None:
+                    result = {'algorithm': algorithm, **result}
+                file.write(json.dumps(result) + '\n')
         
-        for process in processes:
-            process_data.append({
-                'pid': process.pid,
-                'arrival_time': process.arrival_time,
-                'burst_time': process.burst_time,
-                'priority': process.priority
-            })
+        return True
+    
+    except Exception as e:
+        print(f"Error writing results to file: {str(e)}")
+        return False
+
+
+def _extension(filename):
+    """
+    Get the lower-case format extension of a file name, ignoring any compression suffix.
+    
+    Args:
+        filename (str): The file name.
+    
+    Returns:
+        str: The extension, including the dot.
+    """
+    return split_extension(filename)[0]
+
+
+def _memmap_npz(filename):
+    """
+    Memory-map the arrays stored in an uncompressed .npz file.
+    
+    The members of an uncompressed zip archive are stored contiguously, so each array
+    can be mapped in place from its offset in the archive. Compressed members cannot be
+    mapped and are read into memory instead.
+    
+    Args:
+        filename (str): Path to the .npz file.
+    
+    Returns:
+        dict: The arrays, keyed by name.
+    """
+    arrays = {}
+    with zipfile.ZipFile(filename) as archive, open(filename, 'rb') as file:
+        for info in archive.infolist():
+            name = info.filename[:-4] if info.filename.endswith('.npy') else info.filename
+            if info.compress_type != zipfile.ZIP_STORED:
+                with archive.open(info) as member:
+                    arrays[name] = np.lib.format.read_array(member)
+                continue
+            
+            file.seek(info.header_offset + 26)
+            name_length, extra_length = struct.unpack('<HH', file.read(4))
+            file.seek(info.header_offset + 30 + name_length + extra_length)
+            version = np.lib.format.read_magic(file)
+            if version == (1, 0):
+                shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(file)
+            else:
+                shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(file)
+            arrays[name] = np.memmap(file, dtype=dtype, mode='r', offset=file.tell(),
+                                     shape=shape, order='F' if fortran_order else 'C')
+    
+    return arrays
+
+
+def read_workload_binary(filename, as_table=True):
+    """
+    Open a binary workload file without copying it.
+    
+    A .npy file holds a (4, n) int64 array whose rows are the pid, arrival_time,
+    burst_time and priority columns; a .npz file holds one int64 array per column, named
+    after it. The columns are memory-mapped read-only, so opening a file is quick whatever
+    its size, and pages are only read from disk when they are used.
+    
+    Files written by ``write_workload_binary`` are flagged as checked, and their columns
+    are used as they are. Other files are validated with a vectorized pass over the
+    columns (see ``_check_workload_columns``).
+    
+    Args:
+        filename (str): Path to the .npy or .npz file.
+        as_table (bool, optional): Return a ProcessTable (default) instead of a list.
+    
+    Returns:
+        ProcessTable or list: The processes, in file order.
+    
+    Raises:
+        ValueError: If the file does not hold a valid workload.
+    """
+    table, _ = _open_workload_binary(filename)
+    return table if as_table else table.to_processes()
+
+
+def _open_workload_binary(filename):
+    """
+    Memory-map a binary workload file and read its flags.
+    
+    Args:
+        filename (str): Path to the .npy or .npz file.
+    
+    Returns:
+        tuple: (table, flags), the ProcessTable and the set of WORKLOAD_FLAGS recorded
+            in the file.
+    
+    Raises:
+        ValueError: If the file does not hold a valid workload.
+    """
+    if _extension(filename) == '.npz':
+        arrays = _memmap_npz(filename)
+        missing = [name for name in PROCESS_FIELDS if name not in arrays]
+        if missing:
+            raise ValueError(f"Missing workload column '{missing[0]}'")
+        columns = [arrays[name] for name in PROCESS_FIELDS]
+        flags = set(np.asarray(arrays['flags']).tolist()) if 'flags' in arrays else set()
+    else:
+        columns = np.load(filename, mmap_mode='r')
+        if columns.ndim != 2 or columns.shape[0] != len(PROCESS_FIELDS):
+            raise ValueError(f"Expected a ({len(PROCESS_FIELDS)}, n) array, got {columns.shape}")
+        flags = _read_npy_flags(filename)
+    
+    if any(column.dtype != np.int64 for column in columns):
+        columns = [np.asarray(column, dtype=np.int64) for column in columns]
+    
+    table = ProcessTable.from_columns(*columns)
+    if 'checked' not in flags:
+        _check_workload_columns(table)
+    return table, flags & set(WORKLOAD_FLAGS)
+
+
+def _read_npy_flags(filename):
+    """
+    Read the WORKLOAD_FLAGS recorded after the header dictionary of a .npy file.
+    
+    Args:
+        filename (str): Path to the .npy file.
+    
+    Returns:
+        set: The flags (empty for files written by other tools).
+    """
+    with open(filename, 'rb') as file:
+        version = np.lib.format.read_magic(file)
+        size_format = '<H' if version == (1, 0) else '<I'
+        size = struct.unpack(size_format, file.read(struct.calcsize(size_format)))[0]
+        header = file.read(size).decode('latin1')
+    _, _, comment = header.partition('#')
+    return set(comment.split())
+
+
+def _check_workload_columns(processes):
+    """
+    Validate the columns of a workload with vectorized checks.
+    
+    Args:
+        processes (ProcessTable): The workload.
+    
+    Raises:
+        ValueError: If a pid is outside the 32-bit range or appears twice, or an arrival
+            time or burst time is negative, with the (1-based) number of the process.
+    """
+    ProcessTable.check_pids(processes.pid)
+    for name in ('arrival_time', 'burst_time'):
+        negative = getattr(processes, name) < 0
+        if negative.any():
+            raise ValueError(f"process {int(np.argmax(negative)) + 1}: {name} must not be negative")
+    
+    pids = np.sort(processes.pid)
+    duplicates = np.flatnonzero(pids[1:] == pids[:-1])
+    if len(duplicates):
+        pid = int(pids[duplicates[0]])
+        row = int(np.flatnonzero(processes.pid == pid)[1])
+        raise ValueError(f"process {row + 1}: duplicate pid {pid}")
+
+
+def write_workload_binary(processes, filename):
+    """
+    Write a workload to a binary .npy or .npz file (see ``read_workload_binary``).
+    
+    The workload is validated first (see ``_check_workload_columns``), and the file is
+    flagged as checked, and as sorted if the processes are in arrival order, so reopening
+    it needs no pass over the columns.
+    
+    Args:
+        processes (list or ProcessTable): Processes to write.
+        filename (str): Path to the output file.
+    
+    Returns:
+        bool: True if successful, False otherwise.
+    """
+    try:
+        if not isinstance(processes, ProcessTable):
+            processes = ProcessTable.from_processes(processes)
+        _check_workload_columns(processes)
+        arrivals = processes.arrival_time
+        flags = WORKLOAD_FLAGS if not (arrivals[1:] < arrivals[:-1]).any() else ('checked',)
         
-        with open(filename, 'w') as file:
-            json.dump(process_data, file, indent=4)
+        if _extension(filename) == '.npz':
+            np.savez(filename, flags=np.array(flags),
+                     **{name: getattr(processes, name) for name in PROCESS_FIELDS})
+        else:
+            with open(filename, 'wb') as file:
+                _write_npy_header(file, np.int64, (len(PROCESS_FIELDS), len(processes)),
+                                  flags=flags)
+                for name in PROCESS_FIELDS:
+                    getattr(processes, name).astype(np.int64, copy=False).tofile(file)
         
         return True
     
@@ -141,52 +1165,74 @@ def write_json_file(processes, filename):
         return False
 
 
-def read_processes_from_file(filename):
+def read_processes_from_file(filename, as_table=False):
     """
     Read processes from a file based on its extension.
     
+    CSV, JSON and JSONL files may be compressed, with a .gz, .xz or .bz2 suffix (e.g.
+    "trace.csv.gz"); they are decompressed on the fly.
+    
     Args:
         filename (str): Path to the input file.
+        as_table (bool, optional): Return a ProcessTable instead of a list (default: False).
     
     Returns:
-        list: List of Process objects.
+        list or ProcessTable: The processes read from the file.
     """
-    _, ext = os.path.splitext(filename)
+    ext, compression = split_extension(filename)
     
-    if ext.lower() == '.csv':
-        return read_csv_file(filename)
-    elif ext.lower() == '.json':
-        return read_json_file(filename)
+    if ext == '.csv':
+        return read_csv_file(filename, as_table)
+    elif ext == '.json':
+        return read_json_file(filename, as_table)
+    elif ext == '.jsonl':
+        return read_jsonl_file(filename, as_table)
+    elif ext in BINARY_EXTENSIONS and compression is None:
+        try:
+            return read_workload_binary(filename, as_table)
+        except FileNotFoundError:
+            print(f"Error: File '{filename}' not found.")
+        except (ValueError, OSError, zipfile.BadZipFile) as e:
+            print(f"Error: Invalid file format - {str(e)}")
+        return _build_processes([], as_table)
     else:
-        print(f"Error: Unsupported file format '{ext}'")
-        return []
+        print(f"Error: Unsupported file format '{ext}{compression or ''}'")
+        return _build_processes([], as_table)
 
 
 def write_processes_to_file(processes, filename):
     """
     Write processes to a file based on its extension.
     
+    CSV, JSON and JSONL files are compressed on the fly if the name ends with .gz, .xz or
+    .bz2.
+    
     Args:
-        processes (list): List of Process objects.
+        processes (list or ProcessTable): Processes to write.
         filename (str): Path to the output file.
     
     Returns:
         bool: True if successful, False otherwise.
     """
-    _, ext = os.path.splitext(filename)
+    ext, compression = split_extension(filename)
     
-    if ext.lower() == '.csv':
+    if ext == '.csv':
         return write_csv_file(processes, filename)
-    elif ext.lower() == '.json':
+    elif ext == '.json':
         return write_json_file(processes, filename)
+    elif ext == '.jsonl':
+        return write_jsonl_file(processes, filename)
+    elif ext in BINARY_EXTENSIONS and compression is None:
+        return write_workload_binary(processes, filename)
     else:
-        print(f"Error: Unsupported file format '{ext}'")
+        print(f"Error: Unsupported file format '{ext}{compression or ''}'")
         return False
 
 
 def write_results_to_file(results, filename):
     """
-    Write simulation results to a file.
+    Write simulation results to a file, compressed on the fly if the name ends with .gz,
+    .xz or .bz2.
     
     Args:
         results (dict): Simulation results.
@@ -196,7 +1242,7 @@ def write_results_to_file(results, filename):
         bool: True if successful, False otherwise.
     """
     try:
-        with open(filename, 'w') as file:
+        with open_file(filename, 'w') as file:
             file.write("CPU Scheduler Simulation Results\n")
             file.write("===============================\n\n")
             
@@ -212,4 +1258,228 @@ def write_results_to_file(results, filename):
     
     except Exception as e:
         print(f"Error writing results to file: {str(e)}")
-        return False
\ No newline at end of file
+        return False
+
+
+def _timed_slices(schedule):
+    """
+    Add the start time to each slice of a schedule.
+    
+    Args:
+        schedule (iterable): (pid, time_slice) slices.
+    
+    Yields:
+        tuple: (pid, start, duration) records.
+    """
+    current_time = 0
+    for pid, time_slice in schedule:
+        yield pid, current_time, time_slice
+        current_time += time_slice
+
+
+def _write_npy_header(file, dtype, shape, fortran_order=False, flags=()):
+    """
+    Write a fixed-size .npy header.
+    
+    The header always takes NPY_HEADER_SIZE bytes, so it can be rewritten with the final
+    shape once all the records have been streamed after it.
+    
+    Args:
+        file (file): Binary file positioned at the start of the header.
+        dtype (numpy.dtype): Record type of the array.
+        shape (tuple): Shape of the array.
+        fortran_order (bool): Whether the array is stored in column-major order.
+        flags (tuple): WORKLOAD_FLAGS that hold for the workload, recorded as a comment
+            after the header dictionary, which ``numpy.load`` ignores.
+    """
+    header = "{'descr': %r, 'fortran_order': %r, 'shape': %r, }" % (
+        np.lib.format.dtype_to_descr(np.dtype(dtype)), fortran_order, tuple(int(n) for n in shape)
+    )
+    if flags:
+        header += ' # ' + ' '.join(flags)
+    header = header.ljust(NPY_HEADER_SIZE - 11) + '\n'
+    file.write(b'\x93NUMPY\x01\x00' + struct.pack('<H', len(header)) + header.encode('latin1'))
+
+
+def write_schedule_csv(schedule, filename):
+    """
+    Write a schedule to a CSV file slice by slice.
+    
+    The schedule can be a generator such as ``BaseScheduler.iter_schedule``, in which case
+    the slices are written as they are decided and never held in memory.
+    
+    Args:
+        schedule (iterable): (pid, time_slice) slices.
+        filename (str): Path to the output file.
+    
+    Returns:
+        bool: True if successful, False otherwise.
+    """
+    try:
+        with open_file(filename, 'w', newline='') as file:
+            writer = csv.writer(file)
+            writer.writerow(['pid', 'start', 'duration'])
+            writer.writerows(_timed_slices(schedule))
+        
+        return True
+    
+    except Exception as e:
+        print(f"Error writing schedule to file: {str(e)}")
+        return False
+
+
+def write_schedule_jsonl(schedule, filename):
+    """
+    Write a schedule to a JSON Lines file, one {"pid", "start", "duration"} object per slice.
+    
+    Like ``write_schedule_csv``, the slices are written as they come, so a generator such
+    as ``BaseScheduler.iter_schedule`` is streamed without being held in memory.
+    
+    Args:
+        schedule (iterable): (pid, time_slice) slices.
+        filename (str): Path to the output file.
+    
+    Returns:
+        bool: True if successful, False otherwise.
+    """
+    try:
+        with open_file(filename, 'w') as file:
+            for pid, start, duration in _timed_slices(schedule):
+                file.write(json.dumps({'pid': pid, 'start': start, 'duration': duration}) + '\n')
+        
+        return True
+    
+    except Exception as e:
+        print(f"Error writing schedule to file: {str(e)}")
+        return False
+
+
+def write_schedule_binary(schedule, filename, chunk_size=65536):
+    """
+    Write a schedule to a .npy file of (pid, start, duration) records, chunk by chunk.
+    
+    The records use SCHEDULE_DTYPE, and the file can be read back with ``numpy.load``.
+    Only one chunk of slices is held in memory at a time.
+    
+    Args:
+        schedule (iterable): (pid, time_slice) slices.
+        filename (str): Path to the output file.
+        chunk_size (int): Number of slices converted and written at once.
+    
+    Returns:
+        bool: True if successful, False otherwise.
+    """
+    try:
+        with open(filename, 'wb') as file:
+            _write_npy_header(file, SCHEDULE_DTYPE, (0,))
+            
+            slices = iter(schedule)
+            length = 0
+            current_time = 0
+            while True:
+                chunk = list(islice(slices, chunk_size))
+                if not chunk:
+                    break
+                
+                records = np.empty(len(chunk), dtype=SCHEDULE_DTYPE)
+                records['pid'], records['duration'] = zip(*chunk)
+                records['start'] = np.cumsum(records['duration']) - records['duration'] + current_time
+                file.write(records.tobytes())
+                
+                length += len(chunk)
+                current_time += int(records['duration'].sum())
+            
+            file.seek(0)
+            _write_npy_header(file, SCHEDULE_DTYPE, (length,))
+        
+        return True
+    
+    except Exception as e:
+        print(f"Error writing schedule to file: {str(e)}")
+        return False
+
+
+def write_schedule_columns(schedule, filename):
+    """
+    Write a schedule to an uncompressed .npz file with one array per column.
+    
+    The archive holds int32 "pid" and int64 "start" and "duration" arrays, which
+    ``read_schedule_binary`` memory-maps in place. Unlike ``write_schedule_binary``, the
+    schedule is first collected into a ScheduleTrace to know its length.
+    
+    Args:
+        schedule (iterable): (pid, time_slice) slices, or a ScheduleTrace.
+        filename (str): Path to the output file.
+    
+    Returns:
+        bool: True if successful, False otherwise.
+    """
+    try:
+        trace = ScheduleTrace.from_schedule(schedule)
+        np.savez(filename, pid=trace.pids, start=trace.starts, duration=trace.durations)
+        return True
+    
+    except Exception as e:
+        print(f"Error writing schedule to file: {str(e)}")
+        return False
+
+
+def read_schedule_binary(filename):
+    """
+    Open a binary schedule file without copying it.
+    
+    Reads the .npy record files of ``write_schedule_binary`` and the .npz column files of
+    ``write_schedule_columns``. The columns are memory-mapped read-only.
+    
+    Args:
+        filename (str): Path to the .npy or .npz file.
+    
+    Returns:
+        dict: The "pid", "start" and "duration" arrays, or None if the file could not
+            be read.
+    """
+    try:
+        if _extension(filename) == '.npz':
+            arrays = _memmap_npz(filename)
+        else:
+            records = np.load(filename, mmap_mode='r')
+            arrays = {name: records[name] for name in SCHEDULE_DTYPE.names}
+        return {name: arrays[name] for name in SCHEDULE_DTYPE.names}
+    
+    except FileNotFoundError:
+        print(f"Error: File '{filename}' not found.")
+    
+    except (KeyError, ValueError, OSError, zipfile.BadZipFile) as e:
+        print(f"Error: Invalid schedule file - {str(e)}")
+    
+    return None
+
+
+def write_schedule_to_file(schedule, filename):
+    """
+    Write a schedule to a file based on its extension (.csv, .jsonl, .npy or .npz).
+    
+    CSV and JSONL files are compressed on the fly if the name ends with .gz, .xz or .bz2.
+    All formats but .npz are written as the slices arrive; an .npz file collects the whole
+    schedule first (see ``write_schedule_columns``).
+    
+    Args:
+        schedule (iterable): (pid, time_slice) slices.
+        filename (str): Path to the output file.
+    
+    Returns:
+        bool: True if successful, False otherwise.
+    """
+    ext, compression = split_extension(filename)
+    
+    if ext == '.csv':
+        return write_schedule_csv(schedule, filename)
+    elif ext == '.jsonl':
+        return write_schedule_jsonl(schedule, filename)
+    elif ext == '.npy' and compression is None:
+        return write_schedule_binary(schedule, filename)
+    elif ext == '.npz' and compression is None:
+        return write_schedule_columns(schedule, filename)
+    else:
+        print(f"Error: Unsupported file format '{ext}{compression or ''}'")
+        return False
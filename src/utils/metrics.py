@@ -1,8 +1,15 @@
 """
 Metrics Module
 This module provides functions to calculate performance metrics for the CPU scheduler simulation.
+
+The metrics of a run are computed with NumPy in one pass over the process columns and the
+schedule arrays. Streaming runs use MetricsAccumulator from the online_metrics module instead.
 """
 
+import numpy as np
+from src.process import ProcessTable
+from src.schedule_trace import ScheduleTrace
+
 
 def calculate_turnaround_time(process):
     """
@@ -46,52 +53,196 @@ def calculate_cpu_utilization(schedule, total_time):
     CPU Utilization = (Total Busy Time / Total Time) * 100%
     
     Args:
-        schedule (list): List of scheduled process IDs and time slices.
+        schedule (list or ScheduleTrace): List of scheduled process IDs and time slices.
         total_time (int): Total simulation time.
     
     Returns:
         float: CPU utilization percentage.
     """
-    busy_time = sum(time_slice for pid, time_slice in schedule if pid != -1)
+    if isinstance(schedule, ScheduleTrace):
+        busy_time = schedule.busy_time
+    else:
+        busy_time = sum(time_slice for pid, time_slice in schedule if pid != -1)
     return (busy_time / total_time) * 100 if total_time > 0 else 0
 
 
+def calculate_context_switches(schedule):
+    """
+    Count the context switches of a schedule.
+    
+    A context switch happens whenever the CPU goes from one process to a different one.
+    Idle time and zero-length slices are skipped, so A, idle, B counts as one switch and
+    A, B (0), A as none.
+    
+    Args:
+        schedule (list or ScheduleTrace): List of (pid, time_slice) tuples.
+    
+    Returns:
+        int: Number of context switches.
+    """
+    pids, time_slices = _schedule_arrays(schedule)
+    return _count_context_switches(pids, time_slices)
+
+
+def calculate_fairness_index(values):
+    """
+    Calculate Jain's fairness index of a set of values.
+    
+    J = (sum x)^2 / (n * sum x^2), which is 1 when all the values are equal and 1/n when a
+    single value holds everything.
+    
+    Args:
+        values (array-like): Non-negative values, e.g. the share of CPU each process got.
+    
+    Returns:
+        float: Fairness index between 1/n and 1 (1 for an empty set).
+    """
+    values = np.asarray(values, dtype=np.float64)
+    squares = np.dot(values, values)
+    if not len(values) or squares == 0:
+        return 1.0
+    return float(values.sum() ** 2 / (len(values) * squares))
+
+
 def calculate_metrics(schedule, processes):
     """
     Calculate performance metrics for the scheduler.
     
+    Besides the average turnaround and waiting times, CPU utilization and total time, the
+    result holds:
+    
+    - the average response time (first run minus arrival),
+    - p50/p95/p99 waiting and response times and the maximum waiting time,
+    - the throughput (completed processes per time unit),
+    - the average and maximum slowdown (turnaround time divided by burst time),
+    - Jain's fairness index of the CPU share (burst time divided by turnaround time),
+    - the number of context switches,
+    - a per-priority breakdown of the averages.
+    
     Args:
-        schedule (list): List of (pid, time_slice) tuples.
-        processes (list): List of Process objects.
+        schedule (list or ScheduleTrace): List of (pid, time_slice) tuples.
+        processes (list or ProcessTable): Scheduled processes.
     
     Returns:
         dict: Dictionary containing performance metrics.
     """
-     
-    total_time = sum(time_slice for _, time_slice in schedule)
+    table = processes if isinstance(processes, ProcessTable) else ProcessTable.from_processes(processes)
     
      
-    turnaround_times = []
-    waiting_times = []
-    
-    for process in processes:
-        turnaround_time = calculate_turnaround_time(process)
-        waiting_time = calculate_waiting_time(process)
-        
-        if turnaround_time is not None:
-            turnaround_times.append(turnaround_time)
-        
-        if waiting_time is not None:
-            waiting_times.append(waiting_time)
+    pids, time_slices = _schedule_arrays(schedule)
+    if isinstance(schedule, ScheduleTrace):
+        total_time = schedule.total_time
+        busy_time = schedule.busy_time
+    else:
+        total_time = int(time_slices.sum())
+        busy_time = int(time_slices[pids != -1].sum())
     
      
-    avg_turnaround_time = sum(turnaround_times) / len(turnaround_times) if turnaround_times else 0
-    avg_waiting_time = sum(waiting_times) / len(waiting_times) if waiting_times else 0
-    cpu_utilization = calculate_cpu_utilization(schedule, total_time)
+    completed = table.completed()
+    arrival_times = table.arrival_time[completed]
+    burst_times = table.burst_time[completed]
+    priorities = table.priority[completed]
+    turnaround_times = table.finish_time[completed] - arrival_times
+    waiting_times = turnaround_times - burst_times
+    response_times = table.start_time[completed] - arrival_times
+    slowdowns = turnaround_times / np.maximum(burst_times, 1)
+    count = len(turnaround_times)
+    
+    metrics = {
+        'avg_turnaround_time': _mean(turnaround_times),
+        'avg_waiting_time': _mean(waiting_times),
+        'cpu_utilization': (busy_time / total_time) * 100 if total_time > 0 else 0,
+        'total_time': total_time,
+        'completed': count,
+        'avg_response_time': _mean(response_times),
+        'max_waiting_time': int(waiting_times.max()) if count else 0,
+        'throughput': count / total_time if total_time > 0 else 0,
+        'avg_slowdown': float(slowdowns.mean()) if count else 0,
+        'max_slowdown': float(slowdowns.max()) if count else 0,
+        'fairness_index': calculate_fairness_index(burst_times / np.maximum(turnaround_times, 1)),
+        'context_switches': _count_context_switches(pids, time_slices),
+    }
+    
+    percentiles = (50, 95, 99)
+    waiting_percentiles = np.percentile(waiting_times, percentiles) if count else [0] * 3
+    response_percentiles = np.percentile(response_times, percentiles) if count else [0] * 3
+    for percentile, waiting_time, response_time in zip(percentiles, waiting_percentiles,
+                                                       response_percentiles):
+        metrics[f'p{percentile}_waiting_time'] = float(waiting_time)
+        metrics[f'p{percentile}_response_time'] = float(response_time)
+    
+    metrics['priority_breakdown'] = _priority_breakdown(priorities, turnaround_times,
+                                                        waiting_times, response_times)
+    
+    return metrics
+
+
+def _mean(values):
+    """Return the mean of an integer array as a float (0 if it is empty)."""
+    return values.sum().item() / len(values) if len(values) else 0
+
+
+def _count_context_switches(pids, time_slices):
+    """Count the changes of process between slices, ignoring idle and zero-length slices."""
+    pids = pids[(pids != -1) & (time_slices > 0)]
+    return int(np.count_nonzero(pids[1:] != pids[:-1]))
+
+
+def _schedule_arrays(schedule):
+    """
+    Get the pid and time slice arrays of a schedule.
+    
+    Args:
+        schedule (list or ScheduleTrace): List of (pid, time_slice) tuples.
+    
+    Returns:
+        tuple: (pids, time_slices) int64 arrays.
+    """
+    if isinstance(schedule, ScheduleTrace):
+        return schedule.pids.astype(np.int64), schedule.durations
+    
+    slices = np.array(schedule, dtype=np.int64).reshape(-1, 2)
+    return slices[:, 0], slices[:, 1]
+
+
+def _priority_breakdown(priorities, turnaround_times, waiting_times, response_times):
+    """
+    Average the per-process times of each priority level.
+    
+    Args:
+        priorities (ndarray): Priority of each completed process.
+        turnaround_times (ndarray): Turnaround time of each completed process.
+        waiting_times (ndarray): Waiting time of each completed process.
+        response_times (ndarray): Response time of each completed process.
+    
+    Returns:
+        dict: Per priority level, the process count and the average turnaround, waiting
+            and response times.
+    """
+    if not len(priorities):
+        return {}
+    
+    lowest = priorities.min()
+    if priorities.max() - lowest < 1 << 16:
+        groups = priorities - lowest
+        counts = np.bincount(groups)
+        levels = np.flatnonzero(counts)
+        counts = counts[levels]
+        sums = [np.bincount(groups, weights=times)[levels]
+                for times in (turnaround_times, waiting_times, response_times)]
+        levels = levels + lowest
+    else:
+        levels, groups, counts = np.unique(priorities, return_inverse=True, return_counts=True)
+        sums = [np.bincount(groups, weights=times)
+                for times in (turnaround_times, waiting_times, response_times)]
     
     return {
-        'avg_turnaround_time': avg_turnaround_time,
-        'avg_waiting_time': avg_waiting_time,
-        'cpu_utilization': cpu_utilization,
-        'total_time': total_time
-    }
\ No newline at end of file
+        int(level): {
+            'count': int(count),
+            'avg_turnaround_time': float(turnaround_sum / count),
+            'avg_waiting_time': float(waiting_sum / count),
+            'avg_response_time': float(response_sum / count)
+        }
+        for level, count, turnaround_sum, waiting_sum, response_sum
+        in zip(levels.tolist(), counts.tolist(), *(values.tolist() for values in sums))
+    }
@@ -0,0 +1,295 @@
+"""
+Online Metrics Module
+This module provides incremental metrics for streaming simulations.
+
+Results are fed one completed process at a time and kept in constant memory: running
+sums and maxima for the averages, plus quantile sketches for the tail percentiles.
+Accumulators (and sketches) from separate runs or shards can be merged.
+"""
+
+import math
+import numpy as np
+
+
+class QuantileSketch:
+    """
+    Streaming quantile sketch with relative error guarantees.
+    
+    Positive values are counted in logarithmic buckets, where bucket i holds the values in
+    (gamma^(i-1), gamma^i] with gamma = (1 + relative_accuracy) / (1 - relative_accuracy).
+    Any quantile is then estimated within ``relative_accuracy`` of a value of the stream.
+    Values <= 0 are counted apart and estimated as 0. When there are more than
+    ``max_buckets`` buckets, the lowest ones are collapsed together, so memory stays
+    bounded and only the accuracy of the smallest values is lost.
+    
+    Sketches built with the same relative accuracy can be merged.
+    """
+    
+    def __init__(self, relative_accuracy=0.01, max_buckets=2048):
+        """
+        Initialize an empty sketch.
+        
+        Args:
+            relative_accuracy (float): Relative accuracy of the quantile estimates.
+            max_buckets (int): Maximum number of buckets kept.
+        """
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self.log_gamma = math.log(self.gamma)
+        self.buckets = {}
+        self.zero_count = 0
+        self.count = 0
+        self.min = None
+        self.max = None
+    
+    def add(self, value):
+        """
+        Add a value to the sketch.
+        
+        Args:
+            value (float): The value.
+        """
+        if value > 0:
+            index = math.ceil(math.log(value) / self.log_gamma)
+            self.buckets[index] = self.buckets.get(index, 0) + 1
+            if len(self.buckets) > self.max_buckets:
+                self._collapse()
+        else:
+            self.zero_count += 1
+        
+        self.count += 1
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+    
+    def add_many(self, values):
+        """
+        Add an array of values to the sketch.
+        
+        Args:
+            values (array-like): The values.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        if not len(values):
+            return
+        
+        positive = values[values > 0]
+        indices, counts = np.unique(np.ceil(np.log(positive) / self.log_gamma).astype(np.int64),
+                                    return_counts=True)
+        for index, count in zip(indices.tolist(), counts.tolist()):
+            self.buckets[index] = self.buckets.get(index, 0) + count
+        if len(self.buckets) > self.max_buckets:
+            self._collapse()
+        
+        self.zero_count += len(values) - len(positive)
+        self.count += len(values)
+        low, high = values.min().item(), values.max().item()
+        self.min = low if self.min is None else min(self.min, low)
+        self.max = high if self.max is None else max(self.max, high)
+    
+    def merge(self, other):
+        """
+        Add the values counted by another sketch.
+        
+        Args:
+            other (QuantileSketch): A sketch with the same relative accuracy.
+        """
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches with different relative accuracies")
+        
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+        if len(self.buckets) > self.max_buckets:
+            self._collapse()
+        
+        self.zero_count += other.zero_count
+        self.count += other.count
+        if other.count:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+            self.max = other.max if self.max is None else max(self.max, other.max)
+    
+    def quantile(self, q):
+        """
+        Estimate a quantile of the values added so far.
+        
+        Args:
+            q (float): Quantile between 0 and 1.
+        
+        Returns:
+            float or None: The estimate, or None if the sketch is empty.
+        """
+        if not self.count:
+            return None
+        
+        rank = q * (self.count - 1)
+        if rank < self.zero_count:
+            return 0
+        
+        seen = self.zero_count
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen > rank:
+                estimate = 2 * self.gamma ** index / (self.gamma + 1)
+                return min(max(estimate, self.min), self.max)
+        
+        return self.max
+    
+    def _collapse(self):
+        """Merge the lowest buckets so that at most ``max_buckets`` remain."""
+        indices = sorted(self.buckets)
+        excess = len(indices) - self.max_buckets + 1
+        target = indices[excess]
+        for index in indices[:excess]:
+            self.buckets[target] += self.buckets.pop(index)
+
+
+class MetricsAccumulator:
+    """
+    Incremental scheduling metrics, fed one completed process at a time.
+    
+    Keeps the averages, the maximum waiting time, the throughput and tail percentiles of
+    the waiting and response times in constant memory.
+    
+    Attributes:
+        completed (int): Number of completed processes.
+        total_time (int): Latest finish time seen, i.e. the length of the schedule.
+        busy_time (int): Sum of the burst times of the completed processes.
+        max_waiting_time (int): Longest waiting time seen.
+    """
+    
+    PERCENTILES = (50, 95, 99)
+    
+    def __init__(self, relative_accuracy=0.01):
+        """
+        Initialize an empty accumulator.
+        
+        Args:
+            relative_accuracy (float): Relative accuracy of the percentile estimates.
+        """
+        self.completed = 0
+        self.total_time = 0
+        self.busy_time = 0
+        self.turnaround_sum = 0
+        self.waiting_sum = 0
+        self.response_sum = 0
+        self.max_waiting_time = None
+        self.waiting_times = QuantileSketch(relative_accuracy)
+        self.response_times = QuantileSketch(relative_accuracy)
+    
+    def add(self, arrival_time, burst_time, start_time, finish_time):
+        """
+        Record a completed process.
+        
+        Args:
+            arrival_time (int): Arrival time of the process.
+            burst_time (int): Burst time of the process.
+            start_time (int): Time the process first ran.
+            finish_time (int): Time the process completed.
+        """
+        turnaround_time = finish_time - arrival_time
+        waiting_time = turnaround_time - burst_time
+        response_time = start_time - arrival_time
+        
+        self.completed += 1
+        self.total_time = max(self.total_time, finish_time)
+        self.busy_time += burst_time
+        self.turnaround_sum += turnaround_time
+        self.waiting_sum += waiting_time
+        self.response_sum += response_time
+        if self.max_waiting_time is None or waiting_time > self.max_waiting_time:
+            self.max_waiting_time = waiting_time
+        self.waiting_times.add(waiting_time)
+        self.response_times.add(response_time)
+    
+    def add_process(self, process):
+        """
+        Record a completed Process object.
+        
+        Args:
+            process (Process): The completed process.
+        """
+        self.add(process.arrival_time, process.burst_time, process.start_time, process.finish_time)
+    
+    def add_many(self, arrival_time, burst_time, start_time, finish_time):
+        """
+        Record completed processes given as arrays.
+        
+        Args:
+            arrival_time (array-like): Arrival times.
+            burst_time (array-like): Burst times.
+            start_time (array-like): Times the processes first ran.
+            finish_time (array-like): Times the processes completed.
+        """
+        arrival_time = np.asarray(arrival_time, dtype=np.int64)
+        burst_time = np.asarray(burst_time, dtype=np.int64)
+        finish_time = np.asarray(finish_time, dtype=np.int64)
+        if not len(finish_time):
+            return
+        
+        turnaround_times = finish_time - arrival_time
+        waiting_times = turnaround_times - burst_time
+        response_times = np.asarray(start_time, dtype=np.int64) - arrival_time
+        
+        self.completed += len(finish_time)
+        self.total_time = max(self.total_time, finish_time.max().item())
+        self.busy_time += burst_time.sum().item()
+        self.turnaround_sum += turnaround_times.sum().item()
+        self.waiting_sum += waiting_times.sum().item()
+        self.response_sum += response_times.sum().item()
+        max_waiting_time = waiting_times.max().item()
+        if self.max_waiting_time is None or max_waiting_time > self.max_waiting_time:
+            self.max_waiting_time = max_waiting_time
+        self.waiting_times.add_many(waiting_times)
+        self.response_times.add_many(response_times)
+    
+    def merge(self, other):
+        """
+        Add the processes recorded by another accumulator, e.g. from a parallel shard.
+        
+        Args:
+            other (MetricsAccumulator): The other accumulator.
+        """
+        self.completed += other.completed
+        self.total_time = max(self.total_time, other.total_time)
+        self.busy_time += other.busy_time
+        self.turnaround_sum += other.turnaround_sum
+        self.waiting_sum += other.waiting_sum
+        self.response_sum += other.response_sum
+        if other.max_waiting_time is not None and (self.max_waiting_time is None or
+                                                   other.max_waiting_time > self.max_waiting_time):
+            self.max_waiting_time = other.max_waiting_time
+        self.waiting_times.merge(other.waiting_times)
+        self.response_times.merge(other.response_times)
+    
+    def metrics(self, total_time=None):
+        """
+        Get the metrics of the processes recorded so far.
+        
+        Args:
+            total_time (int, optional): Length of the schedule, if known. Defaults to the
+                latest finish time seen.
+        
+        Returns:
+            dict: Dictionary containing performance metrics.
+        """
+        completed = self.completed
+        if total_time is None:
+            total_time = self.total_time
+        metrics = {
+            'completed': completed,
+            'avg_turnaround_time': self.turnaround_sum / completed if completed else 0,
+            'avg_waiting_time': self.waiting_sum / completed if completed else 0,
+            'avg_response_time': self.response_sum / completed if completed else 0,
+            'max_waiting_time': self.max_waiting_time if completed else 0,
+            'throughput': completed / total_time if total_time > 0 else 0,
+            'cpu_utilization': (self.busy_time / total_time) * 100 if total_time > 0 else 0,
+            'total_time': total_time
+        }
+        
+        for percentile in self.PERCENTILES:
+            waiting_time = self.waiting_times.quantile(percentile / 100)
+            response_time = self.response_times.quantile(percentile / 100)
+            metrics[f'p{percentile}_waiting_time'] = waiting_time if waiting_time is not None else 0
+            metrics[f'p{percentile}_response_time'] = response_time if response_time is not None else 0
+        
+        return metrics
@@ -5,11 +5,13 @@ This module provides functions to generate processes for the CPU scheduler simul
 
 import random
 import csv
-from src.process import Process
+from src.process import Process, ProcessTable
+from src.utils.file_handler import load_processes
 
 
 def generate_random_processes(num_processes, min_burst, max_burst,
-                             min_arrival, max_arrival, min_priority, max_priority):
+                             min_arrival, max_arrival, min_priority, max_priority,
+                             as_table=False, seed=None):
     """
     Generate a list of random processes.
     
@@ -21,62 +23,65 @@ def generate_random_processes(num_processes, min_burst, max_burst,
         max_arrival (int): Maximum arrival time.
         min_priority (int): Minimum priority value.
         max_priority (int): Maximum priority value.
+        as_table (bool, optional): Return a ProcessTable instead of a list (default: False).
+        seed (int, optional): Seed of a private random generator, for a reproducible
+            workload. By default the global ``random`` state is used.
     
     Returns:
-        list: A list of Process objects.
+        list or ProcessTable: The generated processes, sorted by arrival time.
     """
-    processes = []
+    rng = random if seed is None else random.Random(seed)
+    rows = []
     
     for pid in range(1, num_processes + 1):
-        arrival_time = random.randint(min_arrival, max_arrival)
-        burst_time = random.randint(min_burst, max_burst)
-        priority = random.randint(min_priority, max_priority)
-        processes.append(Process(pid, arrival_time, burst_time, priority))
+        arrival_time = rng.randint(min_arrival, max_arrival)
+        burst_time = rng.randint(min_burst, max_burst)
+        priority = rng.randint(min_priority, max_priority)
+        rows.append((pid, arrival_time, burst_time, priority))
     
+    return _build_sorted_processes(rows, as_table)
+
+
+def _build_sorted_processes(rows, as_table):
+    """
+    Build processes from (pid, arrival_time, burst_time, priority) rows, sorted by arrival.
+    
+    Args:
+        rows (list): List of (pid, arrival_time, burst_time, priority) tuples.
+        as_table (bool): Whether to return a ProcessTable instead of a list.
+    
+    Returns:
+        list or ProcessTable: The processes, sorted by arrival time.
+    """
+    if as_table:
+        table = ProcessTable(*zip(*rows)) if rows else ProcessTable([], [], [], [])
+        table.sort_by_arrival()
+        return table
+    
+    processes = [Process(pid, arrival_time, burst_time, priority)
+                 for pid, arrival_time, burst_time, priority in rows]
      
     processes.sort(key=lambda p: p.arrival_time)
     
     return processes
 
 
-def read_processes_from_file(filename):
+def read_processes_from_file(filename, as_table=False):
     """
-    Read processes from a CSV file.
+    Read processes from a CSV or JSON file.
     
-    The file should have columns: pid, arrival_time, burst_time, priority.
+    The file should have columns (or keys): pid, arrival_time, burst_time, priority. It is
+    parsed in chunks and sorted with bounded memory (see ``file_handler.load_processes``).
     
     Args:
         filename (str): Path to the input file.
+        as_table (bool, optional): Return a ProcessTable instead of a list (default: False).
     
     Returns:
-        list: A list of Process objects.
+        list or ProcessTable: The processes, sorted by arrival time.
     """
-    processes = []
-    
-    try:
-        with open(filename, 'r') as file:
-            reader = csv.DictReader(file)
-            
-            for row in reader:
-                pid = int(row['pid'])
-                arrival_time = int(row['arrival_time'])
-                burst_time = int(row['burst_time'])
-                priority = int(row.get('priority', 1))   
-                
-                processes.append(Process(pid, arrival_time, burst_time, priority))
-    
-    except FileNotFoundError:
-        print(f"Error: File '{filename}' not found.")
-        return []
-    
-    except (KeyError, ValueError) as e:
-        print(f"Error: Invalid file format - {str(e)}")
-        return []
-    
-     
-    processes.sort(key=lambda p: p.arrival_time)
-    
-    return processes
+    table = load_processes(filename)
+    return table if as_table else table.to_processes()
 
 
 def save_processes_to_file(processes, filename):
@@ -84,7 +89,7 @@ def save_processes_to_file(processes, filename):
     Save processes to a CSV file.
     
     Args:
-        processes (list): List of Process objects.
+        processes (list or ProcessTable): Processes to save.
         filename (str): Path to the output file.
     
     Returns:
@@ -98,13 +103,21 @@ def save_processes_to_file(processes, filename):
             writer.writerow(['pid', 'arrival_time', 'burst_time', 'priority'])
             
              
-            for process in processes:
-                writer.writerow([
-                    process.pid,
-                    process.arrival_time,
-                    process.burst_time,
-                    process.priority
-                ])
+            if isinstance(processes, ProcessTable):
+                writer.writerows(zip(
+                    processes.pid.tolist(),
+                    processes.arrival_time.tolist(),
+                    processes.burst_time.tolist(),
+                    processes.priority.tolist()
+                ))
+            else:
+                for process in processes:
+                    writer.writerow([
+                        process.pid,
+                        process.arrival_time,
+                        process.burst_time,
+                        process.priority
+                    ])
         
         return True
     
@@ -0,0 +1,200 @@
+"""
+Workload Generator Module
+This module synthesizes large random workloads with NumPy, without Process objects.
+
+Arrival times, burst times and priorities are drawn in vectorized batches from a NumPy
+Generator and written straight into ProcessTable columns, or chunk by chunk into a .npy
+file. Each column is drawn from its own random stream spawned from the seed, so a seeded
+workload is the same whether it is generated at once or in chunks.
+"""
+
+import numpy as np
+from src.process import ProcessTable
+
+
+ARRIVAL_PROCESSES = ("poisson", "bursty")
+BURST_DISTRIBUTIONS = ("exponential", "lognormal", "pareto")
+PRIORITY_DISTRIBUTIONS = ("uniform", "zipf")
+
+
+class WorkloadGenerator:
+    """
+    A seeded, distribution-aware generator of processes.
+    
+    Arrivals follow a Poisson process of rate ``arrival_rate``, or a bursty (compound
+    Poisson) process in which arrivals come in batches of ``batch_size`` processes on
+    average at the same overall rate. Burst times are drawn from an exponential,
+    lognormal or Pareto distribution of mean ``mean_burst`` and rounded up to whole time
+    units. Priorities are uniform, or Zipf-distributed so that priority ``min_priority``
+    is the most common.
+    
+    Successive calls to ``generate`` continue the same workload: pids keep increasing and
+    arrivals keep going from the last arrival time.
+    """
+    
+    def __init__(self, seed=None, arrival="poisson", arrival_rate=1.0, batch_size=8,
+                 burst="exponential", mean_burst=5.0, burst_sigma=1.0, pareto_shape=2.5,
+                 max_burst=None, priority="uniform", min_priority=1, max_priority=10,
+                 zipf_exponent=1.2, start_time=0):
+        """
+        Initialize a new WorkloadGenerator.
+        
+        Args:
+            seed (int, optional): Seed of the random streams.
+            arrival (str): Arrival process, one of ARRIVAL_PROCESSES.
+            arrival_rate (float): Mean number of arrivals per time unit.
+            batch_size (float): Mean number of processes per batch of bursty arrivals.
+            burst (str): Burst time distribution, one of BURST_DISTRIBUTIONS.
+            mean_burst (float): Mean burst time.
+            burst_sigma (float): Standard deviation of the log of lognormal burst times.
+            pareto_shape (float): Shape (tail index) of Pareto burst times, above 1.
+            max_burst (int, optional): Upper bound of the burst times.
+            priority (str): Priority distribution, one of PRIORITY_DISTRIBUTIONS.
+            min_priority (int): Minimum priority value (highest priority).
+            max_priority (int): Maximum priority value.
+            zipf_exponent (float): Exponent of Zipf priorities.
+            start_time (int): Time from which arrivals start.
+        """
+        if arrival not in ARRIVAL_PROCESSES:
+            raise ValueError(f"Unknown arrival process: {arrival}")
+        if burst not in BURST_DISTRIBUTIONS:
+            raise ValueError(f"Unknown burst distribution: {burst}")
+        if priority not in PRIORITY_DISTRIBUTIONS:
+            raise ValueError(f"Unknown priority distribution: {priority}")
+        if burst == "pareto" and pareto_shape <= 1:
+            raise ValueError("The Pareto shape must be above 1 for the mean to exist")
+        if arrival_rate <= 0 or mean_burst <= 0 or batch_size < 1:
+            raise ValueError("Arrival rate, mean burst and batch size must be positive")
+        if min_priority > max_priority:
+            raise ValueError("Minimum priority is above the maximum priority")
+        
+        self.arrival = arrival
+        self.arrival_rate = arrival_rate
+        self.batch_size = batch_size
+        self.burst = burst
+        self.mean_burst = mean_burst
+        self.burst_sigma = burst_sigma
+        self.pareto_shape = pareto_shape
+        self.max_burst = max_burst
+        self.priority = priority
+        self.min_priority = min_priority
+        self.max_priority = max_priority
+        
+        levels = np.arange(1, max_priority - min_priority + 2, dtype=np.float64)
+        weights = levels ** -zipf_exponent
+        self._zipf_cdf = np.cumsum(weights / weights.sum())
+        
+        streams = np.random.SeedSequence(seed).spawn(4)
+        self._gaps, self._batches, self._bursts, self._priorities = (
+            np.random.default_rng(stream) for stream in streams
+        )
+        self._next_pid = 1
+        self._clock = float(start_time)
+    
+    def generate(self, count):
+        """
+        Generate the next processes of the workload.
+        
+        Args:
+            count (int): Number of processes to generate.
+        
+        Returns:
+            ProcessTable: The processes, sorted by arrival time.
+        """
+        pid = np.arange(self._next_pid, self._next_pid + count, dtype=np.int64)
+        self._next_pid += count
+        return ProcessTable(pid, self._arrival_times(count), self._burst_times(count),
+                            self._priority_values(count))
+    
+    def _arrival_times(self, count):
+        """Draw the next ``count`` arrival times."""
+        if self.arrival == "poisson":
+            gaps = self._gaps.exponential(1 / self.arrival_rate, count)
+        else:
+            gaps = self._gaps.exponential(self.batch_size / self.arrival_rate, count)
+            gaps[self._batches.random(count) >= 1 / self.batch_size] = 0
+        
+        clock = np.cumsum(gaps)
+        clock += self._clock
+        if count:
+            self._clock = clock[-1].item()
+        return np.floor(clock).astype(np.int64)
+    
+    def _burst_times(self, count):
+        """Draw the next ``count`` burst times."""
+        if self.burst == "exponential":
+            bursts = self._bursts.exponential(self.mean_burst, count)
+        elif self.burst == "lognormal":
+            mu = np.log(self.mean_burst) - self.burst_sigma ** 2 / 2
+            bursts = self._bursts.lognormal(mu, self.burst_sigma, count)
+        else:
+            scale = self.mean_burst * (self.pareto_shape - 1) / self.pareto_shape
+            bursts = (self._bursts.pareto(self.pareto_shape, count) + 1) * scale
+        
+        bursts = np.ceil(bursts)
+        np.clip(bursts, 1, self.max_burst if self.max_burst is not None else 2 ** 62, out=bursts)
+        return bursts.astype(np.int64)
+    
+    def _priority_values(self, count):
+        """Draw the next ``count`` priorities."""
+        if self.priority == "uniform":
+            return self._priorities.integers(self.min_priority, self.max_priority + 1, count,
+                                             dtype=np.int64)
+        
+        levels = np.searchsorted(self._zipf_cdf, self._priorities.random(count), side='right')
+        np.minimum(levels, len(self._zipf_cdf) - 1, out=levels)
+        return levels.astype(np.int64) + self.min_priority
+
+
+def synthesize_workload(num_processes, seed=None, **options):
+    """
+    Synthesize a workload as a ProcessTable.
+    
+    Args:
+        num_processes (int): Number of processes to generate.
+        seed (int, optional): Seed of the random streams.
+        **options: Distribution options of ``WorkloadGenerator``.
+    
+    Returns:
+        ProcessTable: The processes, sorted by arrival time.
+    """
+    return WorkloadGenerator(seed, **options).generate(num_processes)
+
+
+def write_synthetic_workload(filename, num_processes, seed=None, chunk_size=1 << 20, **options):
+    """
+    Synthesize a workload straight into a .npy file, chunk by chunk.
+    
+    The file holds a (4, num_processes) int64 array whose rows are the pid, arrival time,
+    burst time and priority columns, so each column is contiguous on disk. It can be read
+    back with ``numpy.load`` (optionally memory-mapped) and only one chunk of processes is
+    held in memory at a time.
+    
+    Args:
+        filename (str): Path to the output file.
+        num_processes (int): Number of processes to generate.
+        seed (int, optional): Seed of the random streams.
+        chunk_size (int): Number of processes generated and written at once.
+        **options: Distribution options of ``WorkloadGenerator``.
+    
+    Returns:
+        bool: True if successful, False otherwise.
+    """
+    try:
+        generator = WorkloadGenerator(seed, **options)
+        columns = np.lib.format.open_memmap(filename, mode='w+', dtype=np.int64,
+                                            shape=(4, num_processes))
+        
+        for start in range(0, num_processes, chunk_size):
+            chunk = generator.generate(min(chunk_size, num_processes - start))
+            end = start + len(chunk)
+            for row, name in enumerate(ProcessTable.COLUMNS[:4]):
+                columns[row, start:end] = getattr(chunk, name)
+        
+        columns.flush()
+        del columns
+        return True
+    
+    except Exception as e:
+        print(f"Error writing workload to file: {str(e)}")
+        return False
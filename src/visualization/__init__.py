@@ -3,9 +3,21 @@ Visualization Package
 This package contains functions for visualizing CPU scheduling results.
 """
 
-from src.visualization.visualizer import visualize_schedule, compare_schedulers
+from src.visualization.visualizer import (visualize_schedule, compare_schedulers,
+                                          visualize_quantum_sweep, visualize_timeline_comparison,
+                                          visualize_metric_comparison, render_charts)
+from src.visualization.raster import (bucket_pids, rasterize_trace, rasterize_timeline,
+                                      save_raster)
 
 __all__ = [
     'visualize_schedule',
-    'compare_schedulers'
+    'compare_schedulers',
+    'visualize_quantum_sweep',
+    'visualize_timeline_comparison',
+    'visualize_metric_comparison',
+    'render_charts',
+    'bucket_pids',
+    'rasterize_trace',
+    'rasterize_timeline',
+    'save_raster'
 ]
\ No newline at end of file
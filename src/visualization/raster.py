@@ -0,0 +1,149 @@
+"""
+Raster Module
+This module rasterizes schedules straight into NumPy RGB buffers.
+
+A timeline is divided into one pixel column per time bucket, and each column takes the
+color of the process that ran the longest in its bucket (or of the last one to start in
+it). The work is done with array operations over the slices, so traces of millions of
+slices are drawn without creating a matplotlib artist per slice.
+"""
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.colors import to_rgb
+from src.schedule_trace import ScheduleTrace
+
+
+RASTER_MODES = ("dominant", "last")
+BACKGROUND = (1.0, 1.0, 1.0)
+
+
+def bucket_pids(trace, width, total_time=None, mode="dominant"):
+    """
+    Pick the process shown in each time bucket of a schedule.
+    
+    Args:
+        trace (list or ScheduleTrace): The schedule.
+        width (int): Number of buckets.
+        total_time (int, optional): Time covered by the buckets (default: the length of
+            the trace). Buckets past the end of the trace are empty.
+        mode (str): "dominant" for the process that ran the longest in the bucket, or
+            "last" for the last process to start running in it.
+    
+    Returns:
+        tuple: (pids, filled), the pid of each bucket (-1 for idle time) and a boolean
+            array telling which buckets the trace reaches.
+    """
+    if mode not in RASTER_MODES:
+        raise ValueError(f"Unknown raster mode: {mode}")
+    
+    trace = ScheduleTrace.from_schedule(trace)
+    if total_time is None:
+        total_time = trace.total_time
+    pids = np.full(width, -1, dtype=np.int64)
+    filled = np.zeros(width, dtype=bool)
+    if not len(trace) or total_time <= 0:
+        return pids, filled
+    
+    bucket_time = total_time / width
+    starts = trace.starts.astype(np.float64)
+    ends = starts + trace.durations
+    
+    # Split the slices at the bucket boundaries into pieces of at most one bucket
+    first = np.minimum((starts / bucket_time).astype(np.int64), width - 1)
+    last = np.minimum((np.nextafter(ends, 0) / bucket_time).astype(np.int64), width - 1)
+    counts = last - first + 1
+    owner = np.repeat(np.arange(len(starts)), counts)
+    buckets = first[owner] + np.arange(len(owner)) - np.repeat(np.cumsum(counts) - counts, counts)
+    piece_starts = np.maximum(starts[owner], buckets * bucket_time)
+    piece_ends = np.minimum(ends[owner], (buckets + 1) * bucket_time)
+    piece_pids = trace.pids.astype(np.int64)[owner]
+    
+    filled[buckets] = True
+    if mode == "last":
+        order = np.lexsort((piece_starts, buckets))
+        is_last = np.append(buckets[order][1:] != buckets[order][:-1], True)
+        pids[buckets[order][is_last]] = piece_pids[order][is_last]
+        return pids, filled
+    
+    # Total the time of each (bucket, pid) pair and keep the longest pair of each bucket
+    distinct, ranks = np.unique(piece_pids, return_inverse=True)
+    codes, inverse = np.unique(buckets * len(distinct) + ranks, return_inverse=True)
+    totals = np.bincount(inverse, weights=piece_ends - piece_starts)
+    code_buckets = codes // len(distinct)
+    order = np.lexsort((totals, code_buckets))
+    is_last = np.append(code_buckets[order][1:] != code_buckets[order][:-1], True)
+    pids[code_buckets[order][is_last]] = distinct[codes[order][is_last] % len(distinct)]
+    return pids, filled
+
+
+def rasterize_trace(trace, color_map, width, total_time=None, mode="dominant"):
+    """
+    Rasterize a schedule into one row of RGB pixels.
+    
+    Args:
+        trace (list or ScheduleTrace): The schedule.
+        color_map (dict): Color of each pid (-1 for idle time), in any matplotlib format.
+        width (int): Number of pixel columns (time buckets).
+        total_time (int, optional): Time covered by the row (default: the length of the
+            trace).
+        mode (str): How a bucket's process is picked, as in ``bucket_pids``.
+    
+    Returns:
+        ndarray: A (width, 3) float array of RGB values in [0, 1].
+    """
+    pids, filled = bucket_pids(trace, width, total_time, mode)
+    
+    keys = np.array(sorted(color_map), dtype=np.int64)
+    palette = np.array([to_rgb(color_map[key]) for key in keys.tolist()] + [BACKGROUND])
+    index = np.searchsorted(keys, pids)
+    known = (index < len(keys)) & (keys[np.minimum(index, len(keys) - 1)] == pids)
+    index[~(known & filled)] = len(keys)
+    return palette[index]
+
+
+def rasterize_timeline(traces, color_map, width, lane_height=40, gap=10, mode="dominant"):
+    """
+    Rasterize several schedules into one image, one lane per schedule.
+    
+    All the lanes share the time scale of the longest schedule.
+    
+    Args:
+        traces (list): The schedules, from top to bottom.
+        color_map (dict): Color of each pid (-1 for idle time).
+        width (int): Width of the image, in pixels.
+        lane_height (int): Height of each lane, in pixels.
+        gap (int): Blank pixels between two lanes.
+        mode (str): How a bucket's process is picked, as in ``bucket_pids``.
+    
+    Returns:
+        ndarray: A (height, width, 3) uint8 RGB image.
+    """
+    traces = [ScheduleTrace.from_schedule(trace) for trace in traces]
+    total_time = max((trace.total_time for trace in traces), default=0)
+    height = len(traces) * (lane_height + gap) - gap if traces else 0
+    image = np.full((height, width, 3), 255, dtype=np.uint8)
+    
+    for lane, trace in enumerate(traces):
+        row = rasterize_trace(trace, color_map, width, total_time, mode)
+        top = lane * (lane_height + gap)
+        image[top:top + lane_height] = np.round(row * 255).astype(np.uint8)
+    
+    return image
+
+
+def save_raster(image, filename):
+    """
+    Save an RGB buffer as an image file.
+    
+    Args:
+        image (ndarray): A (height, width, 3) RGB image.
+        filename (str): Path to the output file; the extension selects the format.
+    
+    Returns:
+        str: Path to the saved file.
+    """
+    plt.imsave(filename, image)
+    return filename
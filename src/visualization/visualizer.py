@@ -4,11 +4,24 @@ This module provides functions to visualize CPU scheduling results.
 """
 
 import os
+from concurrent.futures import ProcessPoolExecutor
 import matplotlib
 matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 import numpy as np
+from matplotlib.collections import PolyCollection
 from matplotlib.patches import Patch
+from src.process import ProcessTable
+from src.schedule_trace import ScheduleTrace
+from src.visualization.raster import rasterize_trace
+
+
+# Processes listed in the legend of a chart, beyond which only idle time is listed
+MAX_LEGEND_ENTRIES = 30
+# Total number of slices above which timeline comparisons are rasterized
+RASTER_SLICE_THRESHOLD = 20000
+# Width of rasterized timelines, in pixels (about the width of the axes at 300 dpi)
+RASTER_WIDTH = 3000
 
 
 def generate_colors(num_processes):
@@ -56,45 +69,57 @@ def visualize_schedule(schedule, processes, algorithm_name, output_dir="output")
     """
     Visualize the schedule using a Gantt chart.
     
+    All the slices are drawn as one collection, with their rows looked up in a pid index,
+    and the slice end times and process labels are thinned out so that they do not
+    overlap, so long traces render in seconds.
+    
     Args:
-        schedule (list): List of (pid, time_slice) tuples.
-        processes (list): List of Process objects.
+        schedule (list or ScheduleTrace): List of (pid, time_slice) tuples.
+        processes (list or ProcessTable): Scheduled processes.
         algorithm_name (str): Name of the scheduling algorithm.
         output_dir (str): Directory to save the visualization.
     
     Returns:
         str: Path to the saved visualization file.
     """
+    if not isinstance(processes, ProcessTable):
+        processes = ProcessTable.from_processes(processes)
+    trace = ScheduleTrace.from_schedule(schedule)
+    n_processes = len(processes)
+    pids = processes.pid
+    
      
-    process_map = {process.pid: process for process in processes}
+    colors = np.array(generate_colors(n_processes + 1)[:n_processes] + ['#d3d3d3'])
     
      
-    colors = generate_colors(len(processes) + 1)   
-    color_map = {process.pid: colors[i] for i, process in enumerate(processes)}
-    color_map[-1] = '#d3d3d3'  # Light gray for idle time
+    slice_pids = trace.pids.astype(np.int64)
+    starts = trace.starts
+    ends = starts + trace.durations
+    rows = pid_rows(pids, slice_pids)
+    idle = slice_pids == -1
+    drawn = idle | (rows >= 0)
     
      
     fig, ax = plt.subplots(figsize=(12, 6))
     
-    current_time = 0
-    y_ticks = []
-    y_labels = []
+    bottoms = np.where(idle, 0, rows)[drawn]
+    tops = np.where(idle, n_processes, rows + 1)[drawn]
+    bars = PolyCollection(
+        slice_rectangles(starts[drawn], ends[drawn], bottoms, tops),
+        facecolors=colors[np.where(idle, n_processes, rows)[drawn]]
+    )
+    ax.add_collection(bars)
+    ax.autoscale_view()
     
      
-    for i, (pid, time_slice) in enumerate(schedule):
-        if pid == -1:   
-            ax.broken_barh([(current_time, time_slice)], (0, len(processes)), facecolors=color_map[-1])
-        else:
-             
-            process_idx = next((i for i, p in enumerate(processes) if p.pid == pid), None)
-            if process_idx is not None:
-                ax.broken_barh([(current_time, time_slice)], (process_idx, 1), facecolors=color_map[pid])
-        
-         
-        ax.text(current_time + time_slice / 2, len(processes) + 0.5, str(current_time + time_slice),
+    font_width = 8 * 0.65 * fig.dpi / 72
+    axis_width = ax.get_window_extent().width
+    time_per_pixel = max(1, trace.total_time) / axis_width
+    labels = [str(end) for end in ends.tolist()]
+    label_widths = np.array([len(label) for label in labels]) * font_width * time_per_pixel
+    for i in thin_labels((starts + ends) / 2, label_widths, 2 * font_width * time_per_pixel).tolist():
+        ax.text((starts[i] + ends[i]) / 2, n_processes + 0.5, labels[i],
                 ha='center', va='center', fontsize=8)
-        
-        current_time += time_slice
     
      
     ax.set_xlabel('Time')
@@ -102,15 +127,20 @@ def visualize_schedule(schedule, processes, algorithm_name, output_dir="output")
     ax.set_title(f'CPU Schedule - {algorithm_name.upper()}')
     
      
-    ax.set_yticks(np.arange(len(processes)) + 0.5)
-    ax.set_yticklabels([f'P{process.pid}' for process in processes])
+    row_height = ax.get_window_extent().height / max(1, n_processes)
+    tick_rows = np.arange(0, n_processes, max(1, int(np.ceil(12 * fig.dpi / 72 / row_height))))
+    ax.set_yticks(tick_rows + 0.5)
+    ax.set_yticklabels([f'P{pid}' for pid in pids[tick_rows].tolist()])
     
      
-    legend_elements = [
-        Patch(facecolor=color_map[process.pid], label=f'P{process.pid}')
-        for process in processes
-    ]
-    legend_elements.append(Patch(facecolor=color_map[-1], label='Idle'))
+    if n_processes <= MAX_LEGEND_ENTRIES:
+        legend_elements = [
+            Patch(facecolor=colors[i], label=f'P{pid}')
+            for i, pid in enumerate(pids.tolist())
+        ]
+    else:
+        legend_elements = []
+    legend_elements.append(Patch(facecolor=colors[-1], label='Idle'))
     ax.legend(handles=legend_elements, loc='upper right')
     
      
@@ -118,8 +148,8 @@ def visualize_schedule(schedule, processes, algorithm_name, output_dir="output")
     
      
     metrics_text = (
-        f"Average Turnaround Time: {sum(p.turnaround_time for p in processes) / len(processes):.2f}\n"
-        f"Average Waiting Time: {sum(p.waiting_time for p in processes) / len(processes):.2f}\n"
+        f"Average Turnaround Time: {processes.turnaround_time.mean() if n_processes else 0:.2f}\n"
+        f"Average Waiting Time: {processes.waiting_time.mean() if n_processes else 0:.2f}\n"
     )
     plt.gcf().text(0.02, 0.02, metrics_text, fontsize=10)
     
@@ -132,25 +162,153 @@ def visualize_schedule(schedule, processes, algorithm_name, output_dir="output")
     return output_file
 
 
-def compare_schedulers(results, output_dir="output"):
+def pid_rows(pids, slice_pids):
+    """
+    Find the row of the process of each slice.
+    
+    Args:
+        pids (ndarray): Process ID of each row.
+        slice_pids (ndarray): Process ID of each slice.
+    
+    Returns:
+        ndarray: Row of each slice, or -1 for idle time and unknown processes.
+    """
+    if not len(pids):
+        return np.full(len(slice_pids), -1, dtype=np.int64)
+    
+    order = np.argsort(pids, kind='stable')
+    sorted_pids = pids[order]
+    positions = np.minimum(np.searchsorted(sorted_pids, slice_pids), len(pids) - 1)
+    return np.where(sorted_pids[positions] == slice_pids, order[positions], -1)
+
+
+def slice_rectangles(starts, ends, bottoms, tops):
+    """
+    Build the corners of one rectangle per slice, for a PolyCollection.
+    
+    Args:
+        starts (ndarray): Left edge of each rectangle.
+        ends (ndarray): Right edge of each rectangle.
+        bottoms (ndarray): Bottom edge of each rectangle.
+        tops (ndarray): Top edge of each rectangle.
+    
+    Returns:
+        ndarray: A (n, 4, 2) array of rectangle corners.
+    """
+    return np.stack([
+        np.column_stack([starts, bottoms]),
+        np.column_stack([starts, tops]),
+        np.column_stack([ends, tops]),
+        np.column_stack([ends, bottoms])
+    ], axis=1).astype(np.float64)
+
+
+def thin_labels(centers, widths, spacing=0):
+    """
+    Pick labels that do not overlap, from left to right.
+    
+    Args:
+        centers (ndarray): Center of each label, in increasing order.
+        widths (ndarray): Width of each label, in the same unit.
+        spacing (float): Minimum gap between two kept labels.
+    
+    Returns:
+        ndarray: Indices of the labels to draw.
+    """
+    keep = []
+    edge = -np.inf
+    for i, (center, width) in enumerate(zip(centers.tolist(), widths.tolist())):
+        if center - width / 2 >= edge:
+            keep.append(i)
+            edge = center + width / 2 + spacing
+    return np.array(keep, dtype=np.intp)
+
+
+def compare_schedulers(results, output_dir="output", parallel=None, max_workers=None):
     """
     Create comparative visualizations for different scheduling algorithms.
     
+    The metric bar charts and the timeline comparison are drawn at the same time, in
+    separate worker processes.
+    
     Args:
         results (dict): Dictionary of results from different schedulers.
         output_dir (str): Directory to save the visualizations.
+        parallel (bool, optional): Draw the charts in worker processes (default: when
+            more than one CPU is available).
+        max_workers (int, optional): Number of worker processes (default: one per chart).
     
     Returns:
         str: Path to the saved comparison visualization file.
     """
-     
+    charts = render_charts(results, output_dir, gantt=False, parallel=parallel,
+                           max_workers=max_workers)
+    return charts["scheduler_comparison"]
+
+
+def render_charts(results, output_dir="output", gantt=True, parallel=None, max_workers=None):
+    """
+    Draw all the charts of a comparison, each figure in its own worker process.
+    
+    Every chart is an independent matplotlib job, so drawing them at once takes about
+    as long as the slowest one. Workers only receive the data their chart needs.
+    
+    Args:
+        results (dict): Dictionary of results from different schedulers.
+        output_dir (str): Directory to save the visualizations.
+        gantt (bool): Also draw the Gantt chart of each algorithm.
+        parallel (bool, optional): Draw the charts in worker processes (default: when
+            more than one CPU is available).
+        max_workers (int, optional): Number of worker processes (default: one per chart).
+    
+    Returns:
+        dict: Path of each saved chart, keyed by "scheduler_comparison",
+            "timeline_comparison" and "<algorithm>_gantt".
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    
+    charts = {
+        "scheduler_comparison": (visualize_metric_comparison, (
+            {algo: result["metrics"] for algo, result in results.items()}, output_dir)),
+        "timeline_comparison": (visualize_timeline_comparison, (
+            {algo: {"schedule": result["schedule"]} for algo, result in results.items()},
+            output_dir))
+    }
+    if gantt:
+        for algo, result in results.items():
+            charts[f"{algo}_gantt"] = (visualize_schedule, (
+                result["schedule"], result["processes"], algo, output_dir))
+    
+    if parallel is None:
+        parallel = (os.cpu_count() or 1) > 1
+    if not parallel:
+        return {name: function(*args) for name, (function, args) in charts.items()}
+    
+    with ProcessPoolExecutor(max_workers or len(charts)) as executor:
+        futures = {name: executor.submit(function, *args)
+                   for name, (function, args) in charts.items()}
+        return {name: future.result() for name, future in futures.items()}
+
+
+def visualize_metric_comparison(metrics, output_dir="output"):
+    """
+    Draw bar charts of the average turnaround time, average waiting time and CPU
+    utilization of different scheduling algorithms.
+    
+    Args:
+        metrics (dict): Metrics of each algorithm.
+        output_dir (str): Directory to save the visualization.
+    
+    Returns:
+        str: Path to the saved visualization file.
+    """
     os.makedirs(output_dir, exist_ok=True)
     
      
-    algorithms = list(results.keys())
-    avg_turnaround_times = [results[algo]["metrics"]["avg_turnaround_time"] for algo in algorithms]
-    avg_waiting_times = [results[algo]["metrics"]["avg_waiting_time"] for algo in algorithms]
-    cpu_utilizations = [results[algo]["metrics"]["cpu_utilization"] for algo in algorithms]
+    algorithms = list(metrics.keys())
+    avg_turnaround_times = [metrics[algo]["avg_turnaround_time"] for algo in algorithms]
+    avg_waiting_times = [metrics[algo]["avg_waiting_time"] for algo in algorithms]
+    cpu_utilizations = [metrics[algo]["cpu_utilization"] for algo in algorithms]
     
      
     fig, axes = plt.subplots(3, 1, figsize=(10, 15))
@@ -184,19 +342,22 @@ def compare_schedulers(results, output_dir="output"):
     plt.savefig(output_file, dpi=300, bbox_inches='tight')
     plt.close()
     
-     
-    visualize_timeline_comparison(results, output_dir)
-    
     return output_file
 
 
-def visualize_timeline_comparison(results, output_dir="output"):
+def visualize_timeline_comparison(results, output_dir="output", raster=None):
     """
     Create a timeline comparison visualization for different scheduling algorithms.
     
+    Long schedules are rasterized with NumPy into one row of RASTER_WIDTH pixels per
+    algorithm, each pixel showing the process that ran the longest in its time bucket,
+    instead of being drawn slice by slice.
+    
     Args:
         results (dict): Dictionary of results from different schedulers.
         output_dir (str): Directory to save the visualizations.
+        raster (bool, optional): Rasterize the timelines (default: when the schedules
+            have more than RASTER_SLICE_THRESHOLD slices in total).
     
     Returns:
         str: Path to the saved timeline comparison visualization file.
@@ -211,43 +372,54 @@ def visualize_timeline_comparison(results, output_dir="output"):
         axes = [axes]
     
      
-    first_algorithm = algorithms[0]
-    first_schedule = results[first_algorithm]["schedule"]
+    traces = {algo: ScheduleTrace.from_schedule(results[algo]["schedule"]) for algo in algorithms}
     
      
     max_time = 0
     for algo in algorithms:
-        schedule = results[algo]["schedule"]
-        total_time = sum(time_slice for _, time_slice in schedule)
-        max_time = max(max_time, total_time)
+        max_time = max(max_time, traces[algo].total_time)
     
      
     process_pids = set()
     for algo in algorithms:
-        schedule = results[algo]["schedule"]
-        for pid, _ in schedule:
-            if pid != -1:   
-                process_pids.add(pid)
+        pids = np.unique(traces[algo].pids)
+        process_pids.update(pids[pids != -1].tolist())
     
     colors = generate_colors(len(process_pids) + 1)   
     color_map = {pid: colors[i] for i, pid in enumerate(sorted(process_pids))}
     color_map[-1] = '#d3d3d3'  # Light gray for idle time
     
+    if raster is None:
+        raster = sum(len(trace) for trace in traces.values()) > RASTER_SLICE_THRESHOLD
+    font_width = 8 * 0.65 * fig.dpi / 72
+    time_per_pixel = max(1, max_time) / axes[0].get_window_extent().width
+    
      
     for i, algorithm in enumerate(algorithms):
         ax = axes[i]
-        schedule = results[algorithm]["schedule"]
+        trace = traces[algorithm]
         
-        current_time = 0
-        for pid, time_slice in schedule:
-            ax.broken_barh([(current_time, time_slice)], (0, 1), facecolors=color_map[pid])
+        if raster:
+            row = rasterize_trace(trace, color_map, RASTER_WIDTH, max_time)
+            ax.imshow(row[np.newaxis], extent=(0, max_time, 0, 1), aspect='auto',
+                      interpolation='nearest')
+        else:
+            slice_pids = trace.pids
+            starts = trace.starts
+            ends = starts + trace.durations
+            lane_colors = np.array([color_map[pid] for pid in slice_pids.tolist()])
+            ax.add_collection(PolyCollection(
+                slice_rectangles(starts, ends, np.zeros(len(trace)), np.ones(len(trace))),
+                facecolors=lane_colors
+            ))
             
-             
-            if time_slice > 1:   
-                ax.text(current_time + time_slice / 2, 0.5, f'P{pid}' if pid != -1 else 'Idle',
-                        ha='center', va='center', fontsize=8)
             
-            current_time += time_slice
+            labeled = np.flatnonzero(trace.durations > 1)
+            labels = [f'P{pid}' if pid != -1 else 'Idle' for pid in slice_pids[labeled].tolist()]
+            widths = np.array([len(label) for label in labels]) * font_width * time_per_pixel
+            centers = (starts[labeled] + ends[labeled]) / 2
+            for j in thin_labels(centers, widths, font_width * time_per_pixel).tolist():
+                ax.text(centers[j], 0.5, labels[j], ha='center', va='center', fontsize=8)
         
          
         ax.set_xlim(0, max_time)
@@ -271,7 +443,7 @@ def visualize_timeline_comparison(results, output_dir="output"):
     legend_elements = [
         Patch(facecolor=color_map[pid], label=f'P{pid}')
         for pid in sorted(process_pids)
-    ]
+    ] if len(process_pids) <= MAX_LEGEND_ENTRIES else []
     legend_elements.append(Patch(facecolor=color_map[-1], label='Idle'))
     fig.legend(handles=legend_elements, loc='upper right', bbox_to_anchor=(1, 1))
     
@@ -279,8 +451,45 @@ def visualize_timeline_comparison(results, output_dir="output"):
     plt.subplots_adjust(top=0.9, right=0.85)
     
      
+    os.makedirs(output_dir, exist_ok=True)
     output_file = os.path.join(output_dir, "timeline_comparison.png")
     plt.savefig(output_file, dpi=300, bbox_inches='tight')
     plt.close()
     
-    return output_file
\ No newline at end of file
+    return output_file
+
+
+def visualize_quantum_sweep(sweep, metric, output_dir="output"):
+    """
+    Plot a metric against the time quantum for each swept algorithm.
+    
+    Args:
+        sweep (dict): Sweep results, as returned by ``sweep_quantum``.
+        metric (str): Name of the swept metric.
+        output_dir (str): Directory to save the visualization.
+    
+    Returns:
+        str: Path to the saved visualization file.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    
+    fig, ax = plt.subplots(figsize=(10, 6))
+    
+    for algorithm, result in sweep.items():
+        line, = ax.plot(result["quanta"], result["values"], marker='.', label=algorithm.upper())
+        ax.scatter([result["best_quantum"]], [result["best_value"]], s=80, color=line.get_color(),
+                   edgecolors='black', zorder=3)
+        ax.annotate(f'q={result["best_quantum"]}', (result["best_quantum"], result["best_value"]),
+                    textcoords='offset points', xytext=(5, 8), fontsize=8)
+    
+    ax.set_xlabel('Time Quantum')
+    ax.set_ylabel(metric.replace('_', ' ').title())
+    ax.set_title(f'{metric.replace("_", " ").title()} vs Time Quantum')
+    ax.grid(True, linestyle='--', alpha=0.7)
+    ax.legend()
+    
+    output_file = os.path.join(output_dir, "quantum_sweep.png")
+    plt.savefig(output_file, dpi=300, bbox_inches='tight')
+    plt.close()
+    
+    return output_file
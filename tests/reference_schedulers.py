@@ -0,0 +1,258 @@
+"""
+Reference Schedulers Module
+This module keeps straightforward list-based implementations of the scheduling algorithms,
+as they were before the engines were optimized, to check the engines against.
+
+They scan the ready queue on every step, so they are only meant for small workloads.
+"""
+
+import copy
+from collections import defaultdict, deque
+
+
+class ReferenceProcess:
+    """A minimal process record with the run state used by the reference schedulers."""
+    
+    def __init__(self, pid, arrival_time, burst_time, priority=1):
+        """Initialize a process that has not run yet."""
+        self.pid = pid
+        self.arrival_time = arrival_time
+        self.burst_time = burst_time
+        self.priority = priority
+        self.remaining_time = burst_time
+        self.start_time = None
+        self.finish_time = None
+        self.waiting_time = 0
+        self.turnaround_time = 0
+    
+    def start(self, time):
+        """Record the first time the process runs."""
+        if self.start_time is None:
+            self.start_time = time
+    
+    def execute(self, time_quantum):
+        """Run the process for up to ``time_quantum`` and return the time used."""
+        executed_time = min(time_quantum, self.remaining_time)
+        self.remaining_time -= executed_time
+        return executed_time
+    
+    def is_completed(self):
+        """Return whether the process has no CPU time left."""
+        return self.remaining_time <= 0
+    
+    def complete(self, time):
+        """Record the finish time and compute the waiting and turnaround times."""
+        self.finish_time = time
+        if self.start_time is not None:
+            self.turnaround_time = self.finish_time - self.arrival_time
+            self.waiting_time = self.turnaround_time - self.burst_time
+
+
+def _run_to_completion(processes, key):
+    """
+    Schedule processes with a non-preemptive policy picking the ready process of lowest key.
+    
+    Args:
+        processes (list): ReferenceProcess objects. Their results are updated.
+        key (callable): Sort key of the ready queue.
+    
+    Returns:
+        list: The schedule as (pid, time_slice) tuples.
+    """
+    processes_copy = copy.deepcopy(processes)
+    current_time = 0
+    schedule = []
+    ready_queue = []
+    completed = {}
+    
+    while len(completed) < len(processes_copy):
+        for process in processes_copy:
+            if (process.arrival_time <= current_time and process.pid not in completed and
+                    process not in ready_queue and not process.is_completed()):
+                ready_queue.append(process)
+        
+        if not ready_queue:
+            arrivals = [process.arrival_time for process in processes_copy
+                        if process.arrival_time > current_time and process.pid not in completed]
+            if not arrivals:
+                break
+            schedule.append((-1, min(arrivals) - current_time))
+            current_time = min(arrivals)
+            continue
+        
+        ready_queue.sort(key=key)
+        process = ready_queue[0]
+        process.start(current_time)
+        time_slice = process.remaining_time
+        process.execute(time_slice)
+        schedule.append((process.pid, time_slice))
+        current_time += time_slice
+        
+        process.complete(current_time)
+        completed[process.pid] = process
+        for original in processes:
+            if original.pid == process.pid:
+                original.start_time = process.start_time
+                original.finish_time = process.finish_time
+                original.waiting_time = process.waiting_time
+                original.turnaround_time = process.turnaround_time
+                original.remaining_time = 0
+                break
+        ready_queue.remove(process)
+    
+    return schedule
+
+
+def _round_robin(processes, quantum):
+    """
+    Schedule processes with Round Robin.
+    
+    Args:
+        processes (list): ReferenceProcess objects. Their results are updated, and the list
+            is sorted by arrival time.
+        quantum (int): Time quantum.
+    
+    Returns:
+        list: The schedule as (pid, time_slice) tuples.
+    """
+    processes.sort(key=lambda p: p.arrival_time)
+    current_time = 0
+    schedule = []
+    queue = []
+    index = 0
+    
+    def admit():
+        """Append the processes that have arrived by now to the queue."""
+        nonlocal index
+        while index < len(processes) and processes[index].arrival_time <= current_time:
+            queue.append(processes[index])
+            index += 1
+    
+    while index < len(processes) or queue:
+        admit()
+        if not queue:
+            schedule.append((-1, processes[index].arrival_time - current_time))
+            current_time = processes[index].arrival_time
+            continue
+        
+        process = queue.pop(0)
+        process.start(current_time)
+        time_slice = min(quantum, process.remaining_time)
+        process.execute(time_slice)
+        schedule.append((process.pid, time_slice))
+        current_time += time_slice
+        
+        admit()
+        if not process.is_completed():
+            queue.append(process)
+        else:
+            process.complete(current_time)
+    
+    return schedule
+
+
+def _priority_round_robin(processes, quantum):
+    """
+    Schedule processes with Round Robin within priority levels.
+    
+    Args:
+        processes (list): ReferenceProcess objects. Their results are updated.
+        quantum (int): Time quantum.
+    
+    Returns:
+        list: The schedule as (pid, time_slice) tuples.
+    """
+    processes_copy = copy.deepcopy(processes)
+    current_time = 0
+    schedule = []
+    ready_queue = []
+    completed = {}
+    queues = defaultdict(deque)
+    
+    def queued(process):
+        """Return whether a process is in one of the priority queues."""
+        return any(process in queue for queue in queues.values())
+    
+    while len(completed) < len(processes_copy):
+        for process in processes_copy:
+            if (process.arrival_time <= current_time and process.pid not in completed and
+                    process not in ready_queue and not process.is_completed()):
+                ready_queue.append(process)
+        
+        if not ready_queue:
+            arrivals = [process.arrival_time for process in processes_copy
+                        if process.arrival_time > current_time and process.pid not in completed]
+            if not arrivals:
+                break
+            schedule.append((-1, min(arrivals) - current_time))
+            current_time = min(arrivals)
+            continue
+        
+        for process in ready_queue:
+            if not queued(process) and not process.is_completed():
+                queues[process.priority].append(process)
+        for priority in [priority for priority, queue in queues.items() if not queue]:
+            del queues[priority]
+        if not queues:
+            break
+        process = queues[min(queues)].popleft()
+        
+        process.start(current_time)
+        time_slice = min(quantum, process.remaining_time)
+        process.execute(time_slice)
+        schedule.append((process.pid, time_slice))
+        current_time += time_slice
+        for other in ready_queue:
+            if (other.arrival_time <= current_time and not queued(other) and
+                    not other.is_completed() and other != process):
+                queues[other.priority].append(other)
+        if not process.is_completed():
+            queues[process.priority].append(process)
+            continue
+        
+        process.complete(current_time)
+        completed[process.pid] = process
+        for original in processes:
+            if original.pid == process.pid:
+                original.start_time = process.start_time
+                original.finish_time = process.finish_time
+                original.waiting_time = process.waiting_time
+                original.turnaround_time = process.turnaround_time
+                original.remaining_time = 0
+                break
+        ready_queue.remove(process)
+    
+    return schedule
+
+
+def reference_schedule(algorithm, workload, quantum=2):
+    """
+    Schedule a workload with a reference scheduler.
+    
+    Args:
+        algorithm (str): "fcfs", "sjf", "priority", "rr" or "priority_rr".
+        workload (list): (pid, arrival_time, burst_time, priority) tuples.
+        quantum (int): Time quantum for the Round Robin algorithms.
+    
+    Returns:
+        tuple: (schedule, results), the schedule as (pid, time_slice) tuples and, per pid,
+            the (start_time, finish_time, waiting_time, turnaround_time) of the process.
+    """
+    processes = [ReferenceProcess(*row) for row in workload]
+    
+    if algorithm == "fcfs":
+        schedule = _run_to_completion(processes, lambda p: p.arrival_time)
+    elif algorithm == "sjf":
+        schedule = _run_to_completion(processes, lambda p: p.remaining_time)
+    elif algorithm == "priority":
+        schedule = _run_to_completion(processes, lambda p: p.priority)
+    elif algorithm == "rr":
+        schedule = _round_robin(processes, quantum)
+    elif algorithm == "priority_rr":
+        schedule = _priority_round_robin(processes, quantum)
+    else:
+        raise ValueError(f"Unknown algorithm: {algorithm}")
+    
+    results = {p.pid: (p.start_time, p.finish_time, p.waiting_time, p.turnaround_time)
+               for p in processes}
+    return schedule, results
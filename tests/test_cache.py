@@ -0,0 +1,110 @@
+"""
+Tests of the content-addressed simulation result cache.
+"""
+
+import os
+
+import pytest
+
+from src.process import Process
+from src.simulation import (ResultCache, configure_result_cache, result_key, run_all_simulations,
+                            run_simulation, workload_hash)
+from src.simulation import cache as cache_module
+from test_schedulers import SMALL_WORKLOAD, as_table, list_results
+
+
+@pytest.fixture
+def shared_cache():
+    previous = cache_module.result_cache
+    yield configure_result_cache(max_entries=8)
+    cache_module.result_cache = previous
+
+
+def age(cache, key, seconds):
+    """Set the modification time of a disk tier file to ``seconds`` after the epoch."""
+    os.utime(cache._path(key), (seconds, seconds))
+
+
+def test_memory_tier_evicts_least_recently_used():
+    cache = ResultCache(max_entries=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == (1, 3)
+    assert cache.stats() == {"hits": 3, "misses": 1, "memory_hits": 3, "disk_hits": 0,
+                             "hit_rate": 0.75, "memory_entries": 2, "disk_entries": 0,
+                             "disk_bytes": 0}
+
+
+def test_disk_tier_serves_and_promotes_values(tmp_path):
+    ResultCache(directory=str(tmp_path)).put("key", {"value": [1, 2, 3]})
+    cache = ResultCache(max_entries=4, directory=str(tmp_path))
+    
+    assert cache.get("key") == {"value": [1, 2, 3]}
+    assert cache.get("key") == {"value": [1, 2, 3]}
+    
+    stats = cache.stats()
+    assert (stats["disk_hits"], stats["memory_hits"], stats["disk_entries"]) == (1, 1, 1)
+    assert stats["disk_bytes"] == os.path.getsize(cache._path("key"))
+    cache.clear()
+    assert cache.get("key") is None and not list(tmp_path.iterdir())
+
+
+def test_disk_tier_keeps_to_its_byte_budget(tmp_path):
+    cache = ResultCache(max_entries=0, directory=str(tmp_path))
+    payload = b"x" * 1000
+    for index, key in enumerate("abc"):
+        cache.put(key, payload)
+        age(cache, key, 1000 + index)
+    cache.get("a")
+    size = os.path.getsize(cache._path("a"))
+    cache.max_bytes = 3 * size
+    
+    cache.put("d", payload)
+    
+    assert cache.get("b") is None
+    assert all(cache.get(key) == payload for key in "acd")
+    assert cache.stats()["disk_bytes"] <= 3 * size
+
+
+def test_unreadable_disk_entries_are_misses(tmp_path):
+    cache = ResultCache(directory=str(tmp_path))
+    with open(cache._path("broken"), "wb") as file:
+        file.write(b"not a pickle")
+    
+    assert cache.get("broken") is None
+    assert cache.stats()["misses"] == 1
+
+
+def test_keys_depend_on_what_was_simulated():
+    processes = [Process(*row) for row in SMALL_WORKLOAD]
+    digest = workload_hash(as_table(SMALL_WORKLOAD))
+    
+    assert workload_hash(processes) == digest
+    assert workload_hash(as_table(SMALL_WORKLOAD[1:])) != digest
+    assert result_key(digest, "fcfs", 2) == result_key(digest, "fcfs", 5)
+    assert result_key(digest, "rr", 2) != result_key(digest, "rr", 5)
+    assert result_key(digest, "rr", 2) != result_key(digest, "priority_rr", 2)
+    assert result_key(digest, "rr", 2) != result_key(digest, "rr", 2, kind="metrics")
+
+
+def test_run_simulation_is_served_from_the_cache(shared_cache):
+    table = as_table(SMALL_WORKLOAD)
+    schedule, metrics, run = run_simulation("rr", table, 2)
+    run.start_time[:] = -5
+    
+    cached_schedule, cached_metrics, cached_run = run_simulation("rr", as_table(SMALL_WORKLOAD), 2)
+    
+    assert cached_schedule is schedule
+    assert cached_metrics == metrics
+    assert list_results(cached_run.to_processes()) == \
+        list_results(run_simulation("rr", table, 2, cache=False)[2].to_processes())
+    assert shared_cache.stats()["hits"] == 1
+    
+    results = run_all_simulations(table, 2, parallel=False)
+    assert results["rr"]["schedule"] is schedule
+    assert shared_cache.stats()["hits"] == 2
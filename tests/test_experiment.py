@@ -0,0 +1,86 @@
+"""
+Tests of the seeded Monte Carlo experiment runner and its confidence intervals.
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+from src.simulation import run_experiment, run_simulation, spawn_seeds, summarize_samples
+from src.simulation.experiment import T_CRITICAL_TABLE, t_critical
+from src.utils.process_generator import generate_random_processes
+
+
+# Published two-sided critical values of Student's t distribution
+T_REFERENCE = [(0.95, 1, 12.706205), (0.95, 2, 4.302653), (0.95, 5, 2.570582),
+               (0.95, 30, 2.042272), (0.95, 40, 2.021075), (0.95, 60, 2.000298),
+               (0.95, 120, 1.979930), (0.99, 1, 63.656741), (0.99, 10, 3.169273),
+               (0.99, 40, 2.704459), (0.99, 120, 2.617421), (0.90, 40, 1.683851),
+               (0.90, 120, 1.657651)]
+
+
+@pytest.mark.parametrize("confidence, dof, expected", T_REFERENCE)
+def test_t_critical_matches_published_values(confidence, dof, expected):
+    assert t_critical(confidence, dof) == pytest.approx(expected, abs=2e-4)
+
+
+def test_t_critical_is_decreasing_past_the_table():
+    for confidence in T_CRITICAL_TABLE:
+        values = [t_critical(confidence, dof) for dof in range(1, 200)]
+        assert all(a > b for a, b in zip(values, values[1:])), confidence
+    assert t_critical(0.95, 0) == math.inf
+
+
+def test_summary_intervals():
+    samples = [{"rr": {"avg_waiting_time": value, "completed": 10}} for value in (2.0, 4.0, 9.0)]
+    
+    summary = summarize_samples(samples)["rr"]
+    
+    waiting = summary["avg_waiting_time"]
+    std = np.std([2.0, 4.0, 9.0], ddof=1)
+    assert waiting["mean"] == pytest.approx(5.0)
+    assert waiting["std"] == pytest.approx(std)
+    assert waiting["half_width"] == pytest.approx(4.302653 * std / math.sqrt(3))
+    assert (waiting["ci_low"], waiting["ci_high"]) == pytest.approx(
+        (5.0 - waiting["half_width"], 5.0 + waiting["half_width"]))
+    assert waiting["n"] == 3
+    assert summary["completed"]["half_width"] == 0
+    assert summarize_samples([]) == {}
+    single = summarize_samples(samples[:1])["rr"]["avg_waiting_time"]
+    assert (single["mean"], single["half_width"]) == (2.0, 0)
+
+
+def test_experiment_is_reproducible_from_its_seed():
+    workload = {"num_processes": 20}
+    
+    serial = run_experiment(4, seed=7, workload=workload, max_workers=1)
+    parallel = run_experiment(4, seed=7, workload=workload, max_workers=2)
+    other = run_experiment(4, seed=8, workload=workload, max_workers=1)
+    
+    assert serial["seed"] == 7
+    assert serial["samples"] == parallel["samples"]
+    assert serial["summary"] == parallel["summary"]
+    assert serial["samples"] != other["samples"]
+    
+    first_seed = spawn_seeds(7, 4)[0]
+    table = generate_random_processes(as_table=True, seed=first_seed, num_processes=20,
+                                      min_burst=1, max_burst=10, min_arrival=0,
+                                      max_arrival=100, min_priority=1, max_priority=10)
+    _, metrics, _ = run_simulation("sjf", table, 2, cache=False)
+    assert serial["samples"][0]["sjf"]["avg_waiting_time"] == metrics["avg_waiting_time"]
+
+
+def test_experiment_options_are_honoured():
+    progress = []
+    
+    result = run_experiment(3, seed=1, workload={"num_processes": 15}, algorithms=["fcfs"],
+                            max_workers=1, progress=lambda done, total, _: progress.append(
+                                (done, total)),
+                            synthetic={"arrival": "bursty", "burst": "pareto"})
+    
+    assert progress == [(1, 3), (2, 3), (3, 3)]
+    assert [list(sample) for sample in result["samples"]] == [["fcfs"]] * 3
+    assert all(sample["fcfs"]["completed"] == 15 for sample in result["samples"])
+    assert result["samples"] != run_experiment(3, seed=1, workload={"num_processes": 15},
+                                               algorithms=["fcfs"], max_workers=1)["samples"]
@@ -0,0 +1,409 @@
+"""
+Round-trip tests of the workload and schedule file formats.
+"""
+
+import csv
+import io
+import json
+
+import numpy as np
+import pytest
+
+from src.process import ProcessTable
+from src.schedule_trace import ScheduleTrace
+from src.utils import file_handler
+from src.utils.file_handler import (iter_process_chunks, load_processes, open_file,
+                                    read_processes_from_file, read_schedule_binary,
+                                    read_workload_binary, write_process_results_jsonl,
+                                    write_processes_to_file, write_schedule_to_file)
+
+
+TEXT_FILES = ["workload.csv", "workload.json", "workload.csv.gz", "workload.json.xz",
+              "workload.csv.bz2", "workload.jsonl", "workload.jsonl.gz"]
+WORKLOAD_FILES = TEXT_FILES + ["workload.npy", "workload.npz"]
+
+
+def random_workload(count, seed=0):
+    """Build a workload with unsorted, tied arrivals and zero bursts."""
+    rng = np.random.default_rng(seed)
+    return ProcessTable(rng.permutation(count) + 1, rng.integers(0, count // 4 + 1, count),
+                        rng.integers(0, 20, count), rng.integers(1, 6, count))
+
+
+def sorted_workload(count, seed=0):
+    """Build a workload sorted by arrival time, with ties."""
+    workload = random_workload(count, seed)
+    workload.arrival_time.sort()
+    return workload
+
+
+def workload_rows(processes):
+    """Get the (pid, arrival_time, burst_time, priority) rows of processes."""
+    if isinstance(processes, ProcessTable):
+        return list(zip(processes.pid.tolist(), processes.arrival_time.tolist(),
+                        processes.burst_time.tolist(), processes.priority.tolist()))
+    return [(p.pid, p.arrival_time, p.burst_time, p.priority) for p in processes]
+
+
+def write_text(path, text):
+    """Write a text file and return its path as a string."""
+    path.write_text(text)
+    return str(path)
+
+
+def spy(monkeypatch, name):
+    """Record the calls of a file_handler function, still calling it."""
+    calls = []
+    function = getattr(file_handler, name)
+    monkeypatch.setattr(file_handler, name,
+                        lambda *args: calls.append(args) or function(*args))
+    return calls
+
+
+@pytest.mark.parametrize("name", WORKLOAD_FILES)
+@pytest.mark.parametrize("as_table", [False, True])
+def test_workload_round_trip(tmp_path, name, as_table):
+    workload = random_workload(500)
+    filename = str(tmp_path / name)
+    
+    assert write_processes_to_file(workload, filename)
+    processes = read_processes_from_file(filename, as_table=as_table)
+    
+    assert isinstance(processes, ProcessTable) == as_table
+    assert workload_rows(processes) == workload_rows(workload)
+
+
+@pytest.mark.parametrize("name", TEXT_FILES)
+def test_chunks_cover_the_file_in_order(tmp_path, name):
+    workload = random_workload(1000, seed=1)
+    filename = str(tmp_path / name)
+    write_processes_to_file(workload, filename)
+    
+    chunks = list(iter_process_chunks(filename, chunk_size=64))
+    
+    assert max(len(chunk) for chunk in chunks) == 64
+    assert [tuple(row) for chunk in chunks for row in chunk.tolist()] == workload_rows(workload)
+
+
+@pytest.mark.parametrize("name", WORKLOAD_FILES)
+@pytest.mark.parametrize("output", [False, True])
+def test_load_processes_sorts_by_arrival_with_stable_ties(tmp_path, name, output):
+    workload = random_workload(5000, seed=2)
+    filename = str(tmp_path / name)
+    write_processes_to_file(workload, filename)
+    rows = workload_rows(workload)
+    expected = [rows[i] for i in np.argsort(workload.arrival_time, kind="stable").tolist()]
+    
+    table = load_processes(filename, output=str(tmp_path / "sorted.npy") if output else None,
+                           chunk_size=300, memory_rows=700)
+    
+    assert workload_rows(table) == expected
+
+
+def test_load_processes_merges_spilled_runs(tmp_path, monkeypatch):
+    workload = random_workload(4000, seed=4)
+    filename = str(tmp_path / "workload.csv")
+    write_processes_to_file(workload, filename)
+    merges = spy(monkeypatch, "_merge_runs")
+    
+    table = load_processes(filename, chunk_size=256, memory_rows=500)
+    
+    assert merges and len(merges[0][1]) > 1
+    assert (np.diff(table.arrival_time) >= 0).all()
+    assert sorted(workload_rows(table)) == sorted(workload_rows(workload))
+
+
+@pytest.mark.parametrize("output", [False, True])
+def test_load_processes_streams_sorted_files_without_spilling(tmp_path, monkeypatch, output):
+    workload = sorted_workload(3000, seed=5)
+    filename = str(tmp_path / "workload.csv")
+    write_processes_to_file(workload, filename)
+    spills = spy(monkeypatch, "_spill_run")
+    
+    table = load_processes(filename, output=str(tmp_path / "sorted.npy") if output else None,
+                           chunk_size=256, memory_rows=500)
+    
+    assert not spills
+    assert workload_rows(table) == workload_rows(workload)
+
+
+def test_load_processes_spills_once_the_order_breaks(tmp_path, monkeypatch):
+    workload = sorted_workload(3000, seed=6)
+    workload.arrival_time[2000:] = workload.arrival_time[2000:][::-1].copy()
+    filename = str(tmp_path / "workload.csv")
+    write_processes_to_file(workload, filename)
+    output = str(tmp_path / "sorted.npy")
+    merges = spy(monkeypatch, "_merge_runs")
+    rows = workload_rows(workload)
+    expected = [rows[i] for i in np.argsort(workload.arrival_time, kind="stable").tolist()]
+    
+    table = load_processes(filename, output=output, chunk_size=256, memory_rows=500)
+    
+    assert merges and merges[0][1][0] == (0, 1792)
+    assert workload_rows(table) == expected
+
+
+@pytest.mark.parametrize("seed", [3, 7])
+def test_load_processes_writes_memory_mapped_output(tmp_path, seed):
+    workload = random_workload(3000, seed=seed) if seed == 3 else sorted_workload(3000, seed)
+    filename = str(tmp_path / "workload.csv")
+    write_processes_to_file(workload, filename)
+    output = str(tmp_path / "sorted.npy")
+    
+    table = load_processes(filename, output=output, chunk_size=256, memory_rows=512)
+    
+    assert isinstance(table.pid, np.memmap)
+    assert (np.diff(table.arrival_time) >= 0).all()
+    assert sorted(workload_rows(table)) == sorted(workload_rows(workload))
+    assert np.load(output).tolist() == [table.pid.tolist(), table.arrival_time.tolist(),
+                                        table.burst_time.tolist(), table.priority.tolist()]
+
+
+def test_load_processes_of_sorted_file_keeps_file_order(tmp_path):
+    rows = [(3, 0, 1, 1), (1, 0, 2, 1), (2, 4, 0, 1)]
+    filename = str(tmp_path / "workload.json")
+    write_processes_to_file(ProcessTable(*zip(*rows)), filename)
+    
+    assert workload_rows(load_processes(filename, memory_rows=1)) == rows
+
+
+def test_csv_columns_in_any_order_and_default_priority(tmp_path):
+    filename = write_text(tmp_path / "workload.csv",
+                          "burst_time,pid,arrival_time\n3,1,0\n0,2,5\n")
+    
+    assert workload_rows(read_processes_from_file(filename)) == [(1, 0, 3, 1), (2, 5, 0, 1)]
+
+
+def test_csv_rows_with_wrong_field_counts_are_rejected(tmp_path, capsys):
+    filename = write_text(tmp_path / "workload.csv",
+                          "pid,arrival_time,burst_time,priority\n2,1,2\n3,2,4,1,9\n")
+    
+    assert read_processes_from_file(filename) == []
+    assert "line 2" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize("row, message", [("1,-1,3,1", "arrival_time"),
+                                          ("1,0,-3,1", "burst_time"),
+                                          ("3000000000,0,3,1", "32-bit")])
+def test_csv_invalid_values_are_rejected(tmp_path, capsys, row, message):
+    filename = write_text(tmp_path / "workload.csv",
+                          f"pid,arrival_time,burst_time,priority\n1,0,2,1\n{row}\n")
+    
+    assert read_processes_from_file(filename) == []
+    output = capsys.readouterr().out
+    assert "line 3" in output and message in output
+
+
+def test_zero_bursts_are_accepted(tmp_path):
+    filename = write_text(tmp_path / "workload.csv",
+                          "pid,arrival_time,burst_time,priority\n1,0,0,1\n2,1,4,2\n")
+    
+    assert workload_rows(read_processes_from_file(filename)) == [(1, 0, 0, 1), (2, 1, 4, 2)]
+
+
+def test_json_invalid_record_is_reported_with_its_number(tmp_path, capsys):
+    filename = write_text(tmp_path / "workload.json",
+                          json.dumps([{"pid": 1, "arrival_time": 0, "burst_time": 2},
+                                      {"pid": 2, "arrival_time": 1}]))
+    
+    assert read_processes_from_file(filename) == []
+    assert "record 2" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize("text, message", [
+    ('[{"pid": 1, "arrival_time": 0, "burst_time": 2},]', "after record 1: trailing ','"),
+    ('[{"pid": 1, "arrival_time": 0, "burst_time": 2}] []', "after record 1: unexpected data"),
+    ('[{"pid": 1, "arrival_time": 0, "burst_time": 2} {}]', "after record 1: expected ','"),
+    ('[{"pid": 1, "arrival_time": 0, "burst_time": 2}, {"pid": 2,, }]', "record 2"),
+    ('[{"pid": 1, "arrival_time": 0, "burst_time": 2}', "unterminated"),
+    ('{"pid": 1}', "expected a JSON array")
+])
+def test_malformed_json_arrays_are_rejected(tmp_path, capsys, text, message):
+    filename = write_text(tmp_path / "workload.json", text)
+    
+    assert read_processes_from_file(filename) == []
+    assert message in capsys.readouterr().out
+
+
+def test_empty_json_array_and_trailing_whitespace(tmp_path):
+    assert read_processes_from_file(write_text(tmp_path / "empty.json", " [ ] \n\n")) == []
+    filename = write_text(tmp_path / "workload.json",
+                          '[{"pid": 1, "arrival_time": 0, "burst_time": 2}]\n  \n')
+    assert workload_rows(read_processes_from_file(filename)) == [(1, 0, 2, 1)]
+
+
+def test_malformed_json_element_fails_without_reading_ahead():
+    record = json.dumps({"pid": 1, "arrival_time": 0, "burst_time": 2})
+    text = f"[{record}, {{\"pid\": 2,, }}, " + ", ".join([record] * 100000) + "]"
+    file = io.StringIO(text)
+    
+    elements = file_handler._iter_json_array(file, block_size=4096)
+    
+    assert next(elements)["pid"] == 1
+    with pytest.raises(ValueError, match="record 2"):
+        next(elements)
+    assert file.tell() <= 3 * 4096
+
+
+def save_columns(filename, columns):
+    """Save workload columns the way another tool would, without the simulator's flags."""
+    if filename.endswith(".npz"):
+        np.savez(filename, **dict(zip(file_handler.PROCESS_FIELDS, columns)))
+    else:
+        np.save(filename, np.array(columns, dtype=np.int64))
+    return filename
+
+
+@pytest.mark.parametrize("name", ["workload.npy", "workload.npz"])
+def test_binary_workloads_record_their_flags(tmp_path, name):
+    unsorted = str(tmp_path / name)
+    sorted_file = str(tmp_path / ("sorted" + name[8:]))
+    write_processes_to_file(random_workload(100), unsorted)
+    write_processes_to_file(sorted_workload(100), sorted_file)
+    
+    table, flags = file_handler._open_workload_binary(unsorted)
+    
+    assert flags == {"checked"}
+    assert isinstance(table.pid, np.memmap)
+    assert file_handler._open_workload_binary(sorted_file)[1] == {"checked", "sorted"}
+    assert file_handler._open_workload_binary(
+        save_columns(str(tmp_path / ("plain" + name[8:])), [[1], [0], [1], [1]]))[1] == set()
+
+
+@pytest.mark.parametrize("name", ["workload.npy", "workload.npz"])
+def test_load_processes_sorts_unflagged_binary_files(tmp_path, name):
+    workload = random_workload(2000, seed=8)
+    filename = save_columns(str(tmp_path / name), [workload.pid, workload.arrival_time,
+                                                   workload.burst_time, workload.priority])
+    rows = workload_rows(workload)
+    
+    table = load_processes(filename)
+    
+    assert workload_rows(table) == [rows[i] for i in
+                                    np.argsort(workload.arrival_time, kind="stable").tolist()]
+
+
+def test_load_processes_output_is_flagged_sorted(tmp_path):
+    filename = str(tmp_path / "workload.csv")
+    write_processes_to_file(random_workload(500, seed=9), filename)
+    output = str(tmp_path / "sorted.npy")
+    
+    table = load_processes(filename, output=output, memory_rows=100)
+    
+    assert file_handler._open_workload_binary(output)[1] == {"sorted"}
+    assert workload_rows(load_processes(output)) == workload_rows(table)
+
+
+@pytest.mark.parametrize("name", ["workload.npy", "workload.npz"])
+@pytest.mark.parametrize("column, value, message", [
+    (1, -4, "process 3: arrival_time must not be negative"),
+    (2, -1, "process 3: burst_time must not be negative"),
+    (0, 1, "process 3: duplicate pid 1"),
+    (0, 1 << 40, "32-bit")
+])
+def test_unflagged_binary_workloads_are_validated(tmp_path, capsys, name, column, value,
+                                                  message):
+    columns = [[1, 2, 3, 4], [0, 1, 2, 3], [1, 0, 2, 2], [1, 1, 1, 1]]
+    columns[column][2] = value
+    filename = save_columns(str(tmp_path / name), columns)
+    
+    with pytest.raises(ValueError, match=message):
+        read_workload_binary(filename)
+    assert len(load_processes(filename)) == 0
+    assert message in capsys.readouterr().out
+
+
+def test_invalid_workloads_are_not_written_to_binary_files(tmp_path, capsys):
+    workload = ProcessTable([1, 2, 1], [0, 1, 2], [1, 1, 1], [1, 1, 1])
+    
+    assert not write_processes_to_file(workload, str(tmp_path / "workload.npy"))
+    assert "process 3: duplicate pid 1" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize("name", ["schedule.npy", "schedule.npz"])
+def test_binary_schedule_round_trip(tmp_path, name):
+    schedule = [(1, 3), (-1, 2), (2, 1), (1, 4)]
+    filename = str(tmp_path / name)
+    
+    assert write_schedule_to_file(iter(schedule), filename)
+    columns = read_schedule_binary(filename)
+    
+    assert list(zip(columns["pid"].tolist(), columns["duration"].tolist())) == schedule
+    assert columns["start"].tolist() == [0, 3, 5, 6]
+
+
+@pytest.mark.parametrize("name", ["workload.csv.gz", "workload.json.xz", "workload.csv.bz2"])
+def test_compressed_files_are_compressed(tmp_path, name):
+    workload = sorted_workload(2000, seed=10)
+    filename = str(tmp_path / name)
+    plain = str(tmp_path / name.rsplit(".", 1)[0])
+    
+    write_processes_to_file(workload, filename)
+    write_processes_to_file(workload, plain)
+    
+    assert (tmp_path / name).stat().st_size < (tmp_path / plain).stat().st_size / 2
+    with open_file(filename, "r") as compressed, open(plain) as uncompressed:
+        assert compressed.read() == uncompressed.read()
+
+
+@pytest.mark.parametrize("name", ["workload.npy.gz", "workload.txt.gz", "workload.txt"])
+def test_unsupported_formats_are_rejected(tmp_path, capsys, name):
+    filename = str(tmp_path / name)
+    
+    assert not write_processes_to_file(random_workload(10), filename)
+    assert read_processes_from_file(filename) == []
+    assert "Unsupported file format" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize("name", ["schedule.csv", "schedule.csv.gz"])
+def test_csv_schedule_round_trip(tmp_path, name):
+    trace = ScheduleTrace([(1, 3), (-1, 2), (2, 1)])
+    filename = str(tmp_path / name)
+    
+    assert write_schedule_to_file(trace, filename)
+    with open_file(filename, "r", newline="") as file:
+        rows = [tuple(int(value) for value in row) for row in list(csv.reader(file))[1:]]
+    
+    assert rows == [(1, 0, 3), (-1, 3, 2), (2, 5, 1)]
+
+
+def test_jsonl_lines_are_parsed_one_by_one(tmp_path, capsys):
+    filename = write_text(tmp_path / "workload.jsonl",
+                          '{"pid": 1, "arrival_time": 0, "burst_time": 0}\n\n'
+                          '{"pid": 2, "arrival_time": 1, "burst_time": 4, "priority": 2}\n')
+    broken = write_text(tmp_path / "broken.jsonl",
+                        '{"pid": 1, "arrival_time": 0, "burst_time": 2}\n{"pid": 2,\n')
+    
+    assert workload_rows(read_processes_from_file(filename)) == [(1, 0, 0, 1), (2, 1, 4, 2)]
+    assert read_processes_from_file(broken) == []
+    assert "line 2" in capsys.readouterr().out
+
+
+def test_jsonl_schedule_round_trip(tmp_path):
+    filename = str(tmp_path / "schedule.jsonl.xz")
+    
+    assert write_schedule_to_file([(4, 2), (5, 1)], filename)
+    with open_file(filename, "r", newline="") as file:
+        slices = [json.loads(line) for line in file]
+    
+    assert slices == [{"pid": 4, "start": 0, "duration": 2}, {"pid": 5, "start": 2, "duration": 1}]
+
+
+def test_results_are_appended_per_algorithm(tmp_path):
+    filename = str(tmp_path / "results.jsonl.gz")
+    run = ProcessTable([7, 8], [0, 1], [2, 3], [1, 2]).new_run()
+    run.start_time[:] = [0, 2]
+    run.finish_time[:] = [2, 5]
+    run.waiting_time[:] = [0, 1]
+    run.turnaround_time[:] = [2, 4]
+    
+    assert write_process_results_jsonl(run, filename, "fcfs")
+    assert write_process_results_jsonl(run, filename, "sjf", append=True)
+    with open_file(filename, "r") as file:
+        results = [json.loads(line) for line in file]
+    
+    assert [(result["algorithm"], result["pid"]) for result in results] == \
+        [("fcfs", 7), ("fcfs", 8), ("sjf", 7), ("sjf", 8)]
+    assert results[1] == {"algorithm": "fcfs", "pid": 8, "arrival_time": 1, "burst_time": 3,
+                          "priority": 2, "start_time": 2, "finish_time": 5, "waiting_time": 1,
+                          "turnaround_time": 4, "response_time": 1}
@@ -0,0 +1,145 @@
+"""
+Tests of the background job queue of the web interface.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app import jobs
+from app.jobs import JobQueue, QueueFullError, result_bytes, run_simulation_job
+from src.schedule_trace import ScheduleTrace
+from test_schedulers import SMALL_WORKLOAD, as_table
+
+
+class Clock:
+    """A settable replacement for the time module used by the job queue."""
+    
+    def __init__(self):
+        self.now = 1000.0
+    
+    def time(self):
+        """Return the current fake time."""
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(jobs, "time", clock)
+    return clock
+
+
+def make_queue(max_workers=0, max_pending=2, result_ttl=60, max_result_bytes=1 << 20):
+    """Build a JobQueue without an application."""
+    queue = JobQueue()
+    queue.max_workers = max_workers
+    queue.max_pending = max_pending
+    queue.result_ttl = result_ttl
+    queue.max_result_bytes = max_result_bytes
+    return queue
+
+
+def trace_result(slices):
+    """Build a job result holding a schedule of ``slices`` distinct slices."""
+    return {"schedules": {"rr": ScheduleTrace((pid % 2, 1) for pid in range(slices))}}
+
+
+def value_result(value):
+    """Build a job result holding a value."""
+    return {"value": value}
+
+
+def fail():
+    """Fail like a simulation job given an invalid workload."""
+    raise ValueError("bad workload")
+
+
+def test_inline_jobs_report_their_status_and_result():
+    queue = make_queue()
+    
+    done = queue.submit(value_result, 3)
+    failed = queue.submit(fail)
+    
+    assert queue.status(done)["status"] == "done"
+    assert queue.result(done) == {"value": 3}
+    assert queue.status(failed)["status"] == "failed"
+    assert queue.status(failed)["error"] == "bad workload"
+    assert queue.result(failed) is None
+    assert queue.status("unknown") is None
+
+
+def test_full_queue_refuses_jobs_until_one_finishes():
+    queue = make_queue(max_workers=1, max_pending=1)
+    queue._executor = ThreadPoolExecutor(1)
+    release = threading.Event()
+    
+    first = queue.submit(release.wait, 5)
+    second = queue.submit(release.wait, 5)
+    
+    with pytest.raises(QueueFullError):
+        queue.submit(release.wait, 5)
+    assert queue.status(second)["status"] == "queued"
+    release.set()
+    queue._executor.shutdown(wait=True)
+    assert queue.status(first)["status"] == queue.status(second)["status"] == "done"
+    queue._executor = ThreadPoolExecutor(1)
+    assert queue.status(queue.submit(value_result, 1)) is not None
+    queue._executor.shutdown(wait=True)
+
+
+def test_finished_jobs_expire_after_their_ttl(clock):
+    queue = make_queue(result_ttl=60)
+    old = queue.submit(value_result, 1)
+    clock.now += 30
+    recent = queue.submit(value_result, 2)
+    
+    clock.now += 45
+    queue.submit(value_result, 3)
+    
+    assert queue.status(old) is None
+    assert queue.result(recent) == {"value": 2}
+
+
+def test_oldest_results_are_dropped_beyond_the_byte_cap(clock):
+    size = result_bytes(trace_result(100))
+    queue = make_queue(max_result_bytes=2 * size)
+    job_ids = []
+    
+    for _ in range(3):
+        job_ids.append(queue.submit(trace_result, 100))
+        clock.now += 1
+    
+    assert size == 100 * 12
+    assert queue.status(job_ids[0]) is None
+    assert all(queue.result(job_id) is not None for job_id in job_ids[1:])
+    huge = queue.submit(trace_result, 1000)
+    assert queue.result(huge) is not None
+    assert [queue.status(job_id) for job_id in job_ids] == [None] * 3
+
+
+def test_worker_cache_counters_are_added_up():
+    queue = make_queue(max_workers=1)
+    queue._executor = ThreadPoolExecutor(1)
+    counters = {"cache_counters": {"hits": 2, "misses": 1, "memory_hits": 2}}
+    before = queue.cache_stats()
+    
+    for _ in range(2):
+        queue.submit(dict, counters)
+    queue._executor.shutdown(wait=True)
+    
+    stats = queue.cache_stats()
+    assert stats["hits"] - before["hits"] == 4
+    assert stats["misses"] - before["misses"] == 2
+    assert stats["memory_hits"] - before["memory_hits"] == 4
+
+
+@pytest.mark.parametrize("algorithm", ["all", "rr"])
+def test_simulation_jobs_return_schedules_and_runs(algorithm):
+    result = run_simulation_job(as_table(SMALL_WORKLOAD), algorithm, 2)
+    
+    assert set(result["schedules"]) == set(result["runs"])
+    assert result_bytes(result) >= sum(trace.nbytes for trace in result["schedules"].values())
+    assert set(result["cache_counters"]) == set(jobs.CACHE_COUNTERS)
+    assert result["type"] == ("comparison" if algorithm == "all" else "single")
@@ -0,0 +1,74 @@
+"""
+Tests of the vectorized metrics engine against metrics computed from the reference schedules.
+"""
+
+import numpy as np
+import pytest
+
+from reference_schedulers import reference_schedule
+from src.schedule_trace import ScheduleTrace
+from src.simulation import ALGORITHMS, run_simulation
+from src.utils.metrics import calculate_context_switches, calculate_fairness_index, calculate_metrics
+from test_schedulers import SEED, as_table, random_workloads
+
+
+def reference_context_switches(schedule):
+    """Count the changes of process in a schedule, skipping idle and zero-length slices."""
+    pids = [pid for pid, time_slice in schedule if pid != -1 and time_slice > 0]
+    return sum(1 for previous, pid in zip(pids, pids[1:]) if pid != previous)
+
+
+@pytest.mark.parametrize("schedule, switches", [
+    ([], 0),
+    ([(1, 3)], 0),
+    ([(1, 2), (1, 3)], 0),
+    ([(1, 2), (2, 3), (1, 1)], 2),
+    ([(1, 2), (-1, 4), (2, 3)], 1),
+    ([(1, 2), (-1, 4), (1, 3)], 0),
+    ([(1, 2), (3, 0), (1, 1)], 0),
+    ([(1, 2), (3, 0), (2, 1)], 1),
+])
+def test_context_switches(schedule, switches):
+    assert calculate_context_switches(schedule) == switches
+    assert calculate_context_switches(ScheduleTrace(schedule)) == switches
+
+
+def test_fairness_index():
+    assert calculate_fairness_index([2, 2, 2, 2]) == pytest.approx(1)
+    assert calculate_fairness_index([5, 0, 0, 0]) == pytest.approx(0.25)
+
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS)
+def test_run_simulation_metrics_match_reference(algorithm):
+    for workload, quantum in random_workloads(SEED + 5, 100):
+        expected, results = reference_schedule(algorithm, workload, quantum)
+        rows = {row[0]: row for row in workload}
+        finished = [pid for pid, result in results.items() if result[1] is not None]
+        arrivals = np.array([rows[pid][1] for pid in finished], dtype=np.int64)
+        bursts = np.array([rows[pid][2] for pid in finished], dtype=np.int64)
+        turnarounds = np.array([results[pid][1] for pid in finished], dtype=np.int64) - arrivals
+        waitings = turnarounds - bursts
+        responses = np.array([results[pid][0] for pid in finished], dtype=np.int64) - arrivals
+        total_time = sum(time_slice for _, time_slice in expected)
+        busy_time = sum(time_slice for pid, time_slice in expected if pid != -1)
+        
+        schedule, metrics, run = run_simulation(algorithm, as_table(workload), quantum,
+                                                cache=False)
+        
+        context = (workload, quantum)
+        assert metrics == calculate_metrics(schedule.to_list(), run.to_processes()), context
+        assert metrics["total_time"] == total_time, context
+        assert metrics["completed"] == len(finished), context
+        assert metrics["context_switches"] == reference_context_switches(expected), context
+        assert metrics["cpu_utilization"] == pytest.approx(
+            busy_time / total_time * 100 if total_time > 0 else 0), context
+        if not finished:
+            assert metrics["avg_waiting_time"] == metrics["p99_waiting_time"] == 0, context
+            continue
+        assert metrics["avg_turnaround_time"] == pytest.approx(turnarounds.mean()), context
+        assert metrics["avg_waiting_time"] == pytest.approx(waitings.mean()), context
+        assert metrics["avg_response_time"] == pytest.approx(responses.mean()), context
+        assert metrics["max_waiting_time"] == waitings.max(), context
+        assert metrics["p95_waiting_time"] == pytest.approx(np.percentile(waitings, 95)), context
+        assert metrics["max_slowdown"] == pytest.approx(
+            (turnarounds / np.maximum(bursts, 1)).max()), context
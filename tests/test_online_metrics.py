@@ -0,0 +1,99 @@
+"""
+Tests of the streaming quantile sketch and the online metrics accumulator.
+"""
+
+import numpy as np
+import pytest
+
+from src.utils.online_metrics import MetricsAccumulator, QuantileSketch
+
+
+QUANTILES = (0, 0.01, 0.25, 0.5, 0.9, 0.95, 0.99, 1)
+
+
+def assert_within_relative_accuracy(sketch, values):
+    """Check every quantile of a sketch against the exact lower quantile of its values."""
+    for q in QUANTILES:
+        exact = np.quantile(values, q, method="lower")
+        assert abs(sketch.quantile(q) - exact) <= sketch.relative_accuracy * exact, q
+
+
+def test_quantiles_are_within_relative_accuracy():
+    rng = np.random.default_rng(0)
+    values = np.concatenate([np.zeros(500), rng.lognormal(3, 2, 20000).round()])
+    rng.shuffle(values)
+    one_by_one, batched = QuantileSketch(), QuantileSketch()
+    
+    for value in values[:1000].tolist():
+        one_by_one.add(value)
+    batched.add_many(values[:1000])
+    
+    assert one_by_one.buckets == batched.buckets
+    assert_within_relative_accuracy(one_by_one, values[:1000])
+    batched.add_many(values[1000:])
+    assert_within_relative_accuracy(batched, values)
+    assert (batched.count, batched.zero_count) == (len(values), np.count_nonzero(values <= 0))
+
+
+def test_merged_sketches_match_one_sketch():
+    rng = np.random.default_rng(1)
+    shards = [rng.exponential(50, 3000) for _ in range(4)]
+    whole = QuantileSketch()
+    whole.add_many(np.concatenate(shards))
+    merged = QuantileSketch()
+    
+    for shard in shards:
+        sketch = QuantileSketch()
+        sketch.add_many(shard)
+        merged.merge(sketch)
+    
+    assert merged.buckets == whole.buckets
+    assert [merged.quantile(q) for q in QUANTILES] == [whole.quantile(q) for q in QUANTILES]
+    with pytest.raises(ValueError):
+        merged.merge(QuantileSketch(relative_accuracy=0.02))
+
+
+def test_collapsing_keeps_the_tail_accurate():
+    values = np.geomspace(1, 1e12, 5000)
+    sketch = QuantileSketch(max_buckets=512)
+    
+    sketch.add_many(values)
+    
+    assert len(sketch.buckets) <= 512
+    for q in (0.95, 0.99, 1):
+        exact = np.quantile(values, q, method="lower")
+        assert abs(sketch.quantile(q) - exact) <= sketch.relative_accuracy * exact, q
+
+
+def test_empty_sketch_and_accumulator():
+    assert QuantileSketch().quantile(0.5) is None
+    metrics = MetricsAccumulator().metrics()
+    assert metrics["completed"] == 0 and metrics["p99_waiting_time"] == 0
+
+
+def test_merged_accumulators_match_one_accumulator():
+    rng = np.random.default_rng(2)
+    arrival = rng.integers(0, 1000, 4000)
+    burst = rng.integers(1, 50, 4000)
+    start = arrival + rng.integers(0, 200, 4000)
+    finish = start + burst + rng.integers(0, 100, 4000)
+    whole, merged = MetricsAccumulator(), MetricsAccumulator()
+    
+    whole.add_many(arrival, burst, start, finish)
+    for shard in np.array_split(np.arange(4000), 5):
+        accumulator = MetricsAccumulator()
+        for i in shard.tolist():
+            accumulator.add(int(arrival[i]), int(burst[i]), int(start[i]), int(finish[i]))
+        merged.merge(accumulator)
+    
+    metrics = merged.metrics()
+    assert metrics == whole.metrics()
+    waiting = finish - arrival - burst
+    assert metrics["completed"] == 4000
+    assert metrics["total_time"] == finish.max()
+    assert metrics["avg_waiting_time"] == pytest.approx(waiting.mean())
+    assert metrics["avg_response_time"] == pytest.approx((start - arrival).mean())
+    assert metrics["max_waiting_time"] == waiting.max()
+    assert metrics["cpu_utilization"] == pytest.approx(100 * burst.sum() / finish.max())
+    exact = np.quantile(waiting, 0.99, method="lower")
+    assert abs(metrics["p99_waiting_time"] - exact) <= 0.01 * exact
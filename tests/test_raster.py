@@ -0,0 +1,110 @@
+"""
+Tests of the NumPy timeline rasterizer.
+"""
+
+import random
+
+import numpy as np
+import pytest
+from matplotlib import pyplot as plt
+from matplotlib.colors import to_rgb
+
+from src.schedule_trace import ScheduleTrace
+from src.visualization.raster import (BACKGROUND, bucket_pids, rasterize_timeline, rasterize_trace,
+                                      save_raster)
+from test_schedulers import SEED
+
+COLOR_MAP = {1: "#ff0000", 3: "#0000ff", -1: "#808080"}
+
+
+def bucket_totals(schedule, width, total_time):
+    """Total the time each pid ran in each bucket, one slice at a time."""
+    bucket_time = total_time / width
+    totals = [{} for _ in range(width)]
+    start = 0
+    for pid, duration in schedule:
+        for bucket in range(width):
+            overlap = (min(start + duration, (bucket + 1) * bucket_time)
+                       - max(start, bucket * bucket_time))
+            if overlap > 0:
+                totals[bucket][pid] = totals[bucket].get(pid, 0) + overlap
+        start += duration
+    return totals
+
+
+def test_bucket_pids_picks_the_dominant_or_last_process():
+    schedule = [(1, 3), (2, 1), (3, 4)]
+    
+    pids, filled = bucket_pids(schedule, 2)
+    assert pids.tolist() == [1, 3]
+    assert filled.tolist() == [True, True]
+    
+    pids, _ = bucket_pids(schedule, 2, mode="last")
+    assert pids.tolist() == [2, 3]
+    
+    pids, _ = bucket_pids([(-1, 5), (1, 3)], 2)
+    assert pids.tolist() == [-1, 1]
+
+
+def test_bucket_pids_leaves_buckets_past_the_trace_empty():
+    pids, filled = bucket_pids(ScheduleTrace.from_schedule([(1, 3), (3, 5)]), 4, total_time=16)
+    
+    assert pids.tolist() == [1, 3, -1, -1]
+    assert filled.tolist() == [True, True, False, False]
+    
+    pids, filled = bucket_pids([], 3)
+    assert pids.tolist() == [-1, -1, -1]
+    assert not filled.any()
+
+
+def test_bucket_pids_rejects_unknown_modes():
+    with pytest.raises(ValueError, match="Unknown raster mode"):
+        bucket_pids([(1, 1)], 1, mode="first")
+
+
+def test_bucket_pids_matches_slice_by_slice_totals():
+    rng = random.Random(SEED)
+    for _ in range(50):
+        schedule = [(rng.choice([-1, 1, 2, 3]), rng.randint(0, 9)) for _ in range(rng.randint(1, 40))]
+        width = rng.randint(1, 30)
+        total_time = sum(duration for _, duration in schedule)
+        
+        pids, filled = bucket_pids(schedule, width)
+        totals = bucket_totals(schedule, width, total_time)
+        
+        for bucket, (pid, reached) in enumerate(zip(pids.tolist(), filled.tolist())):
+            if not totals[bucket]:
+                assert pid == -1
+                continue
+            assert reached
+            assert totals[bucket][pid] == pytest.approx(max(totals[bucket].values()))
+
+
+def test_rasterize_trace_colors_each_bucket():
+    row = rasterize_trace([(2, 4), (1, 4), (-1, 4)], COLOR_MAP, 4, total_time=16)
+    
+    assert row.shape == (4, 3)
+    assert row.tolist() == [list(BACKGROUND), [1, 0, 0], list(to_rgb(COLOR_MAP[-1])),
+                            list(BACKGROUND)]
+
+
+def test_rasterize_timeline_stacks_lanes_on_one_time_scale():
+    image = rasterize_timeline([[(1, 8)], [(3, 4)]], COLOR_MAP, 4, lane_height=3, gap=2)
+    
+    assert image.shape == (8, 4, 3)
+    assert image.dtype == np.uint8
+    assert (image[:3] == [255, 0, 0]).all()
+    assert (image[3:5] == 255).all()
+    assert (image[5:, :2] == [0, 0, 255]).all()
+    assert (image[5:, 2:] == 255).all()
+    assert rasterize_timeline([], COLOR_MAP, 4).shape == (0, 4, 3)
+
+
+def test_save_raster_writes_the_image(tmp_path):
+    image = rasterize_timeline([[(1, 2), (3, 2)]], COLOR_MAP, 6, lane_height=5)
+    
+    filename = save_raster(image, str(tmp_path / "timeline.png"))
+    
+    saved = plt.imread(filename)
+    assert saved.shape[:2] == (5, 6)
+    assert np.array_equal(np.round(saved[..., :3] * 255).astype(np.uint8), image)
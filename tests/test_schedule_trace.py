@@ -0,0 +1,66 @@
+"""
+Tests of the array-backed ScheduleTrace.
+"""
+
+import numpy as np
+import pytest
+
+from src.process import Process, ProcessTable
+from src.schedule_trace import ScheduleTrace
+from src.simulation import create_scheduler
+
+
+SLICES = [(1, 2), (1, 3), (-1, 1), (-1, 2), (2, 4), (1, 1)]
+MERGED = [(1, 5), (-1, 3), (2, 4), (1, 1)]
+
+
+def test_adjacent_slices_are_merged():
+    trace = ScheduleTrace(SLICES)
+    
+    assert trace.to_list() == MERGED
+    assert list(trace) == MERGED
+    assert trace[2] == (2, 4)
+    assert (trace.total_time, trace.busy_time, trace.idle_time) == (13, 10, 3)
+    assert trace.starts.tolist() == [0, 5, 8, 12]
+    assert trace.nbytes == len(MERGED) * (4 + 8)
+
+
+def test_array_and_tuple_appends_agree():
+    pids, durations = zip(*SLICES)
+    
+    for split in range(len(SLICES) + 1):
+        trace = ScheduleTrace(SLICES[:split])
+        trace.extend_arrays(pids[split:], durations[split:])
+        assert trace.to_list() == MERGED, split
+    
+    repeated = ScheduleTrace([(1, 1)])
+    repeated.extend_repeated([(1, 2), (2, 1)], 3)
+    assert repeated.to_list() == [(1, 3), (2, 1), (1, 2), (2, 1), (1, 2), (2, 1)]
+    assert ScheduleTrace.from_arrays(pids, durations).to_list() == MERGED
+
+
+def test_views_are_read_only_snapshots():
+    trace = ScheduleTrace(SLICES)
+    pids, durations = trace.pids, trace.durations
+    
+    with pytest.raises(ValueError):
+        durations[0] = 0
+    trace.add(1, 4)
+    trace.add(3, 2)
+    
+    assert pids.tolist() == [1, -1, 2, 1]
+    assert durations.tolist() == [5, 3, 4, 1]
+    assert trace.to_list() == MERGED[:-1] + [(1, 5), (3, 2)]
+    assert trace.starts.tolist() == [0, 5, 8, 12, 17]
+
+
+def test_pids_outside_int32_are_rejected():
+    for pid in (ProcessTable.PID_MAX + 1, ProcessTable.PID_MIN - 1):
+        with pytest.raises(ValueError, match="32-bit"):
+            ProcessTable([pid], [0], [1], [1])
+        with pytest.raises(ValueError, match="32-bit"):
+            create_scheduler("fcfs").schedule_trace([Process(pid, 0, 1, 1)])
+    
+    trace = create_scheduler("fcfs").schedule_trace(
+        ProcessTable([ProcessTable.PID_MAX], [0], [1], [1]))
+    assert trace.pids.dtype == np.int32 and trace.to_list() == [(ProcessTable.PID_MAX, 1)]
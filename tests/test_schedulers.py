@@ -0,0 +1,123 @@
+"""
+Tests of the scheduling engines against the reference schedulers.
+"""
+
+import random
+
+import pytest
+
+from reference_schedulers import reference_schedule
+from src.process import Process, ProcessTable
+from src.schedule_trace import ScheduleTrace
+from src.schedulers.fcfs import fcfs_closed_form
+from src.simulation import create_scheduler
+
+
+ENGINES = ("fcfs", "sjf", "priority", "rr", "priority_rr")
+
+# Two tied arrivals at 0, a zero-burst process, an idle gap and two tied arrivals at 8
+SMALL_WORKLOAD = [(1, 0, 3, 2), (2, 0, 2, 1), (3, 1, 0, 3), (4, 8, 2, 1), (5, 8, 1, 2)]
+
+SMALL_SCHEDULES = {
+    "fcfs": [(1, 3), (2, 2), (-1, 3), (4, 2), (5, 1)],
+    "sjf": [(2, 2), (1, 3), (-1, 3), (5, 1), (4, 2)],
+    "priority": [(2, 2), (1, 3), (-1, 3), (4, 2), (5, 1)],
+    "rr": [(1, 2), (2, 2), (3, 0), (1, 1), (-1, 3), (4, 2), (5, 1)],
+    "priority_rr": [(2, 2), (1, 2), (1, 1), (-1, 3), (4, 2), (5, 1)]
+}
+
+SEED = 20240601
+RANDOM_WORKLOADS = 300
+
+
+def random_workloads(seed=SEED, count=RANDOM_WORKLOADS):
+    """Yield small random workloads with unique pids, zero bursts, ties and idle gaps."""
+    rng = random.Random(seed)
+    for _ in range(count):
+        pids = rng.sample(range(1, 100), rng.randint(0, 12))
+        workload = [(pid, rng.randint(0, 30), rng.randint(0, 8), rng.randint(1, 4))
+                    for pid in pids]
+        yield workload, rng.randint(1, 4)
+
+
+def list_results(processes):
+    """Collect the (start, finish, waiting, turnaround) times of Process objects by pid."""
+    return {p.pid: (p.start_time, p.finish_time, p.waiting_time, p.turnaround_time)
+            for p in processes}
+
+
+def as_table(workload):
+    """Build a ProcessTable from (pid, arrival_time, burst_time, priority) tuples."""
+    return ProcessTable(*zip(*workload)) if workload else ProcessTable([], [], [], [])
+
+
+@pytest.mark.parametrize("algorithm", ENGINES)
+def test_small_workload_matches_reference(algorithm):
+    expected, _ = reference_schedule(algorithm, SMALL_WORKLOAD)
+    assert expected == SMALL_SCHEDULES[algorithm]
+    
+    processes = [Process(*row) for row in SMALL_WORKLOAD]
+    assert list(create_scheduler(algorithm).schedule(processes)) == SMALL_SCHEDULES[algorithm]
+
+
+@pytest.mark.parametrize("algorithm", ENGINES)
+def test_process_lists_match_reference(algorithm):
+    for workload, quantum in random_workloads():
+        expected, results = reference_schedule(algorithm, workload, quantum)
+        processes = [Process(*row) for row in workload]
+        
+        schedule = create_scheduler(algorithm, quantum).schedule(processes)
+        
+        assert list(schedule) == expected, (workload, quantum)
+        assert list_results(processes) == results, (workload, quantum)
+
+
+@pytest.mark.parametrize("algorithm", ENGINES)
+def test_process_tables_match_reference(algorithm):
+    for workload, quantum in random_workloads(SEED + 1):
+        expected, results = reference_schedule(algorithm, workload, quantum)
+        table = as_table(workload)
+        
+        schedule = create_scheduler(algorithm, quantum).schedule(table)
+        
+        assert list(schedule) == expected, (workload, quantum)
+        assert list_results(table.to_processes()) == results, (workload, quantum)
+
+
+def test_fcfs_closed_form_matches_reference():
+    unset = ProcessTable.UNSET
+    for workload, _ in random_workloads(SEED + 4):
+        expected, results = reference_schedule("fcfs", workload)
+        table = as_table(workload)
+        
+        slice_pids, slice_times, start_time, finish_time = fcfs_closed_form(
+            table.pid, table.arrival_time, table.burst_time)
+        
+        assert list(zip(slice_pids.tolist(), slice_times.tolist())) == expected, workload
+        times = {pid: (None if start == unset else start, None if finish == unset else finish)
+                 for pid, start, finish in zip(table.pid.tolist(), start_time.tolist(),
+                                               finish_time.tolist())}
+        assert times == {pid: result[:2] for pid, result in results.items()}, workload
+
+
+@pytest.mark.parametrize("algorithm", ENGINES)
+def test_traces_match_reference(algorithm):
+    for workload, quantum in random_workloads(SEED + 2, 100):
+        expected, _ = reference_schedule(algorithm, workload, quantum)
+        
+        trace = create_scheduler(algorithm, quantum).schedule_trace(as_table(workload))
+        
+        assert trace.to_list() == ScheduleTrace(expected).to_list(), (workload, quantum)
+
+
+@pytest.mark.parametrize("algorithm", ENGINES)
+def test_streams_match_reference(algorithm):
+    for workload, quantum in random_workloads(SEED + 3, 100):
+        expected, results = reference_schedule(algorithm, workload, quantum)
+        table = as_table(workload)
+        
+        streamed = create_scheduler(algorithm, quantum).iter_schedule(table, chunk_size=2)
+        
+        assert ScheduleTrace(streamed).to_list() == ScheduleTrace(expected).to_list(), \
+            (workload, quantum)
+        assert list_results(table.to_processes()) == results, (workload, quantum)
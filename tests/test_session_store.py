@@ -0,0 +1,114 @@
+"""
+Tests of the server-side session store of the web interface.
+"""
+
+import importlib
+import sqlite3
+from datetime import timedelta
+
+import pytest
+from flask import Flask
+
+from app.session_store import SessionStore
+from test_jobs import Clock
+from test_schedulers import SMALL_WORKLOAD, as_table
+
+# The app package shadows the module with its SessionStore instance
+session_store_module = importlib.import_module("app.session_store")
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(session_store_module, "time", clock)
+    return clock
+
+
+@pytest.fixture
+def app(tmp_path):
+    app = Flask(__name__)
+    app.config.update(SECRET_KEY="test", SESSION_STORE_PATH=str(tmp_path / "sessions.sqlite3"),
+                      PERMANENT_SESSION_LIFETIME=timedelta(seconds=60))
+    store = SessionStore(app, purge_interval=100)
+    
+    @app.route("/set/<key>")
+    def set_value(key):
+        store.set(key, as_table(SMALL_WORKLOAD))
+        return "ok"
+    
+    @app.route("/get/<key>")
+    def get_value(key):
+        table = store.get(key)
+        return "missing" if table is None else ",".join(map(str, table.pid.tolist()))
+    
+    @app.route("/delete/<key>")
+    def delete_value(key):
+        store.delete(key)
+        return "ok"
+    
+    return app
+
+
+def cookie_session(app, client):
+    """Decode the session kept in the client's cookie."""
+    cookie = client.get_cookie(app.config.get("SESSION_COOKIE_NAME", "session"))
+    return app.session_interface.get_signing_serializer(app).loads(cookie.value)
+
+
+def stored_rows(app):
+    """Count the values kept in the database."""
+    with sqlite3.connect(app.config["SESSION_STORE_PATH"]) as connection:
+        return connection.execute("SELECT COUNT(*) FROM session_data").fetchone()[0]
+
+
+def test_values_round_trip_and_only_the_id_is_in_the_cookie(app, clock):
+    client = app.test_client()
+    
+    assert client.get("/get/processes").text == "missing"
+    client.get("/set/processes")
+    
+    assert client.get("/get/processes").text == "1,2,3,4,5"
+    assert list(cookie_session(app, client)) == ["sid"]
+    assert stored_rows(app) == 1
+    
+    client.get("/delete/processes")
+    assert client.get("/get/processes").text == "missing"
+
+
+def test_sessions_are_kept_apart(app, clock):
+    first, second = app.test_client(), app.test_client()
+    
+    first.get("/set/processes")
+    
+    assert second.get("/get/processes").text == "missing"
+    second.get("/set/processes")
+    assert cookie_session(app, first)["sid"] != cookie_session(app, second)["sid"]
+    assert stored_rows(app) == 2
+
+
+def test_values_expire_after_the_last_write(app, clock):
+    client = app.test_client()
+    client.get("/set/processes")
+    clock.now += 40
+    client.get("/set/results")
+    clock.now += 40
+    
+    # The second write refreshed the expiry of the first value
+    assert client.get("/get/processes").text == "1,2,3,4,5"
+    clock.now += 30
+    assert client.get("/get/processes").text == "missing"
+    assert client.get("/get/results").text == "missing"
+
+
+def test_expired_values_are_purged_at_most_once_per_interval(app, clock):
+    stale, fresh = app.test_client(), app.test_client()
+    stale.get("/set/processes")
+    clock.now += 61
+    
+    fresh.get("/set/processes")
+    assert stale.get("/get/processes").text == "missing"
+    assert stored_rows(app) == 2
+    
+    clock.now += 39
+    fresh.get("/set/processes")
+    assert stored_rows(app) == 1
@@ -0,0 +1,76 @@
+"""
+Tests of the simulation helpers that run the scheduling algorithms on a workload.
+"""
+
+import csv
+
+import numpy as np
+import pytest
+
+from reference_schedulers import reference_schedule
+from src.process import Process, ProcessTable
+from src.simulation import ALGORITHMS, run_all_simulations, run_simulation, stream_simulation
+from test_schedulers import SMALL_WORKLOAD, as_table, list_results
+
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS)
+def test_run_simulation_does_not_modify_workload(algorithm):
+    processes = [Process(*row) for row in SMALL_WORKLOAD]
+    table = as_table(SMALL_WORKLOAD)
+    columns = {name: getattr(table, name).copy() for name in ProcessTable.COLUMNS}
+    
+    run_simulation(algorithm, processes, 2, cache=False)
+    run_simulation(algorithm, table, 2, cache=False)
+    
+    assert all(p.start_time is None and p.remaining_time == p.burst_time for p in processes)
+    for name, column in columns.items():
+        assert getattr(table, name).tolist() == column.tolist(), name
+
+
+def test_run_all_simulations_keeps_runs_apart():
+    table = as_table(SMALL_WORKLOAD)
+    
+    results = run_all_simulations(table, 2, parallel=False, cache=False)
+    
+    for algorithm in ALGORITHMS:
+        _, expected = reference_schedule(algorithm, SMALL_WORKLOAD, 2)
+        assert list_results(results[algorithm]["processes"].to_processes()) == expected
+    assert table.to_processes()[0].start_time is None
+
+
+@pytest.mark.parametrize("name", ["schedule.csv", "schedule.npy"])
+def test_stream_simulation_writes_schedule_and_metrics(tmp_path, name):
+    filename = str(tmp_path / name)
+    schedule, expected, _ = run_simulation("rr", as_table(SMALL_WORKLOAD), 2, cache=False)
+    
+    metrics, run = stream_simulation("rr", as_table(SMALL_WORKLOAD), filename, 2)
+    
+    if name.endswith(".csv"):
+        with open(filename, newline="") as file:
+            rows = [tuple(int(value) for value in row) for row in list(csv.reader(file))[1:]]
+    else:
+        rows = np.load(filename).tolist()
+    assert rows == list(zip(schedule.pids.tolist(), schedule.starts.tolist(),
+                            schedule.durations.tolist()))
+    assert list_results(run.to_processes()) == reference_schedule("rr", SMALL_WORKLOAD, 2)[1]
+    for key in ("completed", "total_time", "avg_turnaround_time", "avg_waiting_time",
+                "avg_response_time", "max_waiting_time", "cpu_utilization"):
+        assert metrics[key] == pytest.approx(expected[key]), key
+
+
+def test_stream_simulation_rejects_unknown_formats(tmp_path, capsys):
+    assert stream_simulation("fcfs", as_table(SMALL_WORKLOAD), str(tmp_path / "schedule.txt")) is None
+    assert "Unsupported file format" in capsys.readouterr().out
+
+
+def test_parallel_runs_match_serial_runs():
+    workload = as_table([(pid, pid % 7, pid % 5, pid % 3 + 1) for pid in range(1, 200)])
+    
+    serial = run_all_simulations(workload, 3, parallel=False, cache=False)
+    parallel = run_all_simulations(workload, 3, parallel=True, cache=False)
+    
+    for algorithm in ALGORITHMS:
+        assert parallel[algorithm]["schedule"].to_list() == serial[algorithm]["schedule"].to_list()
+        assert parallel[algorithm]["metrics"] == serial[algorithm]["metrics"]
+        assert list_results(parallel[algorithm]["processes"].to_processes()) == \
+            list_results(serial[algorithm]["processes"].to_processes())
@@ -0,0 +1,75 @@
+"""
+Tests of the time-quantum sweep engine.
+"""
+
+import pytest
+
+from src.simulation import run_simulation, sweep
+from src.simulation.sweep import clear_sweep_cache, parse_quanta, sweep_quantum
+from test_schedulers import as_table
+
+
+WORKLOAD = as_table([(pid, pid % 9, pid % 6 + 1, pid % 4 + 1) for pid in range(1, 40)])
+
+
+@pytest.fixture(autouse=True)
+def empty_sweep_cache():
+    clear_sweep_cache()
+    yield
+    clear_sweep_cache()
+
+
+@pytest.mark.parametrize("text, quanta", [("1:4", [1, 2, 3, 4]), ("2:10:4", [2, 6, 10]),
+                                          ("8,2, 4,2,", [2, 4, 8]), ("5", [5])])
+def test_parse_quanta(text, quanta):
+    assert parse_quanta(text) == quanta
+
+
+@pytest.mark.parametrize("text, message", [("1:x", "Invalid"), ("1:2:3:4", "Invalid"),
+                                           ("1:5:0", "Invalid"), ("4:1", "Empty"),
+                                           (",", "Empty"), ("0:3", "positive"),
+                                           ("-2,4", "positive")])
+def test_parse_quanta_rejects_bad_ranges(text, message):
+    with pytest.raises(ValueError, match=message):
+        parse_quanta(text)
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+def test_sweep_matches_single_runs(parallel):
+    result = sweep_quantum(WORKLOAD, [4, 1, 2, 4], metric="avg_waiting_time", parallel=parallel)
+    
+    assert list(result) == ["rr", "priority_rr"]
+    for algorithm, curve in result.items():
+        expected = [run_simulation(algorithm, WORKLOAD, quantum, cache=False)[1]
+                    for quantum in (1, 2, 4)]
+        assert curve["quanta"] == [1, 2, 4]
+        assert curve["metrics"] == dict(zip((1, 2, 4), expected))
+        assert curve["values"] == [metrics["avg_waiting_time"] for metrics in expected]
+        assert curve["best_value"] == min(curve["values"])
+        assert curve["values"][curve["quanta"].index(curve["best_quantum"])] == curve["best_value"]
+
+
+def test_sweep_maximizes_fairness():
+    curve = sweep_quantum(WORKLOAD, [1, 3, 5], ["rr"], metric="fairness_index",
+                          parallel=False)["rr"]
+    
+    assert curve["best_value"] == max(curve["values"])
+
+
+def test_repeated_sweeps_only_run_new_points(monkeypatch):
+    runs = []
+    sweep_point = sweep._sweep_point
+    monkeypatch.setattr(sweep, "_sweep_point", lambda workload, algorithm, quantum:
+                        runs.append((algorithm, quantum)) or
+                        sweep_point(workload, algorithm, quantum))
+    
+    first = sweep_quantum(WORKLOAD, [1, 2], ["rr"], parallel=False)
+    second = sweep_quantum(WORKLOAD, [1, 2, 3], ["rr"], parallel=False)
+    
+    assert runs == [("rr", 1), ("rr", 2), ("rr", 3)]
+    assert second["rr"]["metrics"][2] == first["rr"]["metrics"][2]
+
+
+def test_unknown_metric_is_rejected():
+    with pytest.raises(ValueError, match="Unknown sweep metric"):
+        sweep_quantum(WORKLOAD, [1, 2], metric="avg_speed")
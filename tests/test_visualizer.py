@@ -0,0 +1,117 @@
+"""
+Tests of the batched Gantt chart helpers and chart rendering.
+"""
+
+import os
+
+import numpy as np
+import pytest
+from matplotlib.collections import PolyCollection
+
+from src.schedule_trace import ScheduleTrace
+from src.visualization import visualizer
+from test_schedulers import SMALL_SCHEDULES, SMALL_WORKLOAD, as_table
+
+
+@pytest.fixture
+def collections(monkeypatch):
+    """Record the PolyCollections drawn by the visualizer."""
+    drawn = []
+    
+    def record(*args, **kwargs):
+        collection = PolyCollection(*args, **kwargs)
+        drawn.append(collection)
+        return collection
+    
+    monkeypatch.setattr(visualizer, "PolyCollection", record)
+    return drawn
+
+
+def test_pid_rows_looks_up_unsorted_pids():
+    pids = np.array([7, 3, 5])
+    
+    rows = visualizer.pid_rows(pids, np.array([5, -1, 3, 9, 7, 3]))
+    
+    assert rows.tolist() == [2, -1, 1, -1, 0, 1]
+    assert visualizer.pid_rows(np.array([], dtype=np.int64), np.array([1, -1])).tolist() == [-1, -1]
+
+
+def test_slice_rectangles_builds_one_quad_per_slice():
+    corners = visualizer.slice_rectangles(np.array([0, 4]), np.array([4, 6]),
+                                          np.array([0, 1]), np.array([1, 2]))
+    
+    assert corners.shape == (2, 4, 2)
+    assert corners[1].tolist() == [[4, 1], [4, 2], [6, 2], [6, 1]]
+
+
+def test_thin_labels_skips_overlapping_labels():
+    centers = np.array([0.0, 1.0, 3.0, 3.5, 6.0])
+    widths = np.full(5, 2.0)
+    
+    assert visualizer.thin_labels(centers, widths).tolist() == [0, 2, 4]
+    assert visualizer.thin_labels(centers, widths, spacing=2).tolist() == [0, 4]
+    assert visualizer.thin_labels(np.array([]), np.array([])).tolist() == []
+
+
+def test_visualize_schedule_draws_every_slice_in_one_collection(tmp_path, collections):
+    processes = as_table(SMALL_WORKLOAD)
+    schedule = [(-1, 1)] + SMALL_SCHEDULES["fcfs"] + [(42, 2)]
+    
+    output_file = visualizer.visualize_schedule(schedule, processes, "fcfs", str(tmp_path))
+    
+    assert output_file == os.path.join(str(tmp_path), "fcfs_gantt.png")
+    assert os.path.getsize(output_file) > 0
+    assert len(collections) == 1
+    
+    # The unknown pid 42 is left out; idle time spans every row
+    paths = collections[0].get_paths()
+    assert len(paths) == len(schedule) - 1
+    idle = paths[0].vertices
+    assert (idle[:, 1].min(), idle[:, 1].max()) == (0, len(processes))
+    colors = collections[0].get_facecolors()
+    assert colors.shape[0] == len(paths)
+    assert np.allclose(colors[0][:3], [0xd3 / 255] * 3)
+
+
+def test_timeline_comparison_rasterizes_long_schedules(tmp_path, monkeypatch, collections):
+    results = {algo: {"schedule": schedule} for algo, schedule in SMALL_SCHEDULES.items()}
+    # Adjacent slices of the same process are merged into one
+    slices = sum(len(ScheduleTrace.from_schedule(schedule)) for schedule in SMALL_SCHEDULES.values())
+    monkeypatch.setattr(visualizer, "RASTER_SLICE_THRESHOLD", slices - 1)
+    
+    output_file = visualizer.visualize_timeline_comparison(results, str(tmp_path))
+    
+    assert os.path.exists(output_file)
+    assert collections == []
+    
+    visualizer.visualize_timeline_comparison(results, str(tmp_path), raster=False)
+    
+    assert len(collections) == len(SMALL_SCHEDULES)
+    assert sum(len(collection.get_paths()) for collection in collections) == slices
+
+
+def chart_results():
+    processes = as_table(SMALL_WORKLOAD)
+    metrics = {"avg_turnaround_time": 3.0, "avg_waiting_time": 1.0, "cpu_utilization": 75.0}
+    return {algo: {"schedule": schedule, "processes": processes, "metrics": metrics}
+            for algo, schedule in SMALL_SCHEDULES.items()}
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+def test_render_charts_saves_every_chart(tmp_path, parallel):
+    output_dir = str(tmp_path / "charts")
+    
+    charts = visualizer.render_charts(chart_results(), output_dir, parallel=parallel, max_workers=2)
+    
+    expected = ["scheduler_comparison", "timeline_comparison"] + [f"{algo}_gantt" for algo in SMALL_SCHEDULES]
+    assert sorted(charts) == sorted(expected)
+    for name, path in charts.items():
+        assert path == os.path.join(output_dir, f"{name}.png")
+        assert os.path.getsize(path) > 0
+
+
+def test_compare_schedulers_skips_the_gantt_charts(tmp_path):
+    output_file = visualizer.compare_schedulers(chart_results(), str(tmp_path), parallel=False)
+    
+    assert output_file == os.path.join(str(tmp_path), "scheduler_comparison.png")
+    assert sorted(os.listdir(tmp_path)) == ["scheduler_comparison.png", "timeline_comparison.png"]
@@ -0,0 +1,54 @@
+"""
+Tests of the seeded, distribution-aware workload generator.
+"""
+
+import numpy as np
+import pytest
+
+from src.utils.workload_generator import (ARRIVAL_PROCESSES, BURST_DISTRIBUTIONS,
+                                          PRIORITY_DISTRIBUTIONS, WorkloadGenerator,
+                                          synthesize_workload, write_synthetic_workload)
+
+
+def columns(table):
+    """Get the pid, arrival, burst and priority columns of a table as lists."""
+    return [table.pid.tolist(), table.arrival_time.tolist(), table.burst_time.tolist(),
+            table.priority.tolist()]
+
+
+@pytest.mark.parametrize("arrival", ARRIVAL_PROCESSES)
+@pytest.mark.parametrize("burst", BURST_DISTRIBUTIONS)
+@pytest.mark.parametrize("priority", PRIORITY_DISTRIBUTIONS)
+def test_workloads_are_valid_and_seeded(arrival, burst, priority):
+    options = {"arrival": arrival, "burst": burst, "priority": priority, "mean_burst": 6.0}
+    
+    table = synthesize_workload(20000, 3, **options)
+    
+    assert table.pid.tolist() == list(range(1, 20001))
+    assert (np.diff(table.arrival_time) >= 0).all() and table.arrival_time[0] >= 0
+    assert table.burst_time.min() >= 1
+    assert 1 <= table.priority.min() and table.priority.max() <= 10
+    assert columns(synthesize_workload(20000, 3, **options)) == columns(table)
+    assert columns(synthesize_workload(20000, 4, **options)) != columns(table)
+    if burst != "pareto":
+        assert table.burst_time.mean() == pytest.approx(6.5, rel=0.1)
+    assert len(table) / (table.arrival_time[-1] + 1) == pytest.approx(1.0, rel=0.15)
+
+
+def test_chunked_generation_continues_the_workload(tmp_path):
+    filename = str(tmp_path / "workload.npy")
+    whole = synthesize_workload(1000, 5, burst="lognormal")
+    generator = WorkloadGenerator(5, burst="lognormal")
+    
+    parts = [generator.generate(300), generator.generate(700)]
+    write_synthetic_workload(filename, 1000, 5, chunk_size=256, burst="lognormal")
+    
+    assert [a + b for a, b in zip(*map(columns, parts))] == columns(whole)
+    assert np.load(filename).tolist() == columns(whole)
+
+
+def test_invalid_options_are_rejected():
+    with pytest.raises(ValueError):
+        WorkloadGenerator(arrival="uniform")
+    with pytest.raises(ValueError):
+        WorkloadGenerator(burst="pareto", pareto_shape=1)